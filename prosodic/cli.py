@@ -14,7 +14,8 @@ def cli():
 @click.option('--host', default='127.0.0.1', help='set host (127.0.0.1)')
 @click.option('--port', default=8181, help='set port (8181)')
 @click.option('--debug', is_flag=True, help='debug')
-def web(host='127.0.0.1', port=8181, debug=False):
+@click.option('--num-proc', default=None, type=int, help='parse in a pool of this many warm worker processes')
+def web(host='127.0.0.1', port=8181, debug=False, num_proc=None):
     """
     Start the prosodic web server.
 
@@ -22,6 +23,8 @@ def web(host='127.0.0.1', port=8181, debug=False):
         host (str): The host address to bind the server to. Defaults to '127.0.0.1'.
         port (int): The port number to run the server on. Defaults to 8181.
         debug (bool): Enable debug mode if True. Defaults to False.
+        num_proc (int, optional): Number of worker processes to parse in,
+            started with the server. Defaults to parsing in the server process.
 
     Returns:
         None
@@ -30,7 +33,7 @@ def web(host='127.0.0.1', port=8181, debug=False):
     msg = f'Starting prosodic as a webserver at http://{host}:{port}...'
     click.echo(msg)
     logmap.enable()
-    main(host=host, port=port, debug=debug)
+    main(host=host, port=port, debug=debug, num_proc=num_proc)
 
 
 @cli.command()
@@ -47,4 +50,82 @@ def ipython():
     click.echo('Starting prosodic in ipython')
     imps = 'from prosodic import *\nimport prosodic'
     cmd = f'ipython -i -c "{imps}"'
-    os.system(cmd)
\ No newline at end of file
+    os.system(cmd)
+
+@cli.group(name='cache')
+def cache_group():
+    """
+    Inspect and prune the parse cache, and migrate the result cache.
+    """
+    pass
+
+
+@cache_group.command()
+def info():
+    """
+    Show the size and location of the parse cache.
+
+    Returns:
+        None
+    """
+    for key, value in get_parse_cache().info().items():
+        if key in {'hits', 'misses'}:
+            continue
+        if key.endswith('bytes') and value is not None:
+            value = f'{value / 1024**2:,.1f} MB'
+        click.echo(f'{key}: {value}')
+
+
+@cache_group.command()
+@click.option('--max-size', type=float, default=None, help='size to prune to, in MB (the cache maximum)')
+def prune(max_size=None):
+    """
+    Drop the least recently used entries of the parse cache beyond a size.
+
+    Args:
+        max_size (float): The size in MB. Defaults to the cache's maximum size.
+
+    Returns:
+        None
+    """
+    parse_cache = get_parse_cache()
+    max_bytes = int(max_size * 1024**2) if max_size is not None else None
+    num = parse_cache.prune(max_bytes)
+    click.echo(f'Dropped {num:,} entries; {len(parse_cache):,} remain')
+
+
+@cache_group.command()
+@click.confirmation_option(prompt='Drop every entry of the parse cache?')
+def clear():
+    """
+    Drop every entry of the parse cache.
+
+    Returns:
+        None
+    """
+    get_parse_cache().clear()
+    click.echo('Cleared the parse cache')
+
+
+@cache_group.command()
+@click.option('--engine', default='sqlitestore', help='engine to migrate the cache into')
+@click.option('--source', default='pairtree', help='engine of the cache to migrate')
+def migrate(engine='sqlitestore', source='pairtree'):
+    """
+    Copy the cache of results (e.g. a pairtree cache) into another engine.
+
+    Afterwards set PROSODIC_CACHE_ENGINE to the new engine to use it.
+
+    Args:
+        engine (str): The engine to copy into, e.g. "sqlitestore" for one file.
+        source (str): The engine of the cache to copy.
+
+    Returns:
+        None
+    """
+    report = migrate_stash(engine, source)
+    click.echo(
+        f'Migrated {report["migrated"]:,} of {report["total"]:,} entries '
+        f'({report["failed"]:,} failed) in {report["stashes"]:,} stashes '
+        f'from {source} to {engine}'
+    )
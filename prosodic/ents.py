@@ -1,7 +1,203 @@
 from typing import Any, List, Type
+from collections import OrderedDict
+import weakref
 from .imports import *
 
-OBJECTS = {}
+
+class ObjectRegistry:
+    """
+    A registry of entities by key, used by Entity.find and Entity.from_dict.
+
+    Entities are stored under their paths (see Entity.path), and can be
+    looked up by path or by key string.
+
+    Entities can be held by weak reference, so that they are dropped from the
+    registry once nothing else uses them, and/or up to a maximum number of
+    entities, dropping the least recently used beyond it.
+
+    Args:
+        maxsize (int, optional): Maximum number of entities held. Defaults to
+            REGISTRY_MAXSIZE (no maximum).
+        weak (bool): Whether to hold entities by weak reference. Defaults to
+            REGISTRY_WEAK.
+    """
+
+    def __init__(
+        self, maxsize: Optional[int] = REGISTRY_MAXSIZE, weak: bool = REGISTRY_WEAK
+    ) -> None:
+        self.id = next(REGISTRY_IDS)
+        self.maxsize = maxsize
+        self.weak = weak
+        self._data = OrderedDict()
+        self._dead = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"ObjectRegistry(size={len(self)}, maxsize={self.maxsize}, weak={self.weak})"
+
+    def _ref(self, key: str, obj: "Entity") -> Any:
+        if not self.weak:
+            return obj
+        dead = self._dead
+
+        def remove(ref, key=key):
+            # collected objects are removed on the next call, not mid-operation
+            dead.append((key, ref))
+
+        return weakref.ref(obj, remove)
+
+    def _deref(self, value: Any) -> Optional["Entity"]:
+        return value() if self.weak else value
+
+    def _purge(self) -> None:
+        while self._dead:
+            key, ref = self._dead.pop()
+            if self._data.get(key) is ref:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        self._purge()
+        return len(self._data)
+
+    def __contains__(self, key: Union[str, tuple]) -> bool:
+        self._purge()
+        value = self._data.get(get_path(key))
+        return value is not None and self._deref(value) is not None
+
+    def __getitem__(self, key: Union[str, tuple]) -> "Entity":
+        obj = self.get(key)
+        if obj is None:
+            raise KeyError(key)
+        return obj
+
+    def __setitem__(self, key: Union[str, tuple], obj: "Entity") -> None:
+        self._purge()
+        key = get_path(key)
+        self._data[key] = self._ref(key, obj)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def is_registered(self, obj: "Entity") -> bool:
+        """Whether an entity has been registered here (it may since have been dropped)."""
+        return obj.__dict__.get("_registry_id") == self.id
+
+    def register(self, ent: "Entity") -> None:
+        """
+        Register an entity and the entities below it.
+
+        Entities are marked as registered, and are skipped, with the entities
+        below them, when the tree is registered again: registering a tree only
+        visits its new entities.
+
+        Args:
+            ent (Entity): The entity.
+        """
+        for obj in ent.iter_all(prune=self.is_registered):
+            self[obj.path] = obj
+            obj._registry_id = self.id
+
+    def get(self, key: Union[str, tuple], default: Any = None) -> Any:
+        """
+        Get an entity by key, counting the lookup as a hit or miss.
+
+        Args:
+            key (str or tuple): The entity's key, or its path.
+            default: What to return if it is not registered.
+
+        Returns:
+            Entity: The entity, or the default.
+        """
+        self._purge()
+        key = get_path(key)
+        value = self._data.get(key)
+        obj = self._deref(value) if value is not None else None
+        if obj is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.maxsize is not None:
+            self._data.move_to_end(key)
+        return obj
+
+    def clear(self) -> None:
+        """Remove all entities, and reset the statistics."""
+        # entities marked as registered before are registered again
+        self.id = next(REGISTRY_IDS)
+        self._data.clear()
+        self._dead.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistics for tuning the registry.
+
+        Returns:
+            dict: Numbers of hits, misses and evictions, the current size,
+                and the maximum size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self),
+            "maxsize": self.maxsize,
+        }
+
+
+def get_path(key: Union[str, tuple]) -> tuple:
+    """The path of an entity from its key (see Entity.path)."""
+    return tuple(key.split(".")) if isinstance(key, str) else key
+
+
+REGISTRY_IDS = itertools.count()
+OBJECTS = ObjectRegistry()
+ACTIVE_REGISTRY = None
+
+
+def get_registry() -> ObjectRegistry:
+    """The registry made active with `prosodic.registry()`, else the global one."""
+    return ACTIVE_REGISTRY if ACTIVE_REGISTRY is not None else OBJECTS
+
+
+@contextmanager
+def registry(
+    maxsize: Optional[int] = REGISTRY_MAXSIZE,
+    weak: bool = REGISTRY_WEAK,
+    obj_registry: Optional[ObjectRegistry] = None,
+) -> Iterator[ObjectRegistry]:
+    """
+    Register entities in a registry of their own within a `with` block.
+
+    Entities built or parsed in the block (one request to a service, say)
+    are registered in, and looked up from, a separate registry, which is
+    let go at the end of it:
+
+        with prosodic.registry(maxsize=100_000) as reg:
+            TextModel(txt).parse()
+        print(reg.stats())
+
+    Args:
+        maxsize (int, optional): Maximum number of entities held.
+        weak (bool): Whether to hold entities by weak reference.
+        obj_registry (ObjectRegistry, optional): An existing registry to use
+            instead of a new one.
+
+    Yields:
+        ObjectRegistry: The registry.
+    """
+    global ACTIVE_REGISTRY
+    if obj_registry is None:
+        obj_registry = ObjectRegistry(maxsize=maxsize, weak=weak)
+    prev_registry, ACTIVE_REGISTRY = ACTIVE_REGISTRY, obj_registry
+    try:
+        yield obj_registry
+    finally:
+        ACTIVE_REGISTRY = prev_registry
 
 
 class Entity(UserList):
@@ -44,7 +240,6 @@ class Entity(UserList):
             parent (Entity): The parent entity.
             **kwargs: Additional attributes to set on the entity.
         """
-        global OBJECTS
         self._attrs = kwargs
         self._num = num
         self._mtr = None
@@ -87,13 +282,7 @@ class Entity(UserList):
 
     def copy(self):
         new = self.__class__.__new__(self.__class__)
-        new.__dict__.update(
-            {
-                k: v
-                for k, v in self.__dict__.items()
-                if not isinstance(getattr(self.__class__, k, None), cached_property)
-            }
-        )
+        new.__dict__.update(self._get_copy_state())
         if self.children is not None:
             if isinstance(self.children, EntityList):
                 new.children = self.children.copy()
@@ -107,25 +296,36 @@ class Entity(UserList):
                     new.append(new_ent)
         return new
 
+    def _get_copy_state(self):
+        # a copy is not registered, and computes its cached properties anew
+        cached_names = get_cached_property_names(self.__class__)
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in cached_names and k != "_registry_id"
+        }
+
     def register_objects(self):
-        global OBJECTS
-        for obj in self.iter_all():
-            key = obj.key
-            if key in OBJECTS:
-                break
-            OBJECTS[key] = obj
+        get_registry().register(self)
 
     def find(self, ent):
         # log.info(f'Finding {ent.key}')
-        if ent.key in OBJECTS:
-            # log.info(f'Found {ent.key} in OBJECTS')
-            return OBJECTS[ent.key]
+        obj_registry = get_registry()
+        obj = obj_registry.get(ent.path)
+        if obj is not None:
+            return obj
         if ent.class_depth < 2:
             # log.info(f'Finding {ent.key} in text by attr')
-            attr_name = ent.key.split(".")[-1].lower()
+            attr_name = ent.path[-1].lower()
             attr_name = ''.join(x for x in attr_name if x.isalnum())
             return getattr(self.text, attr_name)
         
+        # not registered, or dropped from a bounded registry
+        for obj in self.iter_all():
+            if obj.path == ent.path:
+                obj_registry[ent.path] = obj
+                return obj
+
         log.error(f'Could not find {ent.key}')
         return None
 
@@ -324,8 +524,13 @@ class Entity(UserList):
         if isinstance(self, list_class):
             return self
 
-        # Check if this entity contains the requested list type
-        if self.children and isinstance(self.children, list_class):
+        # Check if this entity contains the requested list type (only if the
+        # type is not above it, so as not to make children that aren't needed)
+        if (
+            (self.class_depth is None or cls_depth >= self.class_depth)
+            and self.children
+            and isinstance(self.children, list_class)
+        ):
             return self.children
 
         if cls_depth == 1:  # on text level
@@ -404,15 +609,28 @@ class Entity(UserList):
     def class_depth(self):
         return self._class_depth()
 
-    def _iter_all(self):
+    def _iter_all(self, prune=None):
+        if prune is not None and prune(self):
+            return
         yield self
         if self.children is not None:
-            yield self.children
+            if prune is None or not isinstance(self.children, Entity) or not prune(self.children):
+                yield self.children
             for child in self.children:
-                yield from child._iter_all()
+                yield from child._iter_all(prune)
     
-    def iter_all(self):
-        for obj in self._iter_all():
+    def iter_all(self, prune=None):
+        """
+        Iterate over this entity and all entities below it.
+
+        Args:
+            prune (callable, optional): A function of an entity which, if true,
+                skips that entity and the entities below it.
+
+        Yields:
+            Entity: The entities, depth first.
+        """
+        for obj in self._iter_all(prune):
             if isinstance(obj,Entity):
                 yield obj
 
@@ -424,6 +642,10 @@ class Entity(UserList):
     @cached_property
     def descendant_keys(self):
         return {obj.key for obj in self.iter_all()}
+
+    @cached_property
+    def descendant_paths(self):
+        return {obj.path for obj in self.iter_all()}
     
 
     def get_descendants(self, ent_type: str):
@@ -483,14 +705,15 @@ class Entity(UserList):
         if self.class_depth > 1 and self.class_depth >= entity.class_depth:
             return False
 
-        if entity.key.startswith(self.key):
+        path = self.path
+        if entity.path[: len(path)] == path:
             return True
 
         if self.children:
             if isinstance(entity, EntityList):
-                return bool(self.descendant_keys & entity.descendant_keys)
+                return bool(self.descendant_paths & entity.descendant_paths)
             else:
-                return entity.key in self.descendant_keys
+                return entity.path in self.descendant_paths
         return False
 
     def get_random(self, ent_type: str) -> "Entity":
@@ -677,18 +900,36 @@ class Entity(UserList):
         except AttributeError:
             return None
 
+    @property
+    def key_parts(self):
+        """The parts this entity adds to its parent's path."""
+        part = self.nice_type_name
+        if self.num is not None:
+            part += f"({self.num})"
+        elif isinstance(self, EntityList) and self.parent.is_text and self.children:
+            part += f"({self.children[0].num},{self.children[-1].num})"
+        return (part,)
+
+    @cached_property
+    def path(self):
+        """
+        The address of the entity: its key split into parts, as a tuple.
+
+        Paths are built from the parent's path and shared, interned parts,
+        without building key strings. An entity contains another if its path
+        is a prefix of the other's.
+        """
+        if self._key is not None or self.parent is None:
+            return tuple(sys.intern(part) for part in self.key.split("."))
+        return self.parent.path + tuple(sys.intern(part) for part in self.key_parts)
+
     @property
     def key(self):
         if self._key is not None:
             return self._key
         if self.parent is None:
             raise Exception
-        key = f"{self.parent.key}.{self.nice_type_name}"
-        if self.num is not None:
-            key += f"({self.num})"
-        elif isinstance(self, EntityList) and self.parent.is_text and self.children:
-            key += f"({self.children[0].num},{self.children[-1].num})"
-        self._key = key
+        self._key = key = sys.intern(".".join(self.path))
         return key
 
     @cached_property
@@ -783,9 +1024,10 @@ class Entity(UserList):
 
         key = cls_data.get("key")
         use_registry = cls_data.pop("_use_registry", use_registry)
-        if use_registry and key is not None and key in OBJECTS:
-            # log.debug(f'{cls_name}.from_dict({key}) returning from registry: {OBJECTS[key]}')
-            return OBJECTS[key]
+        if use_registry and key is not None:
+            obj = get_registry().get(key)
+            if obj is not None:
+                return obj
 
         cls2 = GLOBALS.get(cls_name)
         if cls is not cls2:
@@ -1250,3 +1492,11 @@ def get_class(class_name):
     from .imports import get_class
 
     return get_class(class_name)
+
+
+@cache(maxsize=None)
+def get_cached_property_names(cls: type) -> frozenset:
+    """The names of a class's cached properties, which Entity.copy leaves out."""
+    return frozenset(
+        name for name in dir(cls) if isinstance(getattr(cls, name, None), cached_property)
+    )
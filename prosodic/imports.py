@@ -4,6 +4,7 @@ sys.path.insert(0,'/Users/rj416/github/hashstash')
 from logmap import logmap
 # logmap.enable()
 import itertools
+import heapq
 from base64 import b64decode, b64encode
 from functools import wraps
 from pprint import pprint, pformat
@@ -55,9 +56,15 @@ PATH_DICTS = os.path.join(PATH_REPO_DATA, "dicts")
 PATH_HOME = os.path.expanduser("~/prosodic_data")
 PATH_HOME_DATA = os.path.join(PATH_HOME, "data")
 PATH_HOME_DATA_CACHE = os.path.join(PATH_HOME_DATA, "cache")
+PATH_HOME_DATA_SCANSIONS = os.path.join(PATH_HOME_DATA, "scansions")
+PATH_PARSE_CACHE = os.path.join(PATH_HOME_DATA, "parses.sqlite")
+PATH_PHONEME_TABLES = os.path.join(PATH_HOME_DATA, "phonemes")
 os.makedirs(PATH_HOME_DATA, exist_ok=True)
 
-stash = HashStash(PATH_HOME_DATA_CACHE, engine='pairtree', serializer='hashstash', compress=False, b64=True)
+# "pairtree" (a file per entry), "sqlitestore" (one file; see utils.SqliteHashStash), or another HashStash engine
+CACHE_ENGINE = os.environ.get("PROSODIC_CACHE_ENGINE", "pairtree")
+CACHE_DB_BATCH_SIZE = 256
+CACHE_DB_MMAP_SIZE = 1024**3
 stash_was = None
 
 import panphon
@@ -71,6 +78,8 @@ DEFAULT_NUM_PROC = None
 SYLL_SEP = "."
 
 DEFAULT_USE_REGISTRY = True
+REGISTRY_MAXSIZE = None
+REGISTRY_WEAK = True
 DEFAULT_COMBINE_BY = "line"
 
 PATH_MTREE = os.path.join(PATH_REPO, "metricaltree")
@@ -85,6 +94,9 @@ SEP_PARA = "\n\n"
 SEP_LINE = "\n"
 DEFAULT_PARSE_MAXSEC = 30
 DEFAULT_LINE_LIM = None
+STREAM_CHUNK_LINES = 1000
+WORDS_CACHE_SIZE = 2**16
+WORDFORMS_CACHE_SIZE = 2**16
 DEFAULT_PROCESSORS = {"tokenize": "combined"}
 MAX_SYLL_IN_PARSE_UNIT = 14
 MIN_SYLL_IN_PARSE_UNIT = None
@@ -97,6 +109,15 @@ DEFAULT_METER = "default_english"
 METER_MAX_S = 2
 METER_MAX_W = 2
 METER_RESOLVE_OPTIONALITY = True
+METER_ALGORITHM = "fast"
+METER_TEMPLATE_CHUNK_SIZE = 5000
+POOL_BATCH_SIZE = 16
+METER_MEMOIZE = True
+PARSE_CACHE_MAX_BYTES = 2 * 1024**3
+PARSE_CACHE_PRUNE_TO = 0.9
+PARSE_CACHE_BATCH_SIZE = 256
+PARSE_CACHE_VERSION = 2
+PHONEME_TABLE_VERSION = 1
 DEFAULT_CATEGORICAL_CONSTRAINTS = []
 ESPEAK_PATHS = [
     "/opt/homebrew/Cellar/espeak/",
@@ -283,6 +304,7 @@ DEFAULT_CONSTRAINTS = [
 
 
 from .utils import *
+stash = get_stash()
 from .ents import *
 from .words import *
 from .texts import *
@@ -1,4 +1,5 @@
 from ..imports import *
+from collections import OrderedDict
 
 
 class LanguageModel:
@@ -147,16 +148,79 @@ class LanguageModel:
         return [self.get_sylls_ipa_l_tts(token)]
 
     def get_sylls_ipa_str_tts(self, token, force=False):
+        if token not in self.tts_ipa_cache:
+            self.cache_tts_ipa([token], self.phonemize([token]))
+        self.tts_ipa_cache.move_to_end(token)
+        return self.tts_ipa_cache[token]
+
+    def phonemize(self, tokens):
         from phonemizer.separator import Separator
         log.trace("phonemizing")
         sep = Separator(phone=" ", word="|", syllable=".")
-        res = self.phonemizer.phonemize(
-            [token],
+        return self.phonemizer.phonemize(
+            list(tokens),
             separator=sep,
             strip=True,
         )
-        obj = res[0]
-        return obj
+
+    @cached_property
+    def tts_ipa_cache(self):
+        # espeak's output by token, kept for as many tokens as get_word keeps
+        return OrderedDict()
+
+    def cache_tts_ipa(self, tokens, ipas):
+        for token, ipa in zip(tokens, ipas):
+            self.tts_ipa_cache[token] = ipa
+            self.tts_ipa_cache.move_to_end(token)
+        while len(self.tts_ipa_cache) > WORDS_CACHE_SIZE:
+            self.tts_ipa_cache.popitem(last=False)
+
+    def prefetch(self, tokens, force_unstress=None, force_ambig_stress=None):
+        """
+        Look up the pronunciations of many tokens at once, e.g. of a corpus.
+
+        Tokens are deduplicated first. Those found in neither the
+        pronunciation dictionary nor the language's rules are sent to espeak
+        in one call, rather than one call per token as WordTypes are built,
+        unless espeak's output for them is still cached from before. Both
+        that cache and get_word's keep WORDS_CACHE_SIZE words.
+
+        Args:
+            tokens (Iterable[str]): The tokens.
+            force_unstress (bool, optional): As in get_word.
+            force_ambig_stress (bool, optional): As in get_word.
+
+        Returns:
+            dict: The result of get_word for each distinct word.
+        """
+        from ..words.wordtype import get_wordform_token, token_is_punc
+
+        tokens = [
+            token
+            for token in unique(get_wordform_token(token) for token in tokens)
+            if not token_is_punc(token)
+        ]
+        misses = [
+            tokenl
+            for tokenl in unique(token.lower() for token in tokens)
+            if not self.get_sylls_ipa_ll_dict(tokenl)
+        ]
+        misses = [
+            token
+            for token in misses
+            if token not in self.tts_ipa_cache and not self.get_sylls_ll_rule(token)[0]
+        ]
+        if misses:
+            self.cache_tts_ipa(misses, self.phonemize(misses))
+        return {
+            token: get_word(
+                token,
+                lang=self.lang,
+                force_unstress=force_unstress,
+                force_ambig_stress=force_ambig_stress,
+            )
+            for token in tokens
+        }
 
     @cache
     @profile
@@ -493,6 +557,6 @@ def Language(lang: str = DEFAULT_LANG):
     return lang_obj
 
 
-@cache
+@cache(maxsize=WORDS_CACHE_SIZE)
 def get_word(tokenx, lang=DEFAULT_LANG, force_unstress=None, force_ambig_stress=None):
     return Language(lang).get(tokenx, force_unstress=force_unstress, force_ambig_stress=force_ambig_stress)
\ No newline at end of file
@@ -1,5 +1,8 @@
 from .. import *
 from .constraints import *
+from .pool import *
+from .cache import *
 from .meter import *
 from .parses import *
 from .parselists import *
+from .engine import *
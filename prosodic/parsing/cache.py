@@ -0,0 +1,246 @@
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import pickle
+import sqlite3
+import atexit
+from ..imports import *
+from .engine import ParseTask, SyllableArrays
+
+
+class ParseCache:
+    """
+    A persistent cache of parse results, in one SQLite file.
+
+    Each parse unit's result is stored as the compact output of the array
+    search (its ParseRecords; see Meter.search_records), not as pickled
+    Parse entities, under a key made from the unit's normalized text, its
+    language, its wordform choices and syllable features, and the meter's
+    key. Parses are rebuilt from the records on the wordtokens being parsed.
+
+    The cache is used while caching is enabled (see `enable_caching`), for
+    meters which can parse from ParseTasks. When it grows beyond `max_bytes`
+    the least recently used entries are dropped. `prosodic cache info` and
+    `prosodic cache prune` inspect and prune it from the command line.
+
+    Args:
+        path (str): Path of the database file.
+        max_bytes (int, optional): Size above which entries are evicted.
+            Defaults to PARSE_CACHE_MAX_BYTES; None for no limit.
+    """
+
+    def __init__(
+        self, path: str = PATH_PARSE_CACHE, max_bytes: Optional[int] = PARSE_CACHE_MAX_BYTES
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._db = None
+        self._num_bytes = None
+        self._num_pending = 0
+
+    def __repr__(self) -> str:
+        return f"ParseCache({self.path!r})"
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            ensure_dir(self.path)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS parses (
+                    key TEXT PRIMARY KEY,
+                    txt TEXT,
+                    meter_key TEXT,
+                    num_bytes INTEGER,
+                    atime REAL,
+                    value BLOB
+                )"""
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS parses_atime ON parses (atime)")
+        return self._db
+
+    @staticmethod
+    def get_key(task: ParseTask, lang: Optional[str] = None) -> str:
+        """
+        Get the cache key of a parse unit from its ParseTask.
+
+        Args:
+            task (ParseTask): The parse unit's task.
+            lang (str, optional): The language of the text.
+
+        Returns:
+            str: The key.
+        """
+        txt = " ".join(task.txt.lower().split())
+        hasher = hashlib.md5(
+            repr((PARSE_CACHE_VERSION, task.meter_key, lang, txt)).encode()
+        )
+        for sylls, wordform_idx, init_types, group_id in zip(
+            task.sylls, task.wordform_idxs, task.init_types, task.group_ids
+        ):
+            hasher.update(
+                repr((sylls.num_sylls, wordform_idx, init_types, group_id)).encode()
+            )
+            for name in SyllableArrays.feat_names + ("word_ids", "is_functionword"):
+                hasher.update(getattr(sylls, name).tobytes())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[tuple]:
+        """
+        Get the search result stored under a key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            tuple: The records, the indices of those to build parses for, and
+                whether the search completed; None if not cached.
+        """
+        row = self.db.execute("SELECT value FROM parses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute("UPDATE parses SET atime = ? WHERE key = ?", (time.time(), key))
+        self._add_pending()
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, result: tuple, txt: str = "", meter_key: str = "") -> None:
+        """
+        Store a search result.
+
+        Writes are committed in batches (see flush).
+
+        Args:
+            key (str): The key.
+            result (tuple): The output of Meter.search_records.
+            txt (str): Text of the parse unit.
+            meter_key (str): Key of the meter.
+        """
+        value = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        if self._num_bytes is not None:
+            row = self.db.execute(
+                "SELECT num_bytes FROM parses WHERE key = ?", (key,)
+            ).fetchone()
+            self._num_bytes += len(value) - (row[0] if row is not None else 0)
+        self.db.execute(
+            "INSERT OR REPLACE INTO parses VALUES (?, ?, ?, ?, ?, ?)",
+            (key, " ".join(txt.split()), meter_key, len(value), time.time(), value),
+        )
+        self._add_pending()
+
+    def _add_pending(self) -> None:
+        self._num_pending += 1
+        if self._num_pending >= PARSE_CACHE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending writes, and evict entries if the cache is too large."""
+        if self._db is None:
+            return
+        self._db.commit()
+        self._num_pending = 0
+        if self.max_bytes is not None and self.num_bytes > self.max_bytes:
+            self.prune(self.max_bytes)
+
+    @property
+    def num_bytes(self) -> int:
+        """Total size of the stored results."""
+        if self._num_bytes is None:
+            row = self.db.execute("SELECT SUM(num_bytes) FROM parses").fetchone()
+            self._num_bytes = row[0] or 0
+        return self._num_bytes
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM parses").fetchone()[0]
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Drop the least recently used entries until the cache fits a size.
+
+        Entries are dropped down to PARSE_CACHE_PRUNE_TO of the size, so that
+        the next writes do not prune again at once.
+
+        Args:
+            max_bytes (int, optional): The size. Defaults to `max_bytes`.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        if max_bytes is None or self.num_bytes <= max_bytes:
+            return 0
+        target = int(max_bytes * PARSE_CACHE_PRUNE_TO)
+        num_bytes, keys = self.num_bytes, []
+        for key, size in self.db.execute(
+            "SELECT key, num_bytes FROM parses ORDER BY atime"
+        ):
+            if num_bytes <= target:
+                break
+            keys.append((key,))
+            num_bytes -= size
+        self.db.executemany("DELETE FROM parses WHERE key = ?", keys)
+        self.db.commit()
+        self._num_bytes = num_bytes
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.db.execute("DELETE FROM parses")
+        self.db.commit()
+        self.db.execute("VACUUM")
+        self._num_bytes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Describe the cache.
+
+        Returns:
+            dict: Its path, number of entries, size in bytes (of the stored
+                results, and of the file), maximum size, and the hits and
+                misses of this session.
+        """
+        self.flush()
+        return {
+            "path": self.path,
+            "entries": len(self),
+            "num_bytes": self.num_bytes,
+            "file_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+PARSE_CACHES = {}
+
+
+def get_parse_cache(path: str = PATH_PARSE_CACHE) -> ParseCache:
+    """
+    Get the shared parse cache stored at a path.
+
+    Args:
+        path (str): Path of the database file.
+
+    Returns:
+        ParseCache: The cache.
+    """
+    if path not in PARSE_CACHES:
+        PARSE_CACHES[path] = ParseCache(path)
+    return PARSE_CACHES[path]
+
+
+@atexit.register
+def close_parse_caches() -> None:
+    for parse_cache in PARSE_CACHES.values():
+        parse_cache.close()
@@ -1,12 +1,57 @@
 from ..imports import *
 from .constraints import *
+import importlib
 
 
+def get_constraint(name):
+    """
+    Get a constraint by its name.
+
+    The name is either a constraint's full name ("<module>.<qualname>") or
+    its function name. A function name is prosodic's own constraint of that
+    name if there is one, otherwise the only constraint defined with it. A
+    full name of a constraint not yet registered imports its module, as in
+    a worker process rebuilding a meter (see Meter.task_attrs).
+
+    Args:
+        name (str): The name of the constraint.
+
+    Returns:
+        function: The constraint.
+
+    Raises:
+        ValueError: If no constraint, or more than one, has this name.
+    """
+    module_name = name.rpartition(".")[0]
+    if name not in CONSTRAINTS and module_name and module_name not in sys.modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    if name in CONSTRAINTS:
+        return CONSTRAINTS[name]
+    funcs = [func for func in CONSTRAINTS.values() if func.__name__ == name]
+    package_funcs = [func for func in funcs if is_package_constraint(func)]
+    if package_funcs:
+        funcs = package_funcs
+    if not funcs:
+        raise ValueError(f"unknown constraint {name!r}")
+    if len(funcs) > 1:
+        paths = ", ".join(func.path for func in funcs)
+        raise ValueError(f"ambiguous constraint {name!r}, give one of: {paths}")
+    return funcs[0]
+
+def get_constraint_name(func):
+    """The shortest name get_constraint finds a constraint by."""
+    try:
+        if get_constraint(func.__name__) is func:
+            return func.__name__
+    except ValueError:
+        pass
+    return func.path
+
 def get_all_constraints():
-    return {
-        name: obj for name, obj in globals().items()
-        if callable(obj) and hasattr(obj, 'scope')
-    }
+    return {get_constraint_name(func): func for func in CONSTRAINTS.values()}
 
 def get_default_constraint_names():
     return DEFAULT_CONSTRAINT_NAMES
@@ -25,32 +70,39 @@ def get_constraint_scope(constraint):
     if callable(constraint):
         return getattr(constraint, 'scope', 'unknown')
     elif isinstance(constraint, str):
-        all_constraints = get_all_constraints()
-        if constraint in all_constraints:
-            return all_constraints[constraint].scope
+        try:
+            return get_constraint(constraint).scope
+        except ValueError:
+            pass
     return 'unknown'
 
 def get_constraints(constraint_names=None, scope=None):
     """
-    Get constraints with 'parse' scope, optionally filtered by names.
+    Get constraints, optionally filtered by names and scope.
 
     Args:
-        constraint_strings (list, optional): List of constraint names to filter by.
+        constraint_names (list, optional): Names of the constraints to get
+            (see get_constraint).
+        scope (str, optional): Scope of the constraints to get.
 
     Returns:
-        dict: A dictionary of constraint functions with 'parse' scope.
+        dict: The constraint functions, by name, in the order they were defined.
+
+    Raises:
+        ValueError: If a name is not that of one constraint.
     """
-    all_constraints = {
-        name: func for name, func in get_all_constraints().items()
-        if scope is None or func.scope == scope
-    }
     if constraint_names is None:
-        return all_constraints
+        constraints = get_all_constraints()
     else:
-        return {
-            name: func for name, func in all_constraints.items()
-            if name in constraint_names
-        }
+        constraints = {name: get_constraint(name) for name in constraint_names}
+        order = {func.path: i for i, func in enumerate(CONSTRAINTS.values())}
+        constraints = dict(
+            sorted(constraints.items(), key=lambda item: order[item[1].path])
+        )
+    return {
+        name: func for name, func in constraints.items()
+        if scope is None or func.scope == scope
+    }
     
 
 
@@ -1,13 +1,63 @@
 from ..imports import *
 
-def constraint(desc, scope):
+# constraints by their full names, "<module>.<qualname>"
+CONSTRAINTS = {}
+
+def is_package_constraint(func):
+    """Whether a constraint is defined in prosodic itself."""
+    return func.__module__.split(".")[0] == __name__.split(".")[0]
+
+def is_importable_constraint(func):
+    """
+    Whether another process finds a constraint by its full name, by
+    importing its module: not so for one defined in __main__ (a script, a
+    notebook or the REPL) or within a function.
+    """
+    module = sys.modules.get(func.__module__)
+    return (
+        module is not None
+        and func.__module__ not in ("__main__", "__mp_main__")
+        and getattr(module, func.__qualname__, None) is func
+    )
+
+def constraint(desc, scope, kernel=None):
+    """
+    Decorator declaring a metrical constraint.
+
+    Decorated functions are registered by their full name, of their module
+    and qualified name, so they can be listed in a Meter's constraints
+    (see constraint_utils.get_constraint): a constraint defined elsewhere
+    never replaces one of prosodic's own of the same name. A position
+    constraint may also have a vectorized kernel, given here or attached
+    later with `@func.register_kernel`. A kernel takes the syllable feature
+    arrays of a line (engine.SyllableArrays), an (n_positions, position_size)
+    matrix of the syllable indices of positions of one size, and whether
+    those positions are strong, and returns a boolean matrix of the same
+    shape marking the violating slots. The array parsers use the kernel when
+    there is one, and otherwise call the constraint on each possible position.
+
+    Args:
+        desc (str): Description of the constraint.
+        scope (str): "position", or the parse unit a parse constraint applies to.
+        kernel (callable, optional): Vectorized version of a position constraint.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
         
+        def register_kernel(kernel_func):
+            wrapper.kernel = kernel_func
+            return kernel_func
+
         wrapper.desc = desc
         wrapper.scope = scope
+        wrapper.kernel = kernel
+        wrapper.register_kernel = register_kernel
+        wrapper.path = f"{func.__module__}.{func.__qualname__}"
+        if wrapper.path in CONSTRAINTS and is_package_constraint(CONSTRAINTS[wrapper.path]):
+            raise ValueError(f"cannot redefine constraint {wrapper.path}")
+        CONSTRAINTS[wrapper.path] = wrapper
         return wrapper
     return decorator
 
@@ -27,6 +77,12 @@ def w_stress(mpos):
         return [None] * len(mpos.slots)
     return [slot.is_stressed for slot in mpos.slots]
 
+@w_stress.register_kernel
+def _w_stress_kernel(sylls, idx, is_prom):
+    if is_prom:
+        return np.zeros(idx.shape, dtype=bool)
+    return sylls.is_stressed[idx]
+
 @constraint(desc="No unstressed syllable on strong position", scope="position")
 def s_unstress(mpos):
     """
@@ -43,6 +99,12 @@ def s_unstress(mpos):
         return [None] * len(mpos.slots)
     return [not slot.is_stressed for slot in mpos.slots]
 
+@s_unstress.register_kernel
+def _s_unstress_kernel(sylls, idx, is_prom):
+    if not is_prom:
+        return np.zeros(idx.shape, dtype=bool)
+    return ~sylls.is_stressed[idx]
+
 @constraint(desc="Disyllabic positions within words must start with a light and stressed syllable", scope="position")
 def unres_within(mpos):
     """
@@ -74,6 +136,16 @@ def unres_within(mpos):
                 ol.append(False)
     return ol
 
+@unres_within.register_kernel
+def _unres_within_kernel(sylls, idx, is_prom):
+    out = np.zeros(idx.shape, dtype=bool)
+    if idx.shape[1] < 2:
+        return out
+    prev, cur = idx[:, :-1], idx[:, 1:]
+    same_word = sylls.word_ids[prev] == sylls.word_ids[cur]
+    out[:, 1:] = same_word & (sylls.is_heavy[prev] | ~sylls.is_stressed[prev])
+    return out
+
 @constraint(desc="Do not allow positions to exceed two syllables", scope="position")
 def foot_size(mpos):
     """
@@ -88,6 +160,11 @@ def foot_size(mpos):
     res = bool(len(mpos.slots) > 2) or bool(len(mpos.slots) < 1)
     return [res] * len(mpos.slots)
 
+@foot_size.register_kernel
+def _foot_size_kernel(sylls, idx, is_prom):
+    size = idx.shape[1]
+    return np.full(idx.shape, size > 2 or size < 1, dtype=bool)
+
 @constraint(desc="Disyllabic positions crossing words can only contain function words", scope="position")
 def unres_across(mpos):
     """
@@ -118,6 +195,21 @@ def unres_across(mpos):
                 ol.append(False)
     return ol
 
+@unres_across.register_kernel
+def _unres_across_kernel(sylls, idx, is_prom):
+    out = np.zeros(idx.shape, dtype=bool)
+    if idx.shape[1] < 2:
+        return out
+    prev, cur = idx[:, :-1], idx[:, 1:]
+    across = sylls.word_ids[prev] != sylls.word_ids[cur]
+    if is_prom:
+        out[:, 1:] = across
+    else:
+        out[:, 1:] = across & (
+            ~sylls.is_functionword[prev] | ~sylls.is_functionword[cur]
+        )
+    return out
+
 @constraint(desc="No polysyllabic stress on weak position", scope="position")
 def w_peak(mpos):
     """
@@ -134,6 +226,12 @@ def w_peak(mpos):
         return [None] * len(mpos.slots)
     return [slot.is_strong for slot in mpos.slots]
 
+@w_peak.register_kernel
+def _w_peak_kernel(sylls, idx, is_prom):
+    if is_prom:
+        return np.zeros(idx.shape, dtype=bool)
+    return sylls.is_strong[idx]
+
 @constraint(desc="No polysyllabic unstress on strong position", scope="position")
 def s_trough(mpos):
     """
@@ -150,6 +248,12 @@ def s_trough(mpos):
         return [None] * len(mpos.slots)
     return [slot.is_weak for slot in mpos.slots]
 
+@s_trough.register_kernel
+def _s_trough_kernel(sylls, idx, is_prom):
+    if not is_prom:
+        return np.zeros(idx.shape, dtype=bool)
+    return sylls.is_weak[idx]
+
 @constraint(desc="Ensure the parse has exactly 5 peaks", scope="line")
 def pentameter(parse):
     return parse.num_peaks != 5
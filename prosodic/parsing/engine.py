@@ -0,0 +1,1218 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from ..imports import *
+from .utils import *
+
+
+class SyllableArrays:
+    """
+    Per-syllable feature arrays for one wordtoken variant of a parse unit.
+
+    The array engine reads syllable features from these arrays instead of
+    walking ParseSlot/Syllable entities, so violations for every candidate
+    position can be computed at once.
+
+    Attributes:
+        num_sylls (int): Number of syllables in the variant.
+        is_stressed (np.ndarray): Whether each syllable is stressed.
+        is_heavy (np.ndarray): Whether each syllable is heavy.
+        is_strong (np.ndarray): Whether each syllable is strong.
+        is_weak (np.ndarray): Whether each syllable is weak.
+        word_ids (np.ndarray): Index of the wordform each syllable belongs to.
+        is_functionword (np.ndarray): Whether each syllable's wordform is a function word.
+        units (list): The Syllable objects, for constraints without a kernel.
+    """
+
+    feat_names = ("is_stressed", "is_heavy", "is_strong", "is_weak")
+
+    def __init__(
+        self,
+        is_stressed: Sequence[bool],
+        is_heavy: Sequence[bool],
+        is_strong: Sequence[bool],
+        is_weak: Sequence[bool],
+        word_ids: Sequence[int],
+        is_functionword: Sequence[bool],
+        units: Optional[List["Syllable"]] = None,
+    ) -> None:
+        self.is_stressed = np.asarray(is_stressed, dtype=bool)
+        self.is_heavy = np.asarray(is_heavy, dtype=bool)
+        self.is_strong = np.asarray(is_strong, dtype=bool)
+        self.is_weak = np.asarray(is_weak, dtype=bool)
+        self.word_ids = np.asarray(word_ids, dtype=np.int32)
+        self.is_functionword = np.asarray(is_functionword, dtype=bool)
+        self.num_sylls = len(self.is_stressed)
+        self.units = units
+
+    @classmethod
+    def from_wordtokens(
+        cls, wordtokens: "WordTokenList", feat_cache: Optional[Dict[int, tuple]] = None
+    ) -> "SyllableArrays":
+        """
+        Build feature arrays for a wordtoken list with one wordform per token.
+
+        Args:
+            wordtokens (WordTokenList): A row of the wordtoken matrix.
+            feat_cache (dict, optional): Cache of syllable features keyed by object id,
+                shared across the rows of one matrix.
+
+        Returns:
+            SyllableArrays: The feature arrays.
+        """
+        return cls.from_wordforms(wordtokens.wordforms, feat_cache=feat_cache)
+
+    @classmethod
+    def from_wordforms(
+        cls,
+        wordforms: Sequence["WordForm"],
+        word_ids: Optional[Sequence[int]] = None,
+        feat_cache: Optional[Dict[int, tuple]] = None,
+    ) -> "SyllableArrays":
+        """
+        Build feature arrays for the syllables of a sequence of wordforms.
+
+        Args:
+            wordforms (list): The wordforms, in order.
+            word_ids (list, optional): Word index of each wordform. Defaults to
+                their position in the sequence.
+            feat_cache (dict, optional): Cache of syllable features keyed by object id.
+
+        Returns:
+            SyllableArrays: The feature arrays.
+        """
+        if feat_cache is None:
+            feat_cache = {}
+        if word_ids is None:
+            word_ids = range(len(wordforms))
+        cols = [[] for _ in cls.feat_names]
+        syll_word_ids, funcs, units = [], [], []
+        for word_i, wf in zip(word_ids, wordforms):
+            is_func = wf.is_functionword
+            for syll in wf:
+                feats = feat_cache.get(id(syll))
+                if feats is None:
+                    feats = feat_cache[id(syll)] = tuple(
+                        bool(getattr(syll, feat)) for feat in cls.feat_names
+                    )
+                for col, val in zip(cols, feats):
+                    col.append(val)
+                syll_word_ids.append(word_i)
+                funcs.append(is_func)
+                units.append(syll)
+        return cls(*cols, word_ids=syll_word_ids, is_functionword=funcs, units=units)
+
+    @property
+    def stress_str(self) -> str:
+        return "".join("+" if x else "-" for x in self.is_stressed)
+
+
+class PositionKernel:
+    """
+    Kernel calling a per-position constraint function on each position.
+
+    Used for position constraints without a vectorized kernel: the function
+    is called once per position type and start syllable while building a
+    PositionTable, on a standalone ParsePosition over the line's syllables.
+
+    Args:
+        cfunc (callable): The position constraint function.
+    """
+
+    def __init__(self, cfunc: Callable) -> None:
+        self.cfunc = cfunc
+
+    def __call__(self, sylls, idx, is_prom):
+        from .positions import ParsePosition
+
+        out = np.zeros(idx.shape, dtype=bool)
+        for row, syll_ids in enumerate(idx):
+            mpos = ParsePosition(meter_val="s" if is_prom else "w")
+            for si in syll_ids:
+                mpos.add_slot(sylls.units[si])
+            out[row] = [bool(vx) for vx in self.cfunc(mpos)]
+        return out
+
+
+def get_constraint_kernels(constraint_funcs: Dict[str, Callable]) -> Dict[str, Callable]:
+    """
+    Get the kernels for a set of position constraints.
+
+    Args:
+        constraint_funcs (dict): Position constraint functions by name.
+
+    Returns:
+        dict: Kernels by name: each constraint's registered kernel, or a
+            PositionKernel calling the constraint if it has none.
+    """
+    return {
+        cname: getattr(cfunc, "kernel", None) or PositionKernel(cfunc)
+        for cname, cfunc in constraint_funcs.items()
+    }
+
+
+class PositionTable:
+    """
+    Violations for every position type at every start syllable of one variant.
+
+    Row `index[t, i]` of `violsets` holds, for a position of type `pos_types[t]`
+    starting at syllable `i`, a 0/1 flag per constraint saying whether any of
+    its slots violates it (the position's contribution to Parse.violset).
+    `viol_counts` holds the number of violating slots instead. Invalid
+    positions (running past the last syllable) have index -1.
+
+    Args:
+        sylls (SyllableArrays): Syllable features of the variant.
+        pos_types (list): Position types, as returned by Meter.get_pos_types.
+        kernels (dict): Constraint kernels by name.
+        wordform_idx (tuple): Index of the wordform chosen for each wordtoken.
+    """
+
+    def __init__(
+        self,
+        sylls: SyllableArrays,
+        pos_types: List[str],
+        kernels: Dict[str, Callable],
+        wordform_idx: Tuple[int, ...] = (),
+    ) -> None:
+        nsylls = sylls.num_sylls
+        nconstr = len(kernels)
+        self.sylls = sylls
+        self.wordform_idx = tuple(wordform_idx)
+        self.sylls_stress_str = sylls.stress_str
+        self.num_sylls = nsylls
+        self.pos_types = list(pos_types)
+        self.pos_sizes = np.array([len(x) for x in pos_types], dtype=np.int32)
+        self.pos_proms = np.array([x[0] == "s" for x in pos_types], dtype=bool)
+        self.index = np.full((len(pos_types), nsylls + 1), -1, dtype=np.int64)
+
+        violsets, viol_counts = [], []
+        nrows = 0
+        for ti, pos_type in enumerate(pos_types):
+            size, is_prom = len(pos_type), pos_type[0] == "s"
+            nstarts = nsylls - size + 1
+            if nstarts < 1:
+                continue
+            idx = np.arange(nstarts)[:, None] + np.arange(size)[None, :]
+            slot_viols = np.zeros((nstarts, size, nconstr), dtype=bool)
+            for ci, kernel in enumerate(kernels.values()):
+                slot_viols[:, :, ci] = kernel(sylls, idx, is_prom)
+            violsets.append(slot_viols.any(axis=1))
+            viol_counts.append(slot_viols.sum(axis=1))
+            self.index[ti, :nstarts] = np.arange(nrows, nrows + nstarts)
+            nrows += nstarts
+
+        self.violsets = (
+            np.concatenate(violsets).astype(np.int32)
+            if violsets
+            else np.zeros((0, nconstr), dtype=np.int32)
+        )
+        self.viol_counts = (
+            np.concatenate(viol_counts).astype(np.int32)
+            if viol_counts
+            else np.zeros((0, nconstr), dtype=np.int32)
+        )
+
+    def meter_str(self, path: Sequence[int]) -> str:
+        return "".join(
+            ("+" if self.pos_proms[ti] else "-") * self.pos_sizes[ti] for ti in path
+        )
+
+    def stress_str(self, path: Sequence[int]) -> str:
+        nslots = sum(self.pos_sizes[ti] for ti in path)
+        return self.sylls_stress_str[:nslots]
+
+    def scansion(self, path: Sequence[int]) -> List[str]:
+        return [self.pos_types[ti] for ti in path]
+
+    def get_rows(self, path: Sequence[int]) -> List[int]:
+        rows, start = [], 0
+        for ti in path:
+            rows.append(self.index[ti, start])
+            start += self.pos_sizes[ti]
+        return rows
+
+    def get_template_viols(
+        self, templates: "ScansionTemplates"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Violations of every scansion template of the variant's length.
+
+        Args:
+            templates (ScansionTemplates): Templates for this number of syllables
+                and the table's position types.
+
+        Returns:
+            tuple: (n_templates, n_constraints) violation-set counts and
+                violation counts.
+        """
+        assert templates.num_sylls == self.num_sylls
+        assert list(templates.pos_types) == self.pos_types
+        rows = np.where(
+            templates.paths >= 0, self.index[templates.paths, templates.starts], -1
+        )
+        # padding (-1) picks the appended row of zeros
+        zeros = np.zeros((1, self.violsets.shape[1]), dtype=np.int32)
+        violsets = np.concatenate([self.violsets, zeros])[rows].sum(axis=1)
+        viol_counts = np.concatenate([self.viol_counts, zeros])[rows].sum(axis=1)
+        return violsets, viol_counts
+
+    def get_viol_counts(self, path: Sequence[int]) -> np.ndarray:
+        """
+        Number of violating slots per constraint for a scansion.
+
+        Args:
+            path (list): Indices of the scansion's position types.
+
+        Returns:
+            np.ndarray: Violation counts, in the order of the table's kernels.
+        """
+        return self.viol_counts[self.get_rows(path)].sum(axis=0)
+
+
+class ParseRecord:
+    """
+    Compact record of a scansion found by the array engines.
+
+    The search phase works on records rather than Parse entities: a record
+    holds only what bounding and ranking need, and Parse.from_record wraps
+    one in a Parse whose positions and slots are built on first access.
+    Violation counts are in the order of the meter's position constraints.
+
+    Attributes:
+        variant (int): Index of the wordtoken variant.
+        path (tuple): Indices of the position types chosen so far.
+        is_bounded (bool): Whether the record was harmonically bounded.
+        bounded_by (list): Indices of the records which bounded it.
+        wordform_idx (tuple): Index of the wordform chosen for each wordtoken.
+        scansion (tuple): Position types of the scansion, e.g. ("w", "s", "ww").
+        stress_str (str): Stress string of the syllables scanned.
+        viol_counts (np.ndarray): Number of violating slots per constraint.
+        violset_counts (np.ndarray): Number of violating positions per constraint.
+        score (float): Weighted sum of the violation counts.
+        rank (int): Rank among the parses of the same words, once ranked.
+        rows (tuple): Rows of the search's violation table for each position,
+            for searches which keep them.
+    """
+
+    __slots__ = (
+        "variant",
+        "path",
+        "is_bounded",
+        "bounded_by",
+        "wordform_idx",
+        "scansion",
+        "stress_str",
+        "viol_counts",
+        "violset_counts",
+        "score",
+        "rank",
+        "rows",
+    )
+
+    def __init__(self, variant, path, is_bounded=False, bounded_by=None):
+        self.variant = variant
+        self.path = path
+        self.is_bounded = is_bounded
+        self.bounded_by = bounded_by if bounded_by is not None else []
+        self.wordform_idx = ()
+        self.scansion = ()
+        self.stress_str = ""
+        self.viol_counts = None
+        self.violset_counts = None
+        self.score = None
+        self.rank = None
+        self.rows = None
+
+    @property
+    def meter_str(self) -> str:
+        return "".join(
+            ("+" if ptype[0] == "s" else "-") * len(ptype) for ptype in self.scansion
+        )
+
+    @property
+    def sort_key(self) -> tuple:
+        """The sort key of a Parse built from this record (see Parse.sort_key)."""
+        return (
+            int(bool(self.is_bounded)),
+            self.score,
+            self.scansion[0][0] == "s",
+            np.mean([len(ptype) for ptype in self.scansion]),
+            self.stress_str.count("+"),
+            tuple(int(x == "+") for x in self.meter_str),
+            tuple(int(x == "+") for x in self.stress_str),
+        )
+
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        return f"ParseRecord({self.variant}, {self.scansion or self.path}, score={self.score})"
+
+
+class ParseTask:
+    """
+    Compact input for parsing one parse unit in a worker process.
+
+    Holds what the array search needs and nothing else: the meter's settings
+    and, for each wordtoken variant, its syllable feature arrays (without
+    the Syllable objects), its wordform choices, initial position types and
+    comparison group. The worker sends back ParseRecords, which the parent
+    process turns into parses of its own wordtokens (see
+    Meter.parses_from_records), so no entity is pickled either way.
+
+    Attributes:
+        meter_key (str): Key of the meter, under which workers cache it.
+        meter_attrs (dict): Settings to rebuild the meter with.
+        txt (str): Text of the parse unit, for log messages.
+        sylls (list): SyllableArrays of each variant, without units.
+        wordform_idxs (list): Index of the wordform chosen for each wordtoken,
+            per variant.
+        init_types (list): Initial position types of each variant.
+        group_ids (list): Comparison group of each variant.
+        rows (tuple): For a chunk of an exhaustive parse, the (start, stop)
+            range of scansion templates it evaluates; None for the whole unit.
+    """
+
+    __slots__ = (
+        "meter_key",
+        "meter_attrs",
+        "txt",
+        "sylls",
+        "wordform_idxs",
+        "init_types",
+        "group_ids",
+        "rows",
+    )
+
+    def __init__(self, meter_key, meter_attrs, txt=""):
+        self.meter_key = meter_key
+        self.meter_attrs = meter_attrs
+        self.txt = txt
+        self.sylls = []
+        self.wordform_idxs = []
+        self.init_types = []
+        self.group_ids = []
+        self.rows = None
+
+    def __len__(self) -> int:
+        return len(self.sylls)
+
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        rows = f", rows={self.rows}" if self.rows else ""
+        return f"ParseTask({self.txt!r}, {len(self)} variants{rows})"
+
+
+def fill_records(
+    tables: List[PositionTable], records: List[ParseRecord], weights: Sequence[float]
+) -> None:
+    """
+    Fill in the scansion, violation counts and score of search records.
+
+    Violation counts already set by the search are kept.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        records (list): Records whose path is set.
+        weights (list): Constraint weights, in the order of the tables' kernels.
+    """
+    for rec in records:
+        table = tables[rec.variant]
+        rec.wordform_idx = table.wordform_idx
+        rec.scansion = tuple(table.scansion(rec.path))
+        rec.stress_str = table.stress_str(rec.path)
+        if rec.viol_counts is None:
+            rows = table.get_rows(rec.path)
+            rec.viol_counts = table.viol_counts[rows].sum(axis=0)
+            rec.violset_counts = table.violsets[rows].sum(axis=0)
+        rec.score = sum(int(n) * w for n, w in zip(rec.viol_counts, weights) if n)
+
+
+def search_branch_and_bound(
+    tables: List[PositionTable],
+    init_types: List[List[str]],
+    group_ids: Sequence[int],
+    min_slots: int = 4,
+    max_iter: int = 1000,
+) -> Tuple[List[ParseRecord], bool]:
+    """
+    Array version of the branch-and-bound loop in Meter.parse_fast.
+
+    Candidates are kept as rows of integer arrays (variant, slots positioned,
+    last position's prominence, summed violation sets), branched in the same
+    order as Parse.branch and bounded with the same bound_violsets as
+    ParseList.bound, so the surviving scansions and their bounding are
+    identical.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        init_types (list): Position types to start each variant with.
+        group_ids (list): Comparison group of each variant (equal wordtokens keys).
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+        max_iter (int): Maximum number of branching iterations.
+
+    Returns:
+        tuple: The final records, and whether the search completed.
+    """
+    nconstr = tables[0].violsets.shape[1] if tables else 0
+    offsets = np.cumsum([0] + [len(t.violsets) for t in tables])
+    all_violsets = (
+        np.concatenate([t.violsets for t in tables])
+        if tables
+        else np.zeros((0, nconstr), dtype=np.int32)
+    )
+    var_nsylls = np.array([t.num_sylls for t in tables], dtype=np.int64)
+    group_ids = np.asarray(group_ids, dtype=np.int64)
+
+    # initial candidates: one per starting position type
+    var, paths, rows = [], [], []
+    for vi, (table, ptypes) in enumerate(zip(tables, init_types)):
+        for ptype in ptypes:
+            ti = table.pos_types.index(ptype)
+            row = table.index[ti, 0]
+            if row >= 0:
+                var.append(vi)
+                paths.append((ti,))
+                rows.append(offsets[vi] + row)
+    var = np.array(var, dtype=np.int64)
+    viols = all_violsets[np.array(rows, dtype=np.int64)]
+    nslots = np.array(
+        [tables[v].pos_sizes[p[0]] for v, p in zip(var, paths)], dtype=np.int64
+    )
+    last_prom = np.array(
+        [tables[v].pos_proms[p[0]] for v, p in zip(var, paths)], dtype=bool
+    )
+    bounded = np.zeros(len(var), dtype=bool)
+    bounded_by = [[] for _ in range(len(var))]
+
+    for _ in range(max_iter):
+        # branch
+        parents, new_paths, new_rows, sizes, proms = [], [], [], [], []
+        for ci in range(len(var)):
+            if bounded[ci]:
+                continue
+            table = tables[var[ci]]
+            start = nslots[ci]
+            branched = False
+            for ti in range(len(table.pos_types)):
+                if table.pos_proms[ti] == last_prom[ci]:
+                    continue
+                row = table.index[ti, start]
+                if row < 0:
+                    continue
+                parents.append(ci)
+                new_paths.append(paths[ci] + (ti,))
+                new_rows.append(offsets[var[ci]] + row)
+                sizes.append(table.pos_sizes[ti])
+                proms.append(table.pos_proms[ti])
+                branched = True
+            if not branched:
+                parents.append(ci)
+                new_paths.append(paths[ci])
+                new_rows.append(-1)
+                sizes.append(0)
+                proms.append(last_prom[ci])
+
+        parents = np.array(parents, dtype=np.int64)
+        new_rows = np.array(new_rows, dtype=np.int64)
+        var = var[parents]
+        paths = new_paths
+        viols = viols[parents]
+        extended = new_rows >= 0
+        viols[extended] += all_violsets[new_rows[extended]]
+        nslots = nslots[parents] + np.array(sizes, dtype=np.int64)
+        last_prom = np.array(proms, dtype=bool)
+        is_complete = nslots == var_nsylls[var]
+
+        # bound
+        bounded, bounded_by = bound_violsets(
+            viols, group_ids[var], nslots, is_complete, min_slots=min_slots
+        )
+        if is_complete.all():
+            break
+    else:
+        return _to_records(var, paths, bounded, bounded_by), False
+
+    return _to_records(var, paths, bounded, bounded_by), True
+
+
+def _to_records(var, paths, bounded, bounded_by):
+    return [
+        ParseRecord(int(v), path, bool(b), bb)
+        for v, path, b, bb in zip(var, paths, bounded, bounded_by)
+    ]
+
+
+def search_dp(
+    tables: List[PositionTable], group_ids: Sequence[int], min_slots: int = 4
+) -> List[ParseRecord]:
+    """
+    Dynamic-programming search over syllable index and last position type.
+
+    Position-scoped violations add up over positions, so two partial
+    scansions covering the same syllables and ending on the same kind of
+    position have the same possible continuations; one whose violation-set
+    counts are bounded by the other's can never end up unbounded. Keeping
+    only the unbounded partial scansions at each state therefore yields
+    every complete scansion that exhaustive parsing would leave unbounded,
+    at a cost linear in the number of syllables.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        group_ids (list): Comparison group of each variant (equal wordtokens keys).
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+            Lines shorter than this are not pruned at all.
+
+    Returns:
+        list: The complete records, bounded against each other.
+    """
+    prune = all(table.num_sylls >= min_slots for table in tables)
+    var, paths, viols = [], [], []
+    for vi, table in enumerate(tables):
+        nsylls, nconstr = table.num_sylls, table.violsets.shape[1]
+        # states[(i, is_prom)] = (paths, violation-set counts) reaching syllable i
+        states = defaultdict(lambda: ([], []))
+        start = ([()], np.zeros((1, nconstr), dtype=np.int32))
+        for i in range(nsylls + 1):
+            for last_prom in (None, False, True):
+                if last_prom is None:
+                    if i:
+                        continue
+                    state_paths, state_viols = start
+                else:
+                    state_paths, state_viols = states.pop((i, last_prom), ([], []))
+                    if not state_paths:
+                        continue
+                    state_viols = np.vstack(state_viols)
+                    if prune:
+                        keep = np.flatnonzero(~dominated_mask(state_viols))
+                        state_paths = [state_paths[k] for k in keep]
+                        state_viols = state_viols[keep]
+                if i == nsylls:
+                    var.extend([vi] * len(state_paths))
+                    paths.extend(state_paths)
+                    viols.append(state_viols)
+                    continue
+                for ti in range(len(table.pos_types)):
+                    row = table.index[ti, i]
+                    is_prom = bool(table.pos_proms[ti])
+                    if row < 0 or is_prom == last_prom:
+                        continue
+                    next_paths, next_viols = states[(i + table.pos_sizes[ti], is_prom)]
+                    next_paths.extend(path + (ti,) for path in state_paths)
+                    next_viols.append(state_viols + table.violsets[row])
+
+    if not paths:
+        return []
+    viols = np.vstack(viols)
+    groups = np.asarray(group_ids, dtype=np.int64)[np.array(var, dtype=np.int64)]
+    nslots = np.array([tables[v].num_sylls for v in var], dtype=np.int64)
+    bounded, bounded_by = bound_violsets(
+        viols, groups, nslots, np.ones(len(paths), dtype=bool), min_slots=min_slots
+    )
+    return _to_records(var, paths, bounded, bounded_by)
+
+
+class WordformLattice:
+    """
+    Syllables of every wordform of a parse unit, shared across matrix rows.
+
+    Each row of the wordtoken matrix picks one wordform per token, and the
+    rows of a line mostly share their syllables. Here each wordform's
+    syllables are stored once, and a scansion picks a token's wordform only
+    when one of its positions first reaches that token, so scansions of
+    different rows share every position up to where their wordforms differ.
+    A state `(token, wordform, syllable)` is the next syllable to scan (None
+    once every syllable is scanned); a walk is the run of syllables a
+    position covers from a state, with the wordforms chosen along the way.
+    The violations of each walk are computed once, in bulk, like those of a
+    PositionTable.
+
+    Args:
+        wordtokens (WordTokenList): The words to parse.
+        pos_types (list): Position types, as returned by Meter.get_pos_types.
+        kernels (dict): Constraint kernels by name.
+        first_only (bool): Use only the first wordform of each token, as in the
+            first row of the wordtoken matrix.
+        feat_cache (dict, optional): Cache of syllable features keyed by object id.
+
+    Attributes:
+        alternatives (list): For each token with wordforms, the syllable
+            indices of each of its wordforms.
+        sylls (SyllableArrays): Features of every syllable in the lattice.
+        starts (list): (state, wordforms chosen) pairs a scansion starts from.
+        walks (dict): Row indices of the walks of position type `t` from a
+            state, keyed by `(state, t)`.
+        violsets (np.ndarray): Violation-set flags of each walk row.
+        viol_counts (np.ndarray): Violation counts of each walk row.
+    """
+
+    def __init__(
+        self,
+        wordtokens: "WordTokenList",
+        pos_types: List[str],
+        kernels: Dict[str, Callable],
+        first_only: bool = False,
+        feat_cache: Optional[Dict[int, tuple]] = None,
+    ) -> None:
+        nconstr = len(kernels)
+        self.alternatives = []
+        wordforms, word_ids = [], []
+        nsylls = 0
+        for word_i, tok in enumerate(tok for tok in wordtokens if tok.has_wordform):
+            alts = []
+            for wf in tok.wordforms[:1] if first_only else tok.wordforms:
+                alts.append(list(range(nsylls, nsylls + len(wf))))
+                nsylls += len(wf)
+                wordforms.append(wf)
+                word_ids.append(word_i)
+            self.alternatives.append(alts)
+        self.sylls = SyllableArrays.from_wordforms(
+            wordforms, word_ids=word_ids, feat_cache=feat_cache
+        )
+        self.pos_types = list(pos_types)
+        self.pos_sizes = np.array([len(x) for x in pos_types], dtype=np.int32)
+        self.pos_proms = np.array([x[0] == "s" for x in pos_types], dtype=bool)
+        self.starts = self._enter(0)
+
+        self._walk_cache = {}
+        states = [
+            (t, a, o)
+            for t, alts in enumerate(self.alternatives)
+            for a, nodes in enumerate(alts)
+            for o in range(len(nodes))
+        ]
+        self.walks = defaultdict(list)
+        self.walk_nodes, self.walk_choices, self.walk_ends = [], [], []
+        violsets, viol_counts = [], []
+        for ti, pos_type in enumerate(self.pos_types):
+            size, is_prom = len(pos_type), pos_type[0] == "s"
+            found = [
+                (state, walk) for state in states for walk in self._walk(state, size)
+            ]
+            if not found:
+                continue
+            idx = np.array([nodes for _, (nodes, _, _) in found], dtype=np.int64)
+            slot_viols = np.zeros((len(found), size, nconstr), dtype=bool)
+            for ci, kernel in enumerate(kernels.values()):
+                slot_viols[:, :, ci] = kernel(self.sylls, idx, is_prom)
+            violsets.append(slot_viols.any(axis=1))
+            viol_counts.append(slot_viols.sum(axis=1))
+            for state, (nodes, choices, end) in found:
+                self.walks[(state, ti)].append(len(self.walk_nodes))
+                self.walk_nodes.append(nodes)
+                self.walk_choices.append(choices)
+                self.walk_ends.append(end)
+        self._walk_cache = {}
+
+        self.violsets = (
+            np.concatenate(violsets).astype(np.int32)
+            if violsets
+            else np.zeros((0, nconstr), dtype=np.int32)
+        )
+        self.viol_counts = (
+            np.concatenate(viol_counts).astype(np.int32)
+            if viol_counts
+            else np.zeros((0, nconstr), dtype=np.int32)
+        )
+
+    @property
+    def num_words(self) -> int:
+        return len(self.alternatives)
+
+    @property
+    def max_num_sylls(self) -> int:
+        return sum(max(len(nodes) for nodes in alts) for alts in self.alternatives)
+
+    def _enter(self, word_i: int) -> List[Tuple[Optional[tuple], Tuple[int, ...]]]:
+        # states reached by choosing a wordform for token word_i (and for any
+        # following tokens whose chosen wordform has no syllables)
+        if word_i == len(self.alternatives):
+            return [(None, ())]
+        out = []
+        for a, nodes in enumerate(self.alternatives[word_i]):
+            if nodes:
+                out.append(((word_i, a, 0), (a,)))
+            else:
+                out.extend(
+                    (state, (a,) + choices)
+                    for state, choices in self._enter(word_i + 1)
+                )
+        return out
+
+    def _walk(self, state: Optional[tuple], size: int) -> List[tuple]:
+        # (syllable indices, wordforms chosen, end state) of every walk of
+        # `size` syllables from `state`
+        if not size:
+            return [((), (), state)]
+        if state is None:
+            return []
+        key = (state, size)
+        if key not in self._walk_cache:
+            t, a, o = state
+            nodes = self.alternatives[t][a]
+            if o + 1 < len(nodes):
+                nexts = [((t, a, o + 1), ())]
+            else:
+                nexts = self._enter(t + 1)
+            self._walk_cache[key] = [
+                ((nodes[o],) + walk_nodes, choices + walk_choices, end)
+                for next_state, choices in nexts
+                for walk_nodes, walk_choices, end in self._walk(next_state, size - 1)
+            ]
+        return self._walk_cache[key]
+
+    def variant_index(self, wordform_idx: Sequence[int]) -> int:
+        """
+        Index of the wordtoken matrix row choosing these wordforms.
+
+        Args:
+            wordform_idx (tuple): Index of the wordform chosen for each token.
+
+        Returns:
+            int: The row's index, in the order iter_wordtoken_matrix yields rows.
+        """
+        variant = 0
+        for alts, a in zip(self.alternatives, wordform_idx):
+            variant = variant * len(alts) + a
+        return variant
+
+    def fill_records(self, records: List[ParseRecord], weights: Sequence[float]) -> None:
+        """
+        Fill in the scansion, violation counts and score of lattice records.
+
+        Args:
+            records (list): Records from search_lattice.
+            weights (list): Constraint weights, in the order of the kernels.
+        """
+        stress_str = self.sylls.stress_str
+        for rec in records:
+            rows = list(rec.rows)
+            rec.scansion = tuple(self.pos_types[ti] for ti in rec.path)
+            rec.stress_str = "".join(
+                stress_str[si] for row in rows for si in self.walk_nodes[row]
+            )
+            rec.viol_counts = self.viol_counts[rows].sum(axis=0)
+            rec.violset_counts = self.violsets[rows].sum(axis=0)
+            rec.score = sum(int(n) * w for n, w in zip(rec.viol_counts, weights) if n)
+
+
+def search_lattice(
+    lattice: WordformLattice,
+    init_types: List[List[str]],
+    min_slots: int = 4,
+    max_iter: int = 1000,
+) -> Tuple[List[ParseRecord], bool]:
+    """
+    Branch-and-bound search over a WordformLattice.
+
+    Runs the same loop as search_branch_and_bound, but a candidate stands
+    for every row of the wordtoken matrix agreeing with the wordforms it has
+    chosen so far, and branches on a token's wordforms only when a position
+    reaches it. Since the rows it stands for have the same violations, slots
+    positioned and completeness, bounding them together bounds each of them
+    as the per-row search would, and the complete records are those of
+    search_branch_and_bound over every row, with their wordforms chosen.
+    All rows share one comparison group, as they have the same words.
+
+    Args:
+        lattice (WordformLattice): The wordforms and walk violations of the line.
+        init_types (list): Position types to start with, by the wordform chosen
+            for the first token.
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+        max_iter (int): Maximum number of branching iterations.
+
+    Returns:
+        tuple: The final records, and whether the search completed.
+    """
+    nconstr = lattice.violsets.shape[1]
+    pos_index = {ptype: ti for ti, ptype in enumerate(lattice.pos_types)}
+
+    # initial candidates: one per starting walk
+    states, choices, paths, rows = [], [], [], []
+    for state, start_choices in lattice.starts:
+        for ptype in init_types[start_choices[0]] if start_choices else []:
+            ti = pos_index[ptype]
+            for row in lattice.walks.get((state, ti), []):
+                states.append(lattice.walk_ends[row])
+                choices.append(start_choices + lattice.walk_choices[row])
+                paths.append((ti,))
+                rows.append((row,))
+    viols = lattice.violsets[np.array([r[0] for r in rows], dtype=np.int64)]
+    viols = viols.reshape(len(rows), nconstr)
+    nslots = np.array([lattice.pos_sizes[p[0]] for p in paths], dtype=np.int64)
+    last_prom = np.array([lattice.pos_proms[p[0]] for p in paths], dtype=bool)
+    bounded = np.zeros(len(paths), dtype=bool)
+    bounded_by = [[] for _ in range(len(paths))]
+
+    completed = False
+    for _ in range(max_iter):
+        # branch
+        parents, new_states, new_choices, new_paths, new_rows = [], [], [], [], []
+        ext_rows, sizes, proms = [], [], []
+        for ci in range(len(paths)):
+            if bounded[ci]:
+                continue
+            branched = False
+            if states[ci] is not None:
+                for ti in range(len(lattice.pos_types)):
+                    if lattice.pos_proms[ti] == last_prom[ci]:
+                        continue
+                    for row in lattice.walks.get((states[ci], ti), []):
+                        parents.append(ci)
+                        new_states.append(lattice.walk_ends[row])
+                        new_choices.append(choices[ci] + lattice.walk_choices[row])
+                        new_paths.append(paths[ci] + (ti,))
+                        new_rows.append(rows[ci] + (row,))
+                        ext_rows.append(row)
+                        sizes.append(lattice.pos_sizes[ti])
+                        proms.append(lattice.pos_proms[ti])
+                        branched = True
+            if not branched:
+                parents.append(ci)
+                new_states.append(states[ci])
+                new_choices.append(choices[ci])
+                new_paths.append(paths[ci])
+                new_rows.append(rows[ci])
+                ext_rows.append(-1)
+                sizes.append(0)
+                proms.append(last_prom[ci])
+
+        parents = np.array(parents, dtype=np.int64)
+        ext_rows = np.array(ext_rows, dtype=np.int64)
+        states, choices, paths, rows = new_states, new_choices, new_paths, new_rows
+        viols = viols[parents]
+        extended = ext_rows >= 0
+        viols[extended] += lattice.violsets[ext_rows[extended]]
+        nslots = nslots[parents] + np.array(sizes, dtype=np.int64)
+        last_prom = np.array(proms, dtype=bool)
+        is_complete = np.array([state is None for state in states], dtype=bool)
+
+        # bound
+        bounded, bounded_by = bound_violsets(
+            viols,
+            np.zeros(len(paths), dtype=np.int64),
+            nslots,
+            is_complete,
+            min_slots=min_slots,
+        )
+        if is_complete.all():
+            completed = True
+            break
+
+    records = []
+    for wf_idx, path, path_rows, b, bb in zip(choices, paths, rows, bounded, bounded_by):
+        variant = (
+            lattice.variant_index(wf_idx) if len(wf_idx) == lattice.num_words else -1
+        )
+        rec = ParseRecord(variant, path, bool(b), bb)
+        rec.wordform_idx = wf_idx
+        rec.rows = path_rows
+        records.append(rec)
+    return records, completed
+
+
+class ScansionTemplates:
+    """
+    Every legal scansion of a number of syllables, as compact arrays.
+
+    Row t of `paths` holds the indices into `pos_types` of the positions of
+    scansion t, and row t of `starts` the syllable each of them starts at;
+    both are padded with -1.
+
+    Args:
+        num_sylls (int): Number of syllables.
+        pos_types (list): Position types, as returned by Meter.get_pos_types.
+        paths (np.ndarray): (n_templates, max_positions) position type indices.
+        starts (np.ndarray): (n_templates, max_positions) start syllables.
+    """
+
+    def __init__(
+        self,
+        num_sylls: int,
+        pos_types: Sequence[str],
+        paths: np.ndarray,
+        starts: np.ndarray,
+    ) -> None:
+        self.num_sylls = num_sylls
+        self.pos_types = tuple(pos_types)
+        self.paths = paths
+        self.starts = starts
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, rows: slice) -> "ScansionTemplates":
+        return ScansionTemplates(
+            self.num_sylls, self.pos_types, self.paths[rows], self.starts[rows]
+        )
+
+    @classmethod
+    def from_scansions(
+        cls, num_sylls: int, scansions: List[List[str]], pos_types: Sequence[str]
+    ) -> "ScansionTemplates":
+        type_ids = {pos_type: ti for ti, pos_type in enumerate(pos_types)}
+        max_npos = max((len(scansion) for scansion in scansions), default=0)
+        paths = np.full((len(scansions), max_npos), -1, dtype=np.int16)
+        starts = np.full((len(scansions), max_npos), -1, dtype=np.int16)
+        for row, scansion in enumerate(scansions):
+            start = 0
+            for col, pos_type in enumerate(scansion):
+                paths[row, col] = type_ids[pos_type]
+                starts[row, col] = start
+                start += len(pos_type)
+        return cls(num_sylls, pos_types, paths, starts)
+
+    def iter_paths(self) -> Iterator[Tuple[int, ...]]:
+        for row in self.paths.tolist():
+            yield tuple(ti for ti in row if ti >= 0)
+
+    def save(self, fn: str) -> None:
+        """Save the templates to an .npz file, replacing it atomically."""
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        tmp_fn = f"{fn}.{os.getpid()}.tmp"
+        with open(tmp_fn, "wb") as f:
+            np.savez(
+                f,
+                num_sylls=self.num_sylls,
+                pos_types=np.array(self.pos_types),
+                paths=self.paths,
+                starts=self.starts,
+            )
+        os.replace(tmp_fn, fn)
+
+    @classmethod
+    def load(cls, fn: str) -> "ScansionTemplates":
+        with np.load(fn) as data:
+            return cls(
+                int(data["num_sylls"]),
+                [str(x) for x in data["pos_types"]],
+                data["paths"],
+                data["starts"],
+            )
+
+
+@cache
+def get_scansion_templates(
+    nsylls: int, max_s: Optional[int] = METER_MAX_S, max_w: Optional[int] = METER_MAX_W
+) -> ScansionTemplates:
+    """
+    Get the scansion templates for a number of syllables and meter settings.
+
+    Templates are kept in memory, and stored under PATH_HOME_DATA_SCANSIONS
+    so that later sessions load them instead of enumerating the scansions.
+
+    Args:
+        nsylls (int): Number of syllables.
+        max_s (int): Maximum number of syllables in a strong position.
+        max_w (int): Maximum number of syllables in a weak position.
+
+    Returns:
+        ScansionTemplates: The templates.
+    """
+    fn = os.path.join(PATH_HOME_DATA_SCANSIONS, f"{nsylls}_{max_s}_{max_w}.npz")
+    if os.path.exists(fn):
+        try:
+            return ScansionTemplates.load(fn)
+        except Exception as e:
+            log.warning(f"could not load scansion templates from {fn}: {e}")
+    templates = ScansionTemplates.from_scansions(
+        nsylls,
+        get_possible_scansions(nsylls, max_s=max_s, max_w=max_w),
+        get_position_types(nsylls, max_s=max_s, max_w=max_w),
+    )
+    try:
+        templates.save(fn)
+    except OSError as e:
+        log.warning(f"could not save scansion templates to {fn}: {e}")
+    return templates
+
+
+def evaluate_templates(
+    tables: List[PositionTable],
+    templates: List[ScansionTemplates],
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Tuple[List[int], List[Tuple[int, ...]], np.ndarray, np.ndarray]:
+    """
+    Violations of the scansion templates of every variant, one after another.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        templates (list): The ScansionTemplates of each variant's length.
+        start (int): First template to evaluate, counting across variants.
+        stop (int, optional): Template to stop before. Defaults to the last.
+
+    Returns:
+        tuple: The variant and path of each template evaluated, and their
+            violation-set counts and violation counts.
+    """
+    var, paths, violsets, viol_counts = [], [], [], []
+    offset = 0
+    for vi, (table, tmpls) in enumerate(zip(tables, templates)):
+        lo = max(start - offset, 0)
+        hi = len(tmpls) if stop is None else min(stop - offset, len(tmpls))
+        offset += len(tmpls)
+        if lo >= hi:
+            continue
+        tmpls = tmpls[lo:hi]
+        tmpl_violsets, tmpl_viol_counts = table.get_template_viols(tmpls)
+        var.extend([vi] * len(tmpls))
+        paths.extend(tmpls.iter_paths())
+        violsets.append(tmpl_violsets)
+        viol_counts.append(tmpl_viol_counts)
+    if not paths:
+        nconstr = tables[0].violsets.shape[1] if tables else 0
+        empty = np.zeros((0, nconstr), dtype=np.int32)
+        return var, paths, empty, empty
+    return var, paths, np.concatenate(violsets), np.concatenate(viol_counts)
+
+
+def search_templates(
+    tables: List[PositionTable],
+    templates: List[ScansionTemplates],
+    group_ids: Sequence[int],
+    min_slots: int = 4,
+) -> List[ParseRecord]:
+    """
+    Evaluate every scansion template of each variant and bound them all.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        templates (list): The ScansionTemplates of each variant's length.
+        group_ids (list): Comparison group of each variant (equal wordtokens keys).
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+
+    Returns:
+        list: One record per template and variant, with its violation counts.
+    """
+    var, paths, violsets, viol_counts = evaluate_templates(tables, templates)
+    if not paths:
+        return []
+
+    groups = np.asarray(group_ids, dtype=np.int64)[np.array(var, dtype=np.int64)]
+    nslots = np.array([tables[v].num_sylls for v in var], dtype=np.int64)
+    bounded, bounded_by = bound_violsets(
+        violsets, groups, nslots, np.ones(len(paths), dtype=bool), min_slots=min_slots
+    )
+    records = _to_records(var, paths, bounded, bounded_by)
+    for rec, rec_violsets, rec_viol_counts in zip(records, violsets, viol_counts):
+        rec.violset_counts = rec_violsets
+        rec.viol_counts = rec_viol_counts
+    return records
+
+
+def search_template_chunk(
+    tables: List[PositionTable],
+    templates: List[ScansionTemplates],
+    group_ids: Sequence[int],
+    start: int,
+    stop: int,
+    min_slots: int = 4,
+) -> Tuple[List[ParseRecord], Dict[tuple, List[int]]]:
+    """
+    Evaluate a chunk of the scansion templates, for merge_template_chunks.
+
+    The records are not bounded yet; instead the skyline of each of the
+    chunk's comparison sets is found, which is all bounding needs to know
+    about the chunk once chunks are merged.
+
+    Args:
+        tables (list): One PositionTable per wordtoken variant.
+        templates (list): The ScansionTemplates of each variant's length.
+        group_ids (list): Comparison group of each variant.
+        start (int): First template of the chunk, counting across variants.
+        stop (int): Template the chunk stops before.
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+
+    Returns:
+        tuple: The chunk's records, and the indices of the records in the
+            skyline of each comparison set (see get_comparison_sets).
+    """
+    var, paths, violsets, viol_counts = evaluate_templates(
+        tables, templates, start=start, stop=stop
+    )
+    records = _to_records(var, paths, [False] * len(paths), [[] for _ in paths])
+    for rec, rec_violsets, rec_viol_counts in zip(records, violsets, viol_counts):
+        rec.violset_counts = rec_violsets
+        rec.viol_counts = rec_viol_counts
+    groups = np.asarray(group_ids, dtype=np.int64)[np.array(var, dtype=np.int64)]
+    nslots = np.array([tables[v].num_sylls for v in var], dtype=np.int64)
+    can_bound = nslots >= min_slots if min_slots else np.ones(len(paths), dtype=bool)
+    skylines = {
+        key: get_skyline(members, violsets, can_bound).tolist()
+        for key, members in get_comparison_sets(
+            groups, nslots, np.ones(len(paths), dtype=bool)
+        ).items()
+    }
+    return records, skylines
+
+
+def merge_template_chunks(
+    chunks: List[Tuple[List[ParseRecord], Dict[tuple, List[int]]]],
+    num_sylls: Sequence[int],
+    group_ids: Sequence[int],
+    min_slots: int = 4,
+) -> List[ParseRecord]:
+    """
+    Merge chunks from search_template_chunk and bound their records together.
+
+    The records, their bounding and bounded_by indices are the same as
+    those search_templates gives for the whole template space.
+
+    Args:
+        chunks (list): The output of search_template_chunk for each chunk, in order.
+        num_sylls (list): Number of syllables of each variant.
+        group_ids (list): Comparison group of each variant.
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+
+    Returns:
+        list: The records of all chunks, bounded.
+    """
+    records = []
+    candidates = defaultdict(list)
+    for chunk_records, skylines in chunks:
+        for key, members in skylines.items():
+            candidates[key].extend(len(records) + i for i in members)
+        records.extend(chunk_records)
+    if not records:
+        return records
+
+    var = np.array([rec.variant for rec in records], dtype=np.int64)
+    bounded, bounded_by = bound_by_skylines(
+        np.array([rec.violset_counts for rec in records]),
+        np.asarray(group_ids, dtype=np.int64)[var],
+        np.asarray(num_sylls, dtype=np.int64)[var],
+        np.ones(len(records), dtype=bool),
+        candidates,
+        min_slots=min_slots,
+    )
+    for rec, is_bounded, rec_bounded_by in zip(records, bounded, bounded_by):
+        rec.is_bounded = bool(is_bounded)
+        rec.bounded_by = rec_bounded_by
+    return records
+
+
+def dominated_mask(viols: np.ndarray) -> np.ndarray:
+    """
+    Mark the rows of a violation matrix that another row harmonically bounds.
+
+    Args:
+        viols (np.ndarray): (n_parses, n_constraints) violation-set counts.
+
+    Returns:
+        np.ndarray: Boolean array, True where some other row is less than or
+            equal on every constraint and not identical.
+    """
+    le = (viols[:, None, :] <= viols[None, :, :]).all(axis=2)
+    lt = le & ~le.T
+    return lt.any(axis=0)
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Dict, Any, Iterator, Optional, Union
+from typing import List, Tuple, Dict, Any, Iterator, Optional, Union, Callable
 from ..imports import *
 from .constraints import *
 from .constraint_utils import *
@@ -6,6 +6,9 @@ from ..texts import TextModel, Line, Stanza
 from .parses import Parse
 from .parselists import ParseList
 from .utils import *
+from .engine import *
+from .pool import *
+from .cache import *
 
 NUM_GOING = 0
 # METER
@@ -16,6 +19,8 @@ DEFAULT_METER_KWARGS = dict(
     resolve_optionality=METER_RESOLVE_OPTIONALITY,
     exhaustive=False,
     parse_unit="linepart",
+    algorithm=METER_ALGORITHM,
+    k=None,
 )
 MTRDEFAULT = DEFAULT_METER_KWARGS
 
@@ -33,6 +38,11 @@ class Meter(Entity):
         max_w (int): Maximum number of consecutive weak positions.
         resolve_optionality (bool): Whether to resolve optional syllables.
         exhaustive (bool): Whether to perform exhaustive parsing.
+        algorithm (str): Search used for non-exhaustive parsing: "fast" for the
+            entity-based branch-and-bound, "array" for the same search over
+            NumPy arrays, "dp" for dynamic programming over syllables, "lattice"
+            for the array search with wordform alternatives as branch points.
+        k (int): If set, keep only the k best parses of each parse unit.
     """
 
     prefix: str = "meter"
@@ -46,6 +56,9 @@ class Meter(Entity):
         resolve_optionality: bool = MTRDEFAULT["resolve_optionality"],
         exhaustive: bool = MTRDEFAULT["exhaustive"],
         parse_unit: Literal["line", "sentpart", "linepart"] = MTRDEFAULT["parse_unit"],
+        algorithm: Literal["fast", "array", "dp", "lattice"] = MTRDEFAULT["algorithm"],
+        k: Optional[int] = MTRDEFAULT["k"],
+        best_only: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -57,8 +70,14 @@ class Meter(Entity):
             max_w (int): Maximum number of consecutive weak positions.
             resolve_optionality (bool): Whether to resolve optional syllables.
             exhaustive (bool): Whether to perform exhaustive parsing.
+            algorithm (str): Search used for non-exhaustive parsing ("fast", "array", "dp"
+                or "lattice").
+            k (int): If set, keep only the k best parses of each parse unit.
+            best_only (bool): Keep only the best parse (same as k=1).
             **kwargs: Additional keyword arguments.
         """
+        if best_only and not k:
+            k = 1
         super().__init__(
             constraints=(
                 parse_constraint_weights(constraints)
@@ -70,14 +89,37 @@ class Meter(Entity):
             resolve_optionality=resolve_optionality,
             exhaustive=exhaustive,
             parse_unit=parse_unit,
+            algorithm=algorithm,
+            k=k,
         )
+        # memo of the parses of each parse unit of the text being parsed
+        self._memo = None
+        self.num_memoized = 0
 
     @property
     def key(self):
         if self._key is None:
-            self._key = f"{self.nice_type_name}({encode_hash(serialize(self._attrs))})"
+            self._key = f"{self.nice_type_name}({encode_hash(serialize(self.key_attrs))})"
         return self._key
 
+    @property
+    def key_attrs(self) -> Dict[str, Any]:
+        """
+        The attributes which change the parses a meter finds, for its key.
+
+        The "fast", "array" and "lattice" algorithms find the same parses, so
+        are left out, as is k when unset: meters differing only in those
+        share their key, and with it their memoized and cached parses.
+
+        Returns:
+            dict: The attributes.
+        """
+        return {
+            k: v
+            for k, v in self._attrs.items()
+            if not (k == "algorithm" and v != "dp") and not (k == "k" and v is None)
+        }
+
     def to_dict(self, incl_attrs=True, **kwargs) -> Dict[str, Any]:
         """
         Convert the Meter object to JSON format.
@@ -117,11 +159,24 @@ class Meter(Entity):
         Returns:
             list: List of possible position types.
         """
-        max_w = nsylls if self.max_w is None else self.max_w
-        max_s = nsylls if self.max_s is None else self.max_s
-        wtypes = ["w" * n for n in range(1, max_w + 1)]
-        stypes = ["s" * n for n in range(1, max_s + 1)]
-        return wtypes + stypes
+        return list(get_position_types(nsylls, max_s=self.max_s, max_w=self.max_w))
+
+    def get_init_pos_types(self, wordtokens: "WordTokenVariant") -> List[str]:
+        """
+        Get the position types a parse of a wordtoken variant starts with.
+
+        These are the position types for the number of syllables of the first
+        wordtoken's chosen wordform.
+
+        Args:
+            wordtokens (WordTokenVariant): A row of the wordtoken matrix.
+
+        Returns:
+            list: List of possible position types.
+        """
+        wf = wordtokens.token_wordforms[0]
+        nsylls = len(wf) if wf is not None else wordtokens.wordtokens[0].num_sylls
+        return self.get_pos_types(nsylls=nsylls)
 
     def get_possible_scansions(self, nsylls: int):
         return get_possible_scansions(nsylls, max_s=self.max_s, max_w=self.max_w)
@@ -141,13 +196,15 @@ class Meter(Entity):
             return self.parse_text(entity, lim=lim)
 
     def parse_text(
-        self, text: "WordTokenList", num_proc=1, force: bool = False, lim=None
+        self, text: "WordTokenList", num_proc=1, force: bool = False, lim=None, pool=None
     ):
         from .parselists import ParseListList
 
         pll = ParseListList(parent=text)
         for i, pl in enumerate(
-            self.parse_text_iter(text, num_proc=num_proc, force=force, lim=lim)
+            self.parse_text_iter(
+                text, num_proc=num_proc, force=force, lim=lim, pool=pool
+            )
         ):
             pl._num = i + 1
             pll.append(pl)
@@ -155,28 +212,46 @@ class Meter(Entity):
         return pll
 
     def parse_text_iter(
-        self, text: "WordTokenList", num_proc=1, force: bool = False, lim=None
+        self, text: "WordTokenList", num_proc=1, force: bool = False, lim=None, pool=None
     ):
         parse_units = self.get_parse_units(text)
         if parse_units is None:
             log.warning(f"cannot parse {text}")
             return
-        if self.exhaustive: num_proc = 1 # @todo fix this
-        if num_proc != 0:
-            yield from stash.map(
-                self.parse_wordspan,
-                parse_units.data,
-                num_proc=num_proc,
-                total=lim,
-                _force=force,
-                desc=f"Parsing {self.parse_unit}s",
-                stash_map=False,
-            ).results_iter()
-        else:
-            for wordtokens in progress_bar(
-                parse_units[:lim], desc=f"Parsing {self.parse_unit}s"
-            ):
-                yield self.parse_wordspan(wordtokens)
+        if pool is None:
+            pool = get_active_pool()
+        if pool is None and num_proc is not None and num_proc > 1:
+            pool = get_parser_pool(num_proc)
+        cache = get_parse_cache() if caching_is_enabled() else None
+        # repeated parse units are parsed once per text
+        self._memo = {} if METER_MEMOIZE else None
+        self.num_memoized = 0
+        try:
+            if (pool is not None or cache is not None) and self.can_parse_tasks:
+                yield from self.parse_tasks_iter(
+                    parse_units.data[:lim], pool, cache=cache, force=force
+                )
+            elif num_proc != 0:
+                if self.exhaustive:
+                    # exhaustive parse lists are too large to pickle back
+                    num_proc = 1
+                yield from stash.map(
+                    self.parse_wordspan,
+                    parse_units.data,
+                    num_proc=num_proc,
+                    total=lim,
+                    _force=force,
+                    desc=f"Parsing {self.parse_unit}s",
+                    stash_map=False,
+                ).results_iter()
+            else:
+                for wordtokens in progress_bar(
+                    parse_units[:lim], desc=f"Parsing {self.parse_unit}s"
+                ):
+                    yield self.parse_wordspan(wordtokens)
+        finally:
+            self._memo = None
+        log.info(f"{self.num_memoized} {self.parse_unit}s served from memo")
 
     # @stash.stashed_result
     def parse_wordspan(self, wordtokens: "WordTokenList", **kwargs: Any) -> "ParseList":
@@ -197,19 +272,127 @@ class Meter(Entity):
                 wordtokens=wordtokens, type=self.parse_unit, parent=wordtokens
             )
 
-        if self.exhaustive:
+        memo_key = self.get_memo_key(wordtokens) if self._memo is not None else None
+        memo = parse_key = None
+        if memo_key is not None and memo_key in self._memo:
+            # the same words and wordforms: compare their syllable features too
+            memo = self._memo[memo_key]
+            if isinstance(memo, tuple):
+                memo_wordtokens, memo_parses = memo
+                memo = self._memo[memo_key] = {
+                    self.get_parse_key(memo_wordtokens): memo_parses
+                }
+            parse_key = self.get_parse_key(wordtokens)
+        if parse_key is not None and parse_key in memo:
+            self.num_memoized += 1
+            parses = self.clone_parses(memo[parse_key], wordtokens)
+        elif self.exhaustive:
             parses = self.parse_exhaustive(wordtokens)
+        elif self.algorithm == "array":
+            parses = self.parse_array(wordtokens)
+        elif self.algorithm == "dp":
+            parses = self.parse_dp(wordtokens)
+        elif self.algorithm == "lattice":
+            parses = self.parse_lattice(wordtokens)
         else:
             parses = self.parse_fast(wordtokens)
+        if memo is not None:
+            if parse_key is not None:
+                memo.setdefault(parse_key, parses)
+        elif memo_key is not None:
+            self._memo[memo_key] = (wordtokens, parses)
 
         wordtokens._parses = parses
         parses.register_objects()
         return parses
 
+    def get_memo_key(self, wordtokens: "WordTokenList") -> Optional[tuple]:
+        """
+        Get the key under which the parses of a wordtoken list are memoized.
+
+        The key is cheap to build: the normalized text and the IPA of each
+        token's wordforms. Only when two wordtoken lists share it are their
+        parse keys (see get_parse_key), which also cover their syllable
+        features, built and compared; so units which are not repeated cost
+        no more to parse than without the memo. Only meters which can parse
+        from ParseTasks memoize.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            tuple: The key, or None if the parses are not memoized.
+        """
+        if not self.can_parse_tasks:
+            return None
+        return (
+            " ".join(wordtokens.txt.lower().split()),
+            tuple(
+                tuple(wf.ipa for wf in tok.wordtype.children) if tok.has_wordform else ()
+                for tok in wordtokens
+            ),
+        )
+
+    def get_parse_key(self, wordtokens: "WordTokenList") -> Optional[str]:
+        """
+        Get the key of a wordtoken list's parses, as in the parse cache.
+
+        Wordtoken lists with the same words, wordform choices and syllable
+        features have the same parses, and the same key (see ParseCache.get_key).
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            str: The key, or None if the wordtokens have no ParseTask.
+        """
+        task = self.get_parse_task(wordtokens)
+        if task is None:
+            return None
+        return ParseCache.get_key(task, getattr(wordtokens.text, "lang", None))
+
+    def clone_parses(self, parses: ParseList, wordtokens: "WordTokenList") -> ParseList:
+        """
+        Copy the parses of one wordtoken list onto another with the same key.
+
+        Parses built from records are copied as new record-backed parses;
+        others are rebuilt from their positions' scansion, which evaluates
+        the constraints but does not search again. Ranks, bounding and the
+        number of pruned parses are kept.
+
+        Args:
+            parses (ParseList): The parses of a wordtoken list.
+            wordtokens (WordTokenList): A wordtoken list with the same memo key.
+
+        Returns:
+            ParseList: The parses, of the new wordtokens.
+        """
+        clones = []
+        for parse in parses:
+            wtl = wordtokens.get_wordtoken_variant(parse.wordtokens.wordform_idx)
+            if parse._record is not None:
+                clone = Parse.from_record(
+                    copy(parse._record), wtl, meter=self, bounded_by=parse.bounded_by
+                )
+            else:
+                clone = Parse(
+                    wtl,
+                    scansion=[mpos.meter_val * len(mpos.slots) for mpos in parse.positions],
+                    meter=self,
+                    is_bounded=parse.is_bounded,
+                    bounded_by=parse.bounded_by,
+                    rank=parse.parse_rank,
+                )
+            clones.append(clone)
+        clone_list = ParseList(clones, parent=wordtokens, **parses._attrs)
+        clone_list.num_pruned = parses.num_pruned
+        clone_list.num_pruned_unbounded = parses.num_pruned_unbounded
+        return clone_list
+
     def get_one_parse(self, wordtokens: "WordTokenList"):
         for wtl in wordtokens.iter_wordtoken_matrix():
             # log.debug(f"Processing wordtoken list: {wtl}")
-            for scansion in self.get_pos_types(nsylls=wtl[0].num_sylls):
+            for scansion in self.get_init_pos_types(wtl):
                 # log.debug(f"Creating parse with scansion: {scansion}")
                 parse = Parse(
                     wordtokens=wtl,
@@ -237,7 +420,7 @@ class Meter(Entity):
         parses = []
         for wtl in wordtokens.iter_wordtoken_matrix():
             # log.info(f"Processing wordtoken list: {wtl.sylls}")
-            for scansion in self.get_pos_types(nsylls=wtl[0].num_sylls):
+            for scansion in self.get_init_pos_types(wtl):
                 # log.debug(f"Creating parse with scansion: {scansion}")
                 parse = Parse(
                     wordtokens=wtl,
@@ -275,11 +458,640 @@ class Meter(Entity):
 
         # log.debug("Performing final bound and rank operations")
         parses.bound(progress=False)
-        parses.rank()
+        parses = self.select_parses(parses)
         wordtokens._parses = parses
         # log.debug(f"Returning ParseList with {len(parses)} parses")
         return wordtokens._parses
 
+    def select_parses(self, parses: ParseList) -> ParseList:
+        """
+        Rank a bounded ParseList, keeping only the k best parses if the meter sets k.
+
+        The k best are chosen by select_best rather than by sorting every
+        parse, and the returned ParseList records how many parses were
+        dropped (num_pruned) and how many of those were unbounded
+        (num_pruned_unbounded).
+
+        Args:
+            parses (ParseList): The parses, bounded.
+
+        Returns:
+            ParseList: The ranked parses.
+        """
+        if not self.k or len(parses) <= self.k:
+            parses.rank()
+            return parses
+        # sort keys cached during earlier bounding passes may predate is_bounded
+        for parse in parses:
+            parse.__dict__.pop("sort_key", None)
+        best = select_best(
+            parses.data,
+            self.k,
+            key=lambda parse: parse.sort_key,
+            prefix_key=lambda parse: (int(bool(parse.is_bounded)), parse.score),
+        )
+        for parse in best:
+            parse.parent = None
+        selected = ParseList(best, parent=parses.parent, **parses._attrs)
+        for i, parse in enumerate(selected):
+            parse.parse_rank = i + 1
+        selected.num_pruned = len(parses) - len(selected)
+        # (not ParseList.unbounded, which re-ranks parses by unique scansion)
+        selected.num_pruned_unbounded = sum(
+            not parse.is_bounded for parse in parses
+        ) - sum(not parse.is_bounded for parse in selected)
+        return selected
+
+    def can_rescore(self, meter: "Meter") -> bool:
+        """
+        Whether parses found with another meter can be rescored for this one.
+
+        Bounding compares violation sets, not scores, so meters differing
+        only in their constraint weights find and bound the same parses,
+        which only need new scores and ranks. An exhaustive parse also
+        keeps every scansion when constraints are added or removed, which
+        then only need bounding again. Neither holds when keeping the k
+        best parses, as which parses are kept depends on the weights.
+
+        Args:
+            meter (Meter): The meter the parses were found with.
+
+        Returns:
+            bool: True if Meter.rescore can turn them into this meter's parses.
+        """
+        attrs = {k: v for k, v in self._attrs.items() if k != "constraints"}
+        other = {k: v for k, v in meter._attrs.items() if k != "constraints"}
+        if attrs != other or self.k:
+            return False
+        return self.exhaustive or set(self.constraints) == set(meter.constraints)
+
+    def rescore(self, parses: ParseList) -> ParseList:
+        """
+        Rescore a copy of parses found with another meter for this one.
+
+        The meters should satisfy can_rescore. Violations already counted
+        are kept and only those of added constraints are computed: for parses
+        built from records, with the constraints' kernels over each wordtoken
+        variant at once. If the constraints changed the parses are bounded
+        again; they are then re-ranked, and registered under their new keys.
+
+        Args:
+            parses (ParseList): Parses found with another meter, left as
+                they are.
+
+        Returns:
+            ParseList: A copy of the parses, for this meter.
+        """
+        parses = parses.copy()
+        for ent in parses.iter_all():
+            # keys name the meter, so are built anew
+            ent._key = None
+        kernels = get_constraint_kernels(self.position_constraint_funcs)
+        weights = self.get_weights(kernels)
+        changed = False
+        tables = {}
+        for parse in parses:
+            changed = changed or set(parse.constraint_names) != set(self.constraints)
+            rec = parse._record
+            if rec is not None and not parse.is_materialized:
+                viol_counts = dict(zip(parse.position_constraints, rec.viol_counts))
+                violset_counts = dict(zip(parse.position_constraints, rec.violset_counts))
+                added = {
+                    cname: kernel
+                    for cname, kernel in kernels.items()
+                    if cname not in viol_counts
+                }
+                if added:
+                    key = (id(parse.wordtokens), tuple(added))
+                    if key not in tables:
+                        sylls = SyllableArrays.from_wordtokens(parse.wordtokens)
+                        tables[key] = PositionTable(
+                            sylls, self.get_pos_types(sylls.num_sylls), added
+                        )
+                    table = tables[key]
+                    rows = table.get_rows([table.pos_types.index(x) for x in rec.scansion])
+                    viol_counts.update(zip(added, table.viol_counts[rows].sum(axis=0)))
+                    violset_counts.update(zip(added, table.violsets[rows].sum(axis=0)))
+                rec.viol_counts = np.array([viol_counts[c] for c in kernels], dtype=np.int32)
+                rec.violset_counts = np.array(
+                    [violset_counts[c] for c in kernels], dtype=np.int32
+                )
+                rec.score = sum(int(n) * w for n, w in zip(rec.viol_counts, weights) if n)
+            parse.rescore(self)
+
+        if changed:
+            for parse in parses:
+                parse.is_bounded = False
+                parse.bounded_by = []
+            parses.bound(progress=False)
+            for parse in parses:
+                if parse._record is not None:
+                    parse._record.is_bounded = parse.is_bounded
+        for attr in list(parses.__dict__):
+            if isinstance(getattr(type(parses), attr, None), cached_property):
+                del parses.__dict__[attr]
+        parses.rank()
+        for parse in parses:
+            if parse._record is not None:
+                parse._record.rank = parse.parse_rank
+        parses.register_objects()
+        return parses
+
+    def get_weights(self, cnames: Iterator[str]) -> List[float]:
+        """
+        Get the weights of the given constraints.
+
+        Args:
+            cnames (iterable): Constraint names.
+
+        Returns:
+            list: The weight of each constraint, in the same order.
+        """
+        return [self.constraints[cname] for cname in cnames]
+
+    def applies_parse_constraints(self, wordtokens: "WordTokenList") -> bool:
+        """
+        Whether any parse-scope constraint applies to parses of these wordtokens.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            bool: True if a parse-scope constraint matches the wordtokens' scope.
+        """
+        return any(
+            cfunc.scope == wordtokens.prefix
+            for cfunc in self.parse_constraint_funcs.values()
+        )
+
+    def get_position_tables(self, wordtokens: "WordTokenList", kernels: Dict[str, Callable]):
+        """
+        Build the array-engine inputs for each row of the wordtoken matrix.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+            kernels (dict): Constraint kernels by name.
+
+        Returns:
+            tuple: Lists of the wordtoken variants, their PositionTables, their
+                initial position types, and their comparison group ids.
+        """
+        wtls, tables, init_types, group_ids = [], [], [], []
+        groups = {}
+        feat_cache = {}
+        for wtl in wordtokens.iter_wordtoken_matrix():
+            sylls = SyllableArrays.from_wordtokens(wtl, feat_cache=feat_cache)
+            wtls.append(wtl)
+            tables.append(
+                PositionTable(
+                    sylls,
+                    self.get_pos_types(sylls.num_sylls),
+                    kernels,
+                    wtl.wordform_idx,
+                )
+            )
+            init_types.append(self.get_init_pos_types(wtl))
+            group_ids.append(groups.setdefault(wtl.path, len(groups)))
+            if not self.resolve_optionality:
+                break
+        return wtls, tables, init_types, group_ids
+
+    @property
+    def can_parse_tasks(self) -> bool:
+        """
+        Whether parse units can be parsed from ParseTasks in worker processes.
+
+        Needs position constraints which all have vectorized kernels, as
+        workers only get syllable feature arrays, and constraints which
+        workers can import (see constraints.is_importable_constraint), as
+        they rebuild the meter.
+        """
+        return all(
+            getattr(cfunc, "kernel", None)
+            for cfunc in self.position_constraint_funcs.values()
+        ) and all(
+            is_importable_constraint(cfunc) for cfunc in self.constraint_funcs.values()
+        )
+
+    @cached_property
+    def task_attrs(self) -> Dict[str, Any]:
+        """
+        Settings to rebuild the meter with in a worker process.
+
+        Constraints are given by their full names, so that workers import the
+        modules of those defined outside prosodic.
+
+        Returns:
+            dict: The settings.
+        """
+        return {
+            **self._attrs,
+            "constraints": {
+                get_constraint(cname).path: weight
+                for cname, weight in self.constraints.items()
+            },
+        }
+
+    def get_parse_task(self, wordtokens: "WordTokenList") -> Optional[ParseTask]:
+        """
+        Build the compact input for parsing a wordtoken list in another process.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            ParseTask: The task, or None if the wordtokens must be parsed here
+                (too short, or a parse-scope constraint applies).
+        """
+        if wordtokens.num_sylls < 2 or self.applies_parse_constraints(wordtokens):
+            return None
+        task = ParseTask(self.key, self.task_attrs, txt=wordtokens.txt)
+        groups = {}
+        feat_cache = {}
+        for wtl in wordtokens.iter_wordtoken_matrix():
+            sylls = SyllableArrays.from_wordtokens(wtl, feat_cache=feat_cache)
+            # kernels only read the feature arrays
+            sylls.units = None
+            task.sylls.append(sylls)
+            task.wordform_idxs.append(wtl.wordform_idx)
+            task.init_types.append(self.get_init_pos_types(wtl))
+            task.group_ids.append(groups.setdefault(wtl.path, len(groups)))
+            if not self.resolve_optionality:
+                break
+        return task
+
+    def get_task_chunks(self, task: ParseTask) -> List[ParseTask]:
+        """
+        Split an exhaustive parse task into chunks of its scansion templates.
+
+        Tasks with more than METER_TEMPLATE_CHUNK_SIZE templates (counting
+        those of every variant) are split, so that the scansions of one long
+        line are spread over workers; see merge_template_chunks.
+
+        Args:
+            task (ParseTask): The parse unit's task.
+
+        Returns:
+            list: The task itself, or its chunks.
+        """
+        if not self.exhaustive:
+            return [task]
+        num = sum(
+            len(get_scansion_templates(sylls.num_sylls, self.max_s, self.max_w))
+            for sylls in task.sylls
+        )
+        if num <= METER_TEMPLATE_CHUNK_SIZE:
+            return [task]
+        chunks = []
+        for start in range(0, num, METER_TEMPLATE_CHUNK_SIZE):
+            chunk = copy(task)
+            chunk.rows = (start, min(start + METER_TEMPLATE_CHUNK_SIZE, num))
+            chunks.append(chunk)
+        return chunks
+
+    def search_records(
+        self,
+        tables: List[PositionTable],
+        init_types: List[List[str]],
+        group_ids: List[int],
+    ) -> Tuple[List[ParseRecord], Optional[List[int]], bool]:
+        """
+        Run the meter's array search over the PositionTables of a parse unit.
+
+        Every scansion template for an exhaustive meter, dynamic programming
+        for the "dp" algorithm, and branch and bound otherwise (which finds
+        the parses parse_fast and parse_lattice do).
+
+        Args:
+            tables (list): One PositionTable per wordtoken variant.
+            init_types (list): Initial position types of each variant.
+            group_ids (list): Comparison group of each variant.
+
+        Returns:
+            tuple: The records, filled in; the indices of those to build
+                parses for (None for all of them); and whether the search
+                completed.
+        """
+        weights = self.get_weights(self.position_constraint_funcs)
+        if self.exhaustive:
+            records = search_templates(tables, self.get_templates(tables), group_ids)
+            completed = True
+        elif self.algorithm == "dp":
+            records = search_dp(tables, group_ids)
+            completed = True
+        else:
+            records, completed = search_branch_and_bound(tables, init_types, group_ids)
+        fill_records(tables, records, weights)
+        return records, None, completed
+
+    def get_templates(self, tables: List[PositionTable]) -> List[ScansionTemplates]:
+        """
+        Get the scansion templates for the length of each variant.
+
+        Args:
+            tables (list): One PositionTable per wordtoken variant.
+
+        Returns:
+            list: The ScansionTemplates of each table's number of syllables.
+        """
+        return [
+            get_scansion_templates(table.num_sylls, self.max_s, self.max_w)
+            for table in tables
+        ]
+
+    def parse_tasks_iter(
+        self,
+        parse_units: List["WordTokenList"],
+        pool: Optional[ParserPool] = None,
+        cache: Optional[ParseCache] = None,
+        force: bool = False,
+    ) -> Iterator[ParseList]:
+        """
+        Parse wordtoken lists from ParseTasks, in a pool of workers or here.
+
+        Workers get each unit's syllable feature arrays and send back its
+        ParseRecords; parses are then built here on the existing wordtokens.
+        Repeats of a unit within the text are not searched again, but built
+        from copies of its records (see parse_text_iter). With a cache, units
+        whose records are cached are not searched either, and the records of
+        the rest are stored.
+        Units without a task are parsed here with parse_wordspan.
+
+        Args:
+            parse_units (list): The wordtoken lists to parse.
+            pool (ParserPool, optional): The pool of workers. Defaults to
+                searching in this process.
+            cache (ParseCache, optional): The cache of search results.
+            force (bool): Search units even if they are cached.
+
+        Yields:
+            ParseList: The parses of each unit, in order.
+        """
+        tasks = [self.get_parse_task(wordtokens) for wordtokens in parse_units]
+        if cache is not None:
+            needs_key = [True] * len(tasks)
+        elif self._memo is not None:
+            # without a cache, only units which may be repeats need their keys
+            memo_keys = [self.get_memo_key(wordtokens) for wordtokens in parse_units]
+            memo_key_counts = Counter(memo_keys)
+            needs_key = [
+                memo_key is not None and memo_key_counts[memo_key] > 1
+                for memo_key in memo_keys
+            ]
+        else:
+            needs_key = [False] * len(tasks)
+        keys = [
+            ParseCache.get_key(task, getattr(wordtokens.text, "lang", None))
+            if needed and task is not None
+            else None
+            for wordtokens, task, needed in zip(parse_units, tasks, needs_key)
+        ]
+        key_counts = Counter(keys)
+        cached, seen = [], set()
+        for key in keys:
+            if key is None:
+                cached.append(None)
+            elif key in seen:
+                # a repeat, copied from its first occurrence
+                cached.append(True)
+            else:
+                seen.add(key)
+                cached.append(cache.get(key) if cache is not None and not force else None)
+        chunks = []
+        for task, result in zip(tasks, cached):
+            if task is None or result is not None:
+                chunks.append([])
+            elif pool is None:
+                chunks.append([task])
+            else:
+                chunks.append(self.get_task_chunks(task))
+        jobs = [chunk for unit_chunks in chunks for chunk in unit_chunks]
+        results = pool.map(parse_task, jobs) if pool is not None else map(parse_task, jobs)
+        repeated = {}
+        try:
+            for wordtokens, task, key, result, unit_chunks in progress_bar(
+                list(zip(parse_units, tasks, keys, cached, chunks)),
+                desc=f"Parsing {self.parse_unit}s",
+            ):
+                if task is None:
+                    yield self.parse_wordspan(wordtokens)
+                    continue
+                if result is True:
+                    self.num_memoized += 1
+                    result = repeated[key]
+                elif result is None:
+                    if len(unit_chunks) > 1:
+                        records = merge_template_chunks(
+                            [next(results) for _ in unit_chunks],
+                            [sylls.num_sylls for sylls in task.sylls],
+                            task.group_ids,
+                        )
+                        result = records, None, True
+                    else:
+                        result = next(results)
+                    if cache is not None:
+                        cache.set(key, result, txt=task.txt, meter_key=self.key)
+                if key is not None and key_counts[key] > 1:
+                    # records are updated by their parses (e.g. when rescored)
+                    repeated.setdefault(key, result)
+                    records, select, completed = result
+                    result = [copy(rec) for rec in records], select, completed
+                records, select, completed = result
+                if not completed:
+                    log.error(f"did not complete parsing: {wordtokens}")
+                wtls = list(itertools.islice(wordtokens.iter_wordtoken_matrix(), len(task)))
+                parses = self.parses_from_records(wordtokens, wtls, records, select=select)
+                wordtokens._parses = parses
+                parses.register_objects()
+                yield parses
+        finally:
+            if cache is not None:
+                cache.flush()
+
+    def parses_from_records(
+        self,
+        wordtokens: "WordTokenList",
+        wtls: Sequence["WordTokenList"],
+        records: List[ParseRecord],
+        select: Optional[List[int]] = None,
+    ) -> ParseList:
+        """
+        Build a ranked ParseList from the records of an array search.
+
+        The parses are built from their records, so their positions and
+        slots are only created if they are asked for. If the meter sets k,
+        only the k best of the selected records become parses, chosen by
+        select_best on the records' sort keys.
+
+        Args:
+            wordtokens (WordTokenList): The words parsed.
+            wtls (list or dict): The wordtoken variants, by the records' variant index.
+            records (list): The records of the search, filled in by fill_records.
+                Records bounding a selected one must be filled in too.
+            select (list, optional): Indices of the records to build parses
+                for. Defaults to all of them.
+
+        Returns:
+            ParseList: List of parses for the line.
+        """
+        if select is None:
+            select = range(len(records))
+        select = list(select)
+        num_found = len(select)
+        num_found_unbounded = sum(not records[i].is_bounded for i in select)
+        if self.k:
+            select = select_best(
+                select,
+                self.k,
+                key=lambda i: records[i].sort_key,
+                prefix_key=lambda i: (int(records[i].is_bounded), records[i].score),
+            )
+        parses = []
+        for rec_i in select:
+            rec = records[rec_i]
+            bounded_by = [
+                (records[i].meter_str, records[i].stress_str) for i in rec.bounded_by
+            ]
+            parses.append(
+                Parse.from_record(
+                    rec, wordtokens=wtls[rec.variant], meter=self, bounded_by=bounded_by
+                )
+            )
+
+        parses = ParseList(parses, parse_unit=self.parse_unit, parent=wordtokens)
+        parses.rank()
+        for parse in parses:
+            parse._record.rank = parse.parse_rank
+        parses.num_pruned = num_found - len(parses)
+        parses.num_pruned_unbounded = num_found_unbounded - sum(
+            not parse.is_bounded for parse in parses
+        )
+        return parses
+
+    def parse_array(self, wordtokens: "WordTokenList") -> ParseList:
+        """
+        Parse a line with the array-backed version of the fast parsing method.
+
+        Syllable features are read once into NumPy arrays, the violations of
+        every possible position are computed in bulk, and the branch-and-bound
+        search runs over integer arrays. Parse objects are only built for the
+        parses left at the end, which are the same as those of parse_fast.
+        Constraints without a vectorized kernel are called once per possible
+        position instead. Falls back to parse_fast when a parse-scope
+        constraint applies.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            ParseList: List of parses for the line.
+        """
+        if self.applies_parse_constraints(wordtokens):
+            return self.parse_fast(wordtokens)
+        kernels = get_constraint_kernels(self.position_constraint_funcs)
+
+        wtls, tables, init_types, group_ids = self.get_position_tables(
+            wordtokens, kernels
+        )
+        records, select, completed = self.search_records(tables, init_types, group_ids)
+        if not completed:
+            log.error(f"did not complete parsing: {wordtokens}")
+        parses = self.parses_from_records(wordtokens, wtls, records, select=select)
+        wordtokens._parses = parses
+        return wordtokens._parses
+
+    def parse_dp(self, wordtokens: "WordTokenList") -> ParseList:
+        """
+        Parse a line by dynamic programming over syllables.
+
+        For every syllable index and kind of last position (weak or strong),
+        only the partial scansions not harmonically bounded by another
+        reaching the same state are extended. Since position-scope violations
+        add up over positions, the complete scansions left unbounded are
+        those exhaustive parsing would leave unbounded, found in time linear
+        in the number of syllables. As with the other algorithms, the parses
+        returned are those complete scansions, with the bounded ones marked
+        (or if the meter sets k, the k best). The unbounded parses are those
+        of parse_fast; the bounded ones are only those that survived to the
+        end, which are fewer. Falls back to parse_fast when a parse-scope
+        constraint (which need not add up over positions) applies.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            ParseList: List of parses for the line.
+        """
+        if self.applies_parse_constraints(wordtokens):
+            return self.parse_fast(wordtokens)
+        kernels = get_constraint_kernels(self.position_constraint_funcs)
+
+        wtls, tables, init_types, group_ids = self.get_position_tables(
+            wordtokens, kernels
+        )
+        records, select, _ = self.search_records(tables, init_types, group_ids)
+        parses = self.parses_from_records(wordtokens, wtls, records, select=select)
+        wordtokens._parses = parses
+        return wordtokens._parses
+
+    def parse_lattice(self, wordtokens: "WordTokenList") -> ParseList:
+        """
+        Parse a line with the array search run once over a wordform lattice.
+
+        Instead of searching each row of the wordtoken matrix separately, a
+        single search branches on a token's wordforms when a position first
+        reaches it, so the positions and bounding shared by rows with the
+        same wordforms so far are computed once. Wordtoken variants are only
+        built for rows with parses at the end. The parses, their bounding
+        and ranking are the same as those of parse_fast. Falls back to
+        parse_fast when a parse-scope constraint applies.
+
+        Args:
+            wordtokens (WordTokenList): The words to parse.
+
+        Returns:
+            ParseList: List of parses for the line.
+        """
+        if self.applies_parse_constraints(wordtokens):
+            return self.parse_fast(wordtokens)
+        kernels = get_constraint_kernels(self.position_constraint_funcs)
+
+        first_only = not self.resolve_optionality
+        alternatives = [
+            tok.wordforms[:1] if first_only else tok.wordforms
+            for tok in wordtokens
+            if tok.has_wordform
+        ]
+        nsylls = sum(max(len(wf) for wf in wfs) for wfs in alternatives)
+        lattice = WordformLattice(
+            wordtokens, self.get_pos_types(nsylls), kernels, first_only=first_only
+        )
+        # as in parse_fast, start from the position types for the first token
+        first = wordtokens[0]
+        init_types = (
+            [self.get_pos_types(nsylls=len(wf)) for wf in alternatives[0]]
+            if first.has_wordform
+            else [self.get_pos_types(nsylls=first.num_sylls)] * len(alternatives[0])
+        )
+        records, completed = search_lattice(lattice, init_types)
+        if not completed:
+            log.error(f"did not complete parsing: {wordtokens}")
+        lattice.fill_records(records, self.get_weights(kernels))
+
+        # in the order parse_fast finds them: by matrix row, then scansion
+        select = sorted(
+            (i for i, rec in enumerate(records) if rec.variant >= 0),
+            key=lambda i: (records[i].variant, records[i].path),
+        )
+        wtls = {}
+        for i in select:
+            rec = records[i]
+            if rec.variant not in wtls:
+                wtls[rec.variant] = wordtokens.get_wordtoken_variant(rec.wordform_idx)
+        parses = self.parses_from_records(wordtokens, wtls, records, select=select)
+        wordtokens._parses = parses
+        return wordtokens._parses
+
     # slower, exhaustive parser
 
     # def parse_exhaustive(self, line: Line, progress: Optional[bool] = None) -> ParseList:
@@ -329,11 +1141,18 @@ class Meter(Entity):
         self, wordtokens: "WordTokenList", progress: Optional[bool] = None
     ) -> ParseList:
         """
-        Parse a line using the fast parsing method.
+        Parse a line by evaluating every possible scansion.
+
+        The possible scansions of each length come from precomputed scansion
+        templates, whose violations are summed from the variant's
+        PositionTable, so no Parse is built until the parses are returned
+        (and those only build their positions when asked). Falls back to
+        building every Parse when a parse-scope constraint applies.
 
         Args:
-            line (Line): The line to parse.
-            force (bool, optional): Force parsing even if cached. Defaults to False.
+            wordtokens (WordTokenList): The words to parse.
+            progress (bool, optional): Whether to show progress when building
+                every Parse.
 
         Returns:
             ParseList: List of parses for the line.
@@ -341,7 +1160,16 @@ class Meter(Entity):
         from .parses import Parse
         from .parselists import ParseList
 
-        # log.debug(f"Starting parse_fast for wordtokens: {wordtokens}")
+        if not self.applies_parse_constraints(wordtokens):
+            kernels = get_constraint_kernels(self.position_constraint_funcs)
+            wtls, tables, init_types, group_ids = self.get_position_tables(
+                wordtokens, kernels
+            )
+            records, _, _ = self.search_records(tables, init_types, group_ids)
+            parses = self.parses_from_records(wordtokens, wtls, records)
+            wordtokens._parses = parses
+            return wordtokens._parses
+
         parses = []
         for wtl in wordtokens.iter_wordtoken_matrix():
             for scansion in progress_bar(
@@ -361,6 +1189,42 @@ class Meter(Entity):
         parses = ParseList(parses, parse_unit=self.parse_unit, parent=wordtokens)
 
         parses.bound(progress=False)
-        parses.rank()
+        parses = self.select_parses(parses)
         wordtokens._parses = parses
         return wordtokens._parses
+
+
+TASK_METERS = {}
+
+
+def parse_task(task: ParseTask) -> tuple:
+    """
+    Search one parse unit from its ParseTask, in a worker process.
+
+    The meter is rebuilt from the task's settings once per worker and
+    cached by its key.
+
+    Args:
+        task (ParseTask): The parse unit's compact input.
+
+    Returns:
+        tuple: The output of Meter.search_records: the filled-in records,
+            the indices of those to build parses for, and whether the
+            search completed. For a chunk of an exhaustive parse, the output
+            of search_template_chunk instead, with the records filled in.
+    """
+    meter = TASK_METERS.get(task.meter_key)
+    if meter is None:
+        meter = TASK_METERS[task.meter_key] = Meter(**task.meter_attrs)
+    kernels = get_constraint_kernels(meter.position_constraint_funcs)
+    tables = [
+        PositionTable(sylls, meter.get_pos_types(sylls.num_sylls), kernels, wf_idx)
+        for sylls, wf_idx in zip(task.sylls, task.wordform_idxs)
+    ]
+    if task.rows is None:
+        return meter.search_records(tables, task.init_types, task.group_ids)
+    records, skylines = search_template_chunk(
+        tables, meter.get_templates(tables), task.group_ids, *task.rows
+    )
+    fill_records(tables, records, meter.get_weights(kernels))
+    return records, skylines
@@ -13,12 +13,16 @@ class ParseList(EntityList):
         show_bounded (bool): Whether to show bounded parses.
         is_scansions (bool): Whether this list represents scansions.
         line (Optional[Line]): The Line object this ParseList is associated with.
+        num_pruned (int): Parses found but dropped because the meter keeps only its k best.
+        num_pruned_unbounded (int): How many of the dropped parses were unbounded.
     """
 
     index_name: str = "parse"
     prefix: str = "parselist"
     show_bounded: bool = False
     is_scansions: bool = False
+    num_pruned: int = 0
+    num_pruned_unbounded: int = 0
 
     # def __init__(self, *args: Any, wordtokens: Optional['WordTokenList'] = None, **kwargs: Any) -> None:
     #     """
@@ -62,7 +66,10 @@ class ParseList(EntityList):
         )
         assert new_parses.parent is parent
         new_parses.bound(progress=False)
-        new_parses.rank()
+        if new_parses:
+            # rank, keeping only the k best combinations if the meter sets k
+            new_parses = new_parses[0].meter_obj.select_parses(new_parses)
+        assert new_parses.parent is parent
         new_parses.register_objects()
         return new_parses
 
@@ -87,14 +94,10 @@ class ParseList(EntityList):
         return cls(children=children, parent=parent, **cls_data)
 
     @property
-    def key(self):
-        if self._key is not None:
-            return self._key
-        key = f"""{self.parent.key}.{self.nice_type_name}"""
+    def key_parts(self):
         if self.children:
-            key += f".{self.children[0].meter_obj.key}"
-        self._key = key
-        return key
+            return (self.nice_type_name, self.children[0].meter_obj.key)
+        return (self.nice_type_name,)
 
     @property
     def num_parses(self) -> int:
@@ -259,6 +262,10 @@ class ParseList(EntityList):
         """
         Bound the parses in this ParseList.
 
+        Each unbounded parse's violation set is encoded as a vector of counts
+        over the meter's constraints, and parses harmonically bounded by a
+        comparable parse (see bound_violsets) are marked as bounded.
+
         Args:
             progress: Whether to show progress during bounding.
 
@@ -266,25 +273,35 @@ class ParseList(EntityList):
             A ParseList containing unbounded parses after bounding.
         """
         parses = [p for p in self.data if not p.is_bounded]
+        cnames = list(
+            dict.fromkeys(
+                cname
+                for parse in parses
+                for cname in [*parse.constraint_names, *parse.violset]
+            )
+        )
+        viols = np.zeros((len(parses), len(cnames)), dtype=np.int64)
         iterr = tqdm(parses, desc="Bounding parses", disable=not progress, position=0)
         for parse_i, parse in enumerate(iterr):
-            # parse.init()
-            if parse.is_bounded:
-                continue
-            for comp_parse in parses[parse_i + 1 :]:
-                if comp_parse.is_bounded:
-                    continue
-                if not parse.can_compare(comp_parse):
-                    continue
-                relation = parse.bounding_relation(comp_parse)
-                if relation == Bounding.bounded:
-                    parse.is_bounded = True
-                    parse.bounded_by.append(
-                        (comp_parse.meter_str, comp_parse.stress_str)
-                    )
-                elif relation == Bounding.bounds:
-                    comp_parse.is_bounded = True
-                    comp_parse.bounded_by.append((parse.meter_str, parse.stress_str))
+            violset = parse.violset
+            viols[parse_i] = [violset[cname] for cname in cnames]
+        wordtokens_keys = {}
+        bounded, bounded_by = bound_violsets(
+            viols,
+            [
+                wordtokens_keys.setdefault(parse.wordtokens_key, len(wordtokens_keys))
+                for parse in parses
+            ],
+            [parse.num_slots_positioned for parse in parses],
+            [parse.is_complete for parse in parses],
+        )
+        for parse, is_bounded, comp_is in zip(parses, bounded, bounded_by):
+            if is_bounded:
+                parse.is_bounded = True
+                parse.bounded_by = parse.bounded_by + [
+                    (parses[comp_i].meter_str, parses[comp_i].stress_str)
+                    for comp_i in comp_is
+                ]
         self._bound_init = True
         return self.unbounded
 
@@ -292,6 +309,9 @@ class ParseList(EntityList):
         """
         Rank the parses in this ParseList.
         """
+        # sort keys cached during earlier bounding passes may predate is_bounded
+        for parse in self.data:
+            parse.__dict__.pop("sort_key", None)
         self.data.sort()
         for i, parse in enumerate(self.data):
             parse.parse_rank = i + 1
@@ -621,14 +641,10 @@ class ParseListList(EntityList):
         super().append(parse_list)
     
     @property
-    def key(self):
-        if self._key is not None:
-            return self._key
-        key = f"""{self.parent.key}.{self.nice_type_name}"""
+    def key_parts(self):
         if self.children and self.children[0]:
-            key += f".{self.children[0][0].meter_obj.key}"
-        self._key = key
-        return key
+            return (self.nice_type_name, self.children[0][0].meter_obj.key)
+        return (self.nice_type_name,)
 
     @property
     def scansions(self):
@@ -30,6 +30,7 @@ class Parse(Entity):
         _line_num (Optional[int]): The line number.
         _stanza_num (Optional[int]): The stanza number.
         _line_txt (str): The text of the line.
+        _record (Optional[ParseRecord]): The search record this parse was built from.
 
     Args:
         wordforms_or_str (Union[str, List, WordFormList]): The word forms or string to parse.
@@ -43,6 +44,8 @@ class Parse(Entity):
         line_num (Optional[int]): The line number.
         stanza_num (Optional[int]): The stanza number.
         line_txt (str): The text of the line.
+        record (Optional[ParseRecord]): A search record to build the parse from;
+            its positions are then only built when first accessed.
     """
 
     prefix: str = "parse"
@@ -62,6 +65,7 @@ class Parse(Entity):
         num=None,
         scope=None,
         num_slots_positioned=0,
+        record: Optional["ParseRecord"] = None,
         **meter_kwargs,
         # line_num: Optional[int] = None,
         # stanza_num: Optional[int] = None,
@@ -69,7 +73,6 @@ class Parse(Entity):
     ) -> None:
         from .meter import Meter
 
-        global OBJECTS
         # meter
         # if meter is None and parent:
         # meter = parent.meter
@@ -117,6 +120,12 @@ class Parse(Entity):
         self.parse_rank = rank
         self.num_slots_positioned = num_slots_positioned
         self.parse_viold = Counter(parse_viold)
+        self._record = record
+        if record is not None and not children:
+            # positions and slots are built from the scansion on first access
+            self._children = None
+            self.num_slots_positioned = sum(len(mpos_str) for mpos_str in self.scansion)
+            return
         self.children = ParsePositionList() if not children else children
         self.children.parent = self
         if not self.children:
@@ -124,6 +133,93 @@ class Parse(Entity):
                 self.extend(mpos_str)
         self.init()
 
+    @classmethod
+    def from_record(
+        cls,
+        record: "ParseRecord",
+        wordtokens: "WordTokenList",
+        meter: "Meter",
+        bounded_by: Optional[List] = None,
+    ) -> "Parse":
+        """
+        Create a parse from a record of the array engines.
+
+        The parse's score, violations, sort key and meter and stress strings
+        are read from the record; its positions and slots are only built when
+        they are first accessed (e.g. for `positions`, `slots` or HTML).
+
+        Args:
+            record (ParseRecord): A complete record, filled in by fill_records.
+            wordtokens (WordTokenList): The wordtoken variant the record refers to.
+            meter (Meter): The meter used for parsing.
+            bounded_by (Optional[List]): What bounds this parse.
+
+        Returns:
+            Parse: A new Parse object.
+        """
+        return cls(
+            wordtokens,
+            scansion=list(record.scansion),
+            meter=meter,
+            is_bounded=record.is_bounded,
+            bounded_by=bounded_by,
+            rank=record.rank,
+            record=record,
+        )
+
+    @property
+    def children(self) -> "ParsePositionList":
+        if self._children is None:
+            self.materialize()
+        return self._children
+
+    @children.setter
+    def children(self, children: "ParsePositionList") -> None:
+        self._children = children
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the positions and slots of this parse have been built."""
+        return self.__dict__.get("_children") is not None
+
+    def materialize(self) -> None:
+        """Build the positions and slots of a parse created from a record."""
+        self._children = ParsePositionList(parent=self)
+        self.num_slots_positioned = 0
+        for mpos_str in self.scansion:
+            self.extend(mpos_str)
+        self.init()
+
+    def _iter_all(self, prune=None):
+        # don't build the positions of a parse just to register them
+        if self.is_materialized:
+            yield from super()._iter_all(prune)
+        elif prune is None or not prune(self):
+            yield self
+
+    def copy(self) -> "Parse":
+        """
+        Copy the parse, with its record, positions and slots, e.g. to rescore
+        it for another meter (see Meter.rescore) without changing it. The
+        positions of a parse not yet materialized are not built.
+
+        Returns:
+            Parse: The copy.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self._get_copy_state())
+        new.parse_viold = Counter(self.parse_viold)
+        new.bounded_by = list(self.bounded_by)
+        if self._record is not None:
+            new._record = copy(self._record)
+        if self.is_materialized:
+            new._children = ParsePositionList(parent=new)
+            for mpos in self._children:
+                new_mpos = mpos.copy()
+                new_mpos.parent = None
+                new._children.append(new_mpos)
+        return new
+
     @property
     def positions(self):
         return self.children
@@ -143,6 +239,42 @@ class Parse(Entity):
                 assert isinstance(res, bool), "Parse constraints must return True/False"
                 self.parse_viold[cname] = int(res)
 
+    def rescore(self, meter: "Meter") -> None:
+        """
+        Switch the parse to a meter differing only in its constraints.
+
+        Violations of constraints the parse was already scored on are kept:
+        those of dropped constraints are removed, and only those of added
+        constraints are computed. Cached scores and sort keys are cleared.
+        Parses built from a record need their record rescored first (see
+        Meter.rescore). Bounding is left to the ParseList.
+
+        Args:
+            meter (Meter): The new meter.
+        """
+        dropped = set(self.constraint_names) - set(meter.constraints)
+        self.meter_obj = meter
+        self.constraint_names = list(meter.constraints.keys())
+        self.parse_constraints = meter.parse_constraint_funcs
+        self.position_constraints = meter.position_constraint_funcs
+        self.constraint_weights = meter.constraints
+        self._key = None
+        for attr in list(self.__dict__):
+            if isinstance(getattr(type(self), attr, None), cached_property):
+                del self.__dict__[attr]
+        for cname in dropped:
+            self.parse_viold.pop(cname, None)
+        if self.is_materialized:
+            for slot in self.slots:
+                for cname in dropped:
+                    slot.viold.pop(cname, None)
+            # positions shared with concatenated parses keep their first
+            # parse, so are passed this parse's constraints; only those the
+            # slots have no violations for are computed
+            for mpos in self.positions:
+                mpos.init(constraints=self.position_constraints)
+        self.apply_parse_constraints()
+
     def to_dict(self, **kwargs) -> Dict[str, Any]:
         """
         Convert the parse to a JSON-serializable dictionary.
@@ -208,12 +340,11 @@ class Parse(Entity):
         return Parse(wordtokens, children=children, meter=meter, **data)
 
     @property
-    def key(self):
-        if self._key is not None:
-            return self._key
-        key = f"""{self.parent.key}.{self.nice_type_name}(scansion="{self.meter_str}",stress="{self.stress_str}").{self.meter_obj.key}"""
-        self._key = key
-        return key
+    def key_parts(self):
+        return (
+            f"""{self.nice_type_name}(scansion="{self.meter_str}",stress="{self.stress_str}")""",
+            self.meter_obj.key,
+        )
 
     @property
     def slots(self) -> List["ParseSlot"]:
@@ -255,7 +386,9 @@ class Parse(Entity):
             [mpos for parse in parses for mpos in parse.positions],
             parent=parses[0].parent,
         )
-        wordtokens_limited = [wt for parse in parses for wt in parse.wordtokens]
+        wordtokens_limited = [
+            wt for parse in parses for wt in parse.wordtokens.materialize()
+        ]
         if wordtokens is not None:
             wordtokens = wordtokens.copy()
             wordtokens.children = wordtokens_limited
@@ -308,6 +441,10 @@ class Parse(Entity):
 
     @cached_property
     def positions_viold(self):
+        if not self.is_materialized:
+            return Counter(
+                dict(zip(self.position_constraints, map(int, self._record.viol_counts)))
+            )
         viold = Counter()
         for position in self.positions:
             for cname, cviol in position.viold.items():
@@ -338,8 +475,19 @@ class Parse(Entity):
             Multiset: A multiset of constraint violations.
         """
         s = Multiset()
-        for mpos in self.positions:
-            s.update(mpos.violset)
+        if not self.is_materialized:
+            s.update(
+                {
+                    cname: int(n)
+                    for cname, n in zip(
+                        self.position_constraints, self._record.violset_counts
+                    )
+                    if n
+                }
+            )
+        else:
+            for mpos in self.positions:
+                s.update(mpos.violset)
         s.update(self.parse_violset)
         return s
 
@@ -398,10 +546,14 @@ class Parse(Entity):
         Returns:
             tuple: A tuple used for sorting parses.
         """
+        if not self.is_materialized:
+            first_prom = self.scansion[0][0] == "s"
+        else:
+            first_prom = self.positions[0].is_prom if self.positions else 10
         return (
             int(bool(self.is_bounded)),
             self.score,
-            self.positions[0].is_prom if self.positions else 10,
+            first_prom,
             self.average_position_size,
             self.num_stressed_sylls,
             self.meter_ints,
@@ -436,7 +588,7 @@ class Parse(Entity):
 
     @cached_property
     def wordtokens_key(self):
-        return self.wordtokens.key
+        return self.wordtokens.path
 
     def can_compare(self, other: "Parse", min_slots: int = 4) -> bool:
         """
@@ -481,6 +633,8 @@ class Parse(Entity):
         Returns:
             int: Number of stressed syllables.
         """
+        if not self.is_materialized:
+            return self._record.stress_str.count("+")
         return len(
             [slot for mpos in self.positions for slot in mpos.slots if slot.is_stressed]
         )
@@ -661,6 +815,8 @@ class Parse(Entity):
         Returns:
             float: Average position size.
         """
+        if not self.is_materialized:
+            return np.mean([len(mpos_str) for mpos_str in self.scansion])
         l = [len(mpos.children) for mpos in self.positions if mpos.children]
         return np.mean(l) if len(l) else np.nan
 
@@ -739,6 +895,11 @@ class Parse(Entity):
         Returns:
             str: Meter string representation.
         """
+        if not self.is_materialized:
+            return "".join(
+                ("+" if mpos_str[0] == "s" else "-") * len(mpos_str)
+                for mpos_str in self.scansion
+            )
         return "".join(
             "+" if mpos.is_prom else "-"
             for mpos in self.positions
@@ -756,6 +917,8 @@ class Parse(Entity):
         Returns:
             tuple: Tuple of integers representing the meter.
         """
+        if not self.is_materialized:
+            return tuple(int(x == "+") for x in self.meter_str)
         return tuple(
             int(mpos.is_prom) for mpos in self.positions for slot in mpos.slots
         )
@@ -771,6 +934,8 @@ class Parse(Entity):
         Returns:
             tuple: Tuple of integers representing the stress pattern.
         """
+        if not self.is_materialized:
+            return tuple(int(x == "+") for x in self._record.stress_str)
         return tuple(int(slot.is_stressed) for slot in self.slots)
 
     @property
@@ -784,6 +949,8 @@ class Parse(Entity):
         Returns:
             str: Stress string representation.
         """
+        if not self.is_materialized:
+            return self._record.stress_str
         return "".join(
             "+" if slot.is_stressed else "-"
             for mpos in self.positions
@@ -0,0 +1,172 @@
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import atexit
+from ..imports import *
+
+
+class ParserPool:
+    """
+    A long-lived pool of worker processes for parsing.
+
+    Workers are started once and kept for repeated jobs: each imports
+    prosodic and loads its language models when it starts, rather than on
+    the first job it gets. Jobs are sent to the workers in batches (of
+    ParseTasks, see Meter.parse_tasks_iter), which the workers take from
+    the executor's queue as they finish the last.
+
+    A ParserPool can be passed to TextModel.parse and Meter.parse_text, or
+    made the pool used for every parse with `prosodic.pool()`. Like any
+    spawned processes, workers re-import the main module, so scripts should
+    start pools under `if __name__ == "__main__":`.
+
+    Args:
+        num_proc (int, optional): Number of worker processes. Defaults to one
+            fewer than the number of CPUs.
+        batch_size (int): Number of jobs sent to a worker at once.
+        langs (list): Languages whose models the workers load on start.
+    """
+
+    def __init__(
+        self,
+        num_proc: Optional[int] = None,
+        batch_size: int = POOL_BATCH_SIZE,
+        langs: Sequence[str] = (DEFAULT_LANG,),
+    ) -> None:
+        self.num_proc = num_proc if num_proc else max(1, mp.cpu_count() - 1)
+        self.batch_size = batch_size
+        self.langs = tuple(langs)
+        self._executor = None
+
+    def __repr__(self) -> str:
+        state = "running" if self.is_running else "stopped"
+        return f"ParserPool(num_proc={self.num_proc}, {state})"
+
+    def __enter__(self) -> "ParserPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> "ParserPool":
+        """
+        Start the workers, and wait until they have loaded their models.
+
+        Returns:
+            ParserPool: The pool itself.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_proc,
+                mp_context=mp.get_context("spawn"),
+                initializer=init_pool_worker,
+                initargs=(self.langs,),
+            )
+            # workers start on demand, so give each one a job now
+            for future in [
+                self._executor.submit(os.getpid) for _ in range(self.num_proc)
+            ]:
+                future.result()
+        return self
+
+    def close(self) -> None:
+        """Shut the workers down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map(self, func: Callable, items: Sequence[Any]) -> Iterator[Any]:
+        """
+        Call a function on every item in the workers, in batches.
+
+        Args:
+            func (callable): A picklable (module-level) function of one item.
+            items (list): The items.
+
+        Yields:
+            The result for each item, in order.
+        """
+        items = list(items)
+        if not items:
+            return
+        self.start()
+        futures = [
+            self._executor.submit(run_pool_batch, func, items[i : i + self.batch_size])
+            for i in range(0, len(items), self.batch_size)
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+def init_pool_worker(langs: Sequence[str]) -> None:
+    """Load the language models of a new ParserPool worker."""
+    for lang in langs:
+        Language(lang).token2ipa
+
+
+def run_pool_batch(func: Callable, items: List[Any]) -> List[Any]:
+    return [func(item) for item in items]
+
+
+POOLS = {}
+ACTIVE_POOL = None
+
+
+def get_parser_pool(num_proc: Optional[int] = None) -> ParserPool:
+    """
+    Get the shared pool for parsing with a number of processes.
+
+    The pool is started on first use and kept for the rest of the session.
+
+    Args:
+        num_proc (int, optional): Number of worker processes.
+
+    Returns:
+        ParserPool: The pool.
+    """
+    if num_proc not in POOLS:
+        POOLS[num_proc] = ParserPool(num_proc)
+    return POOLS[num_proc]
+
+
+def get_active_pool() -> Optional[ParserPool]:
+    """The pool made active with `prosodic.pool()`, if any."""
+    return ACTIVE_POOL
+
+
+@contextmanager
+def pool(num_proc: Optional[int] = None, **kwargs: Any) -> Iterator[ParserPool]:
+    """
+    Parse with a pool of warm worker processes within a `with` block.
+
+    Every parse in the block which can be sent to workers is, whatever
+    num_proc it is given:
+
+        with prosodic.pool(4):
+            for txt in texts:
+                prosodic.TextModel(txt).parse()
+
+    Args:
+        num_proc (int, optional): Number of worker processes.
+        **kwargs: Other ParserPool arguments.
+
+    Yields:
+        ParserPool: The pool, started.
+    """
+    global ACTIVE_POOL
+    parser_pool = ParserPool(num_proc, **kwargs).start()
+    prev_pool, ACTIVE_POOL = ACTIVE_POOL, parser_pool
+    try:
+        yield parser_pool
+    finally:
+        ACTIVE_POOL = prev_pool
+        parser_pool.close()
+
+
+@atexit.register
+def close_parser_pools() -> None:
+    for parser_pool in POOLS.values():
+        parser_pool.close()
@@ -53,14 +53,22 @@ class ParsePosition(Entity):
     def num_slots(self):
         return len(self.children)
 
-    def init(self, force=False) -> None:
-        """Initialize violations for this position."""
+    def init(self, force=False, constraints=None) -> None:
+        """Initialize violations for this position.
+
+        Args:
+            force (bool): Recompute violations the slots already have.
+            constraints (dict, optional): Position constraints to apply.
+                Defaults to those of the position's parse.
+        """
         assert self.parse
         if any(not slot.unit for slot in self.slots):
             print(self.slots)
             print([slot.__dict__ for slot in self.slots])
             raise Exception
-        for cname, constraint in self.parse.position_constraints.items():
+        if constraints is None:
+            constraints = self.parse.position_constraints
+        for cname, constraint in constraints.items():
             if force or any(cname not in slot.viold for slot in self.slots):
                 slot_viols = [int(bool(vx)) for vx in constraint(self)]
                 #log.debug(f'applying position constriant {cname}, got {slot_viols}')
@@ -50,13 +50,7 @@ class ParseSlot(Entity):
             ParseSlot: A shallow copy of the parse slot.
         """
         new = ParseSlot.__new__(ParseSlot)
-        new.__dict__.update(
-            {
-                k: v
-                for k, v in self.__dict__.items()
-                if not isinstance(getattr(self.__class__, k, None), cached_property)
-            }
-        )
+        new.__dict__.update(self._get_copy_state())
         new.viold = self.viold.copy()
         return new
 
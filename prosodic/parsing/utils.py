@@ -1,3 +1,4 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from ..imports import *
 
 class Bounding:
@@ -17,6 +18,232 @@ class Bounding:
     unequal: int = 3
 
 
+def bound_violsets(
+    viols: np.ndarray,
+    groups: np.ndarray,
+    nslots: np.ndarray,
+    is_complete: np.ndarray,
+    min_slots: int = 4,
+) -> Tuple[np.ndarray, List[List[int]]]:
+    """
+    Harmonic bounding over violation count vectors.
+
+    One parse bounds another when its counts are less than or equal on
+    every constraint and not identical. Parses can be compared when they
+    are in the same group (parses of the same words) and are either both
+    complete or have positioned the same number of slots; only parses with
+    at least `min_slots` slots positioned may bound others. A parse is
+    bounded when any parse it can be compared to bounds it.
+
+    Rather than comparing all pairs, each set of comparable parses is
+    visited in order of total violations while keeping its skyline: the
+    parses so far not bounded by another. A bounding parse always has a
+    smaller total, and any bounding parse is itself bounded by a skyline
+    parse, so checking a parse against the skyline is enough. This scales
+    with the size of the skyline rather than the number of parses.
+
+    Args:
+        viols (np.ndarray): (n_parses, n_constraints) violation counts.
+        groups (np.ndarray): Comparison group of each parse.
+        nslots (np.ndarray): Slots positioned in each parse.
+        is_complete (np.ndarray): Whether each parse is complete.
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+
+    Returns:
+        tuple: Boolean array of bounded parses, and for each parse the indices
+            of the skyline parses which bounded it.
+    """
+    viols = np.asarray(viols)
+    groups = np.asarray(groups)
+    nslots = np.asarray(nslots)
+    is_complete = np.asarray(is_complete, dtype=bool)
+    num = len(viols)
+    bounded = np.zeros(num, dtype=bool)
+    bounded_by = [[] for _ in range(num)]
+    if num < 2:
+        return bounded, bounded_by
+
+    totals = viols.sum(axis=1)
+    can_bound = nslots >= min_slots if min_slots else np.ones(num, dtype=bool)
+    comparison_sets = get_comparison_sets(groups, nslots, is_complete)
+
+    for members in comparison_sets.values():
+        if len(members) < 2:
+            continue
+        members = np.array(members)
+        members = members[np.argsort(totals[members], kind="stable")]
+        skyline = np.zeros(0, dtype=np.int64)
+        for _, tied in itertools.groupby(members, key=lambda i: totals[i]):
+            new_skyline = []
+            sky_viols = viols[skyline]
+            for i in tied:
+                # every skyline parse has a smaller total, so <= means bounding
+                bounds_i = (sky_viols <= viols[i]).all(axis=1)
+                if bounds_i.any():
+                    bounded[i] = True
+                    for j in sorted(skyline[bounds_i].tolist()):
+                        if j not in bounded_by[i]:
+                            bounded_by[i].append(j)
+                elif can_bound[i]:
+                    new_skyline.append(i)
+            # parses with equal totals cannot bound one another
+            skyline = np.concatenate([skyline, np.array(new_skyline, dtype=np.int64)])
+    return bounded, bounded_by
+
+
+def get_comparison_sets(
+    groups: np.ndarray, nslots: np.ndarray, is_complete: np.ndarray
+) -> Dict[tuple, List[int]]:
+    """
+    Sets of parses which can be compared for harmonic bounding.
+
+    Parses of the same group are compared when they have positioned the same
+    number of slots, and complete ones also with all other complete ones.
+
+    Args:
+        groups (np.ndarray): Comparison group of each parse.
+        nslots (np.ndarray): Slots positioned in each parse.
+        is_complete (np.ndarray): Whether each parse is complete.
+
+    Returns:
+        dict: Indices of the parses in each set, by (group, False, nslots) or
+            (group, True), in the order bound_violsets visits them.
+    """
+    comparison_sets = defaultdict(list)
+    for i in range(len(groups)):
+        comparison_sets[(int(groups[i]), False, int(nslots[i]))].append(i)
+        if is_complete[i]:
+            comparison_sets[(int(groups[i]), True)].append(i)
+    return comparison_sets
+
+
+def get_skyline(
+    members: Sequence[int], viols: np.ndarray, can_bound: np.ndarray
+) -> np.ndarray:
+    """
+    The skyline of a set of comparable parses (see bound_violsets).
+
+    Args:
+        members (list): Indices of the parses.
+        viols (np.ndarray): (n_parses, n_constraints) violation counts.
+        can_bound (np.ndarray): Whether each parse may bound others.
+
+    Returns:
+        np.ndarray: Indices of the members which may bound others and are
+            not bounded by another member, in order of total violations.
+    """
+    members = np.asarray(members, dtype=np.int64)
+    totals = viols[members].sum(axis=1)
+    members = members[np.argsort(totals, kind="stable")]
+    skyline = np.zeros(0, dtype=np.int64)
+    for _, tied in itertools.groupby(members, key=lambda i: viols[i].sum()):
+        sky_viols = viols[skyline]
+        new_skyline = [
+            i
+            for i in tied
+            if can_bound[i] and not (sky_viols <= viols[i]).all(axis=1).any()
+        ]
+        skyline = np.concatenate([skyline, np.array(new_skyline, dtype=np.int64)])
+    return skyline
+
+
+def bound_by_skylines(
+    viols: np.ndarray,
+    groups: np.ndarray,
+    nslots: np.ndarray,
+    is_complete: np.ndarray,
+    candidates: Dict[tuple, Sequence[int]],
+    min_slots: int = 4,
+    batch_size: int = 10000,
+) -> Tuple[np.ndarray, List[List[int]]]:
+    """
+    Harmonic bounding, as bound_violsets does it, from partial skylines.
+
+    A set's skyline is the skyline of the union of the skylines of any
+    partition of it. So parses can be bounded in chunks, e.g. in separate
+    processes, and merged here: only the members of the chunks' skylines
+    are compared to find each set's skyline, against which all of the
+    set's members are then checked at once.
+
+    Args:
+        viols (np.ndarray): (n_parses, n_constraints) violation counts.
+        groups (np.ndarray): Comparison group of each parse.
+        nslots (np.ndarray): Slots positioned in each parse.
+        is_complete (np.ndarray): Whether each parse is complete.
+        candidates (dict): For each comparison set key (see
+            get_comparison_sets), the indices of its members in the skyline
+            of their chunk.
+        min_slots (int): Minimum slots positioned before a parse may bound others.
+        batch_size (int): Number of parses checked against a skyline at once.
+
+    Returns:
+        tuple: Boolean array of bounded parses, and for each parse the indices
+            of the skyline parses which bounded it (as from bound_violsets).
+    """
+    viols = np.asarray(viols)
+    nslots = np.asarray(nslots)
+    num = len(viols)
+    bounded = np.zeros(num, dtype=bool)
+    bounded_by = [[] for _ in range(num)]
+    if num < 2:
+        return bounded, bounded_by
+
+    totals = viols.sum(axis=1)
+    can_bound = nslots >= min_slots if min_slots else np.ones(num, dtype=bool)
+    comparison_sets = get_comparison_sets(groups, nslots, is_complete)
+    for key, members in comparison_sets.items():
+        if len(members) < 2:
+            continue
+        skyline = get_skyline(candidates.get(key, []), viols, can_bound)
+        if not len(skyline):
+            continue
+        members = np.array(members)
+        for i in range(0, len(members), batch_size):
+            batch = members[i : i + batch_size]
+            # as in bound_violsets: skyline parses with a smaller total and
+            # less than or equal counts on every constraint bound a parse
+            bounds = (viols[skyline][None, :, :] <= viols[batch][:, None, :]).all(
+                axis=2
+            ) & (totals[skyline][None, :] < totals[batch][:, None])
+            for j, row in zip(batch, bounds):
+                if row.any():
+                    bounded[j] = True
+                    for si in sorted(skyline[row].tolist()):
+                        if si not in bounded_by[j]:
+                            bounded_by[j].append(si)
+    return bounded, bounded_by
+
+
+def select_best(
+    items: Sequence[Any],
+    k: int,
+    key: Callable[[Any], tuple],
+    prefix_key: Optional[Callable[[Any], tuple]] = None,
+) -> List[Any]:
+    """
+    The k smallest items by key, in the order of sorted(items, key=key)[:k].
+
+    The items are selected with a heap rather than sorted. If `prefix_key`
+    is given, it should be a cheap key ordering items as the first fields of
+    `key` do: the k-th smallest prefix bounds the prefixes of the k best
+    items, so the full key is only computed for items within that bound.
+
+    Args:
+        items (list): The items to select from.
+        k (int): Number of items to keep.
+        key (callable): Sort key of an item.
+        prefix_key (callable, optional): Cheap key agreeing with a prefix of `key`.
+
+    Returns:
+        list: The k best items, best first.
+    """
+    if prefix_key is not None and len(items) > k:
+        prefixes = [prefix_key(item) for item in items]
+        cutoff = heapq.nsmallest(k, prefixes)[-1]
+        items = [item for item, prefix in zip(items, prefixes) if prefix <= cutoff]
+    return heapq.nsmallest(k, items, key=key)
+
+
 def get_iambic_parse(nsyll: int) -> List[str]:
     """
     Generate an iambic parse for a given number of syllables.
@@ -59,6 +286,25 @@ def split_scansion(wsws: str) -> List[str]:
     return ["".join(pos) for pos in positions]
 
 
+@cache
+def get_position_types(nsyll: int, max_s: Optional[int] = METER_MAX_S, max_w: Optional[int] = METER_MAX_W) -> Tuple[str, ...]:
+    """Get the position types available to a line.
+
+    Args:
+        nsyll: Number of syllables (the limit when max_s or max_w is None).
+        max_s: Maximum number of syllables in a strong position.
+        max_w: Maximum number of syllables in a weak position.
+
+    Returns:
+        Weak position types by size, then strong ones, e.g. ("w", "ww", "s", "ss").
+    """
+    max_w = nsyll if max_w is None else max_w
+    max_s = nsyll if max_s is None else max_s
+    wtypes = ["w" * n for n in range(1, max_w + 1)]
+    stypes = ["s" * n for n in range(1, max_s + 1)]
+    return tuple(wtypes + stypes)
+
+
 @cache
 def get_possible_scansions(nsyll: int, max_s: Optional[int] = METER_MAX_S, max_w: Optional[int] = METER_MAX_W) -> List[List[str]]:
     """Get all possible scansions for a given number of syllables.
@@ -1,4 +1,5 @@
 from .. import *
 from .texts import *
+from .streams import *
 from .stanzas import *
 from .lines import *
\ No newline at end of file
@@ -0,0 +1,152 @@
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Union
+from ..imports import *
+from .texts import TextModel
+
+
+class TextStream:
+    """
+    A text read and parsed a chunk at a time, for files too large to load.
+
+    The file is read line by line into chunks of at most `chunk_lines` lines,
+    which end at a stanza break wherever there is one. Each chunk becomes a
+    TextModel only when it is reached, and is dropped once parsed, so memory
+    use depends on the chunk size rather than on the size of the file:
+
+        for parse_list in TextStream("poems.txt").parse_iter():
+            print(parse_list.best_parse)
+
+    Line and stanza numbers restart in each chunk's TextModel; `num_lines`
+    and `num_chunks` count those read so far.
+
+    Args:
+        fn (str or iterable): Path of the text file, or an iterable of its
+            lines (e.g. an open file).
+        lang (str): The language of the text.
+        chunk_lines (int): Maximum number of lines in a chunk.
+        prefetch (bool): Whether to look up each chunk's words at once
+            (see TextModel).
+    """
+
+    def __init__(
+        self,
+        fn: Union[str, Iterable[str]],
+        lang: str = DEFAULT_LANG,
+        chunk_lines: int = STREAM_CHUNK_LINES,
+        prefetch: bool = False,
+    ) -> None:
+        self.fn = fn
+        self.lang = lang
+        self.chunk_lines = chunk_lines
+        self.prefetch = prefetch
+        self.num_lines = 0
+        self.num_chunks = 0
+        self._mtr = None
+
+    def __repr__(self) -> str:
+        fn = self.fn if isinstance(self.fn, str) else type(self.fn).__name__
+        return f"TextStream({fn!r})"
+
+    def __iter__(self) -> Iterator[TextModel]:
+        return self.iter_texts()
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Read the lines of the text one at a time.
+
+        Yields:
+            str: Each line, with its line break.
+        """
+        if isinstance(self.fn, str):
+            with open(self.fn, encoding="utf-8") as f:
+                yield from f
+        else:
+            yield from self.fn
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        Read the text in chunks of at most `chunk_lines` lines.
+
+        A chunk ends at the last stanza break within it, unless it has none.
+
+        Yields:
+            str: The text of each chunk.
+        """
+        lines = []
+        last_break = None
+        for line in self.iter_lines():
+            if not line.strip():
+                if lines:
+                    last_break = len(lines)
+                continue
+            lines.append(line if line.endswith("\n") else line + "\n")
+            if len(lines) >= self.chunk_lines:
+                cut = last_break if last_break else len(lines)
+                yield self._get_chunk(lines[:cut])
+                lines = lines[cut:]
+                last_break = None
+            elif last_break == len(lines) - 1:
+                # keep the stanza break within the chunk
+                lines[-1] = "\n" + lines[-1]
+        if lines:
+            yield self._get_chunk(lines)
+
+    def _get_chunk(self, lines: List[str]) -> str:
+        self.num_lines += len(lines)
+        self.num_chunks += 1
+        return "".join(lines).strip()
+
+    def iter_texts(self) -> Iterator[TextModel]:
+        """
+        Build a TextModel for each chunk of the text in turn.
+
+        Yields:
+            TextModel: Each chunk's text.
+        """
+        for chunk in self.iter_chunks():
+            yield TextModel(chunk, lang=self.lang, prefetch=self.prefetch)
+
+    def get_meter(self, meter: Optional[Any] = None, **meter_kwargs: Any) -> Any:
+        """
+        Get or set the meter used for every chunk.
+
+        Args:
+            meter (Meter, optional): A meter to use.
+            **meter_kwargs: Arguments for a new Meter.
+
+        Returns:
+            Meter: The meter.
+        """
+        from ..parsing import Meter
+
+        if meter is not None:
+            self._mtr = meter
+        elif self._mtr is None or meter_kwargs:
+            self._mtr = Meter(**meter_kwargs)
+        return self._mtr
+
+    def parse_iter(
+        self,
+        combine_by: Literal["line", "sent"] = DEFAULT_COMBINE_BY,
+        num_proc: Optional[int] = None,
+        meter: Optional[Any] = None,
+        pool: Optional[Any] = None,
+        **meter_kwargs: Any,
+    ) -> Iterator[Any]:
+        """
+        Parse the text chunk by chunk, yielding parses as they are found.
+
+        Args:
+            combine_by (str): As in TextModel.parse_iter.
+            num_proc (int, optional): Number of processes to parse with.
+            meter (Meter, optional): The meter to parse with.
+            pool (ParserPool, optional): Pool of worker processes to parse with.
+            **meter_kwargs: Arguments for a new Meter.
+
+        Yields:
+            ParseList: The parses of each line (or other unit).
+        """
+        meter = self.get_meter(meter=meter, **meter_kwargs)
+        for text in self.iter_texts():
+            yield from text.parse_iter(
+                combine_by=combine_by, num_proc=num_proc, meter=meter, pool=pool
+            )
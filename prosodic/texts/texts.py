@@ -21,6 +21,7 @@ class TextModel(Entity):
         lang: Optional[str] = DEFAULT_LANG,
         parent: Optional[Entity] = None,
         tokens_df: Optional[pd.DataFrame] = None,
+        prefetch: bool = False,
         **kwargs,
     ):
         """
@@ -32,7 +33,11 @@ class TextModel(Entity):
             lang (Optional[str]): The language of the text. Default is DEFAULT_LANG.
             parent (Optional[Entity]): The parent entity. Default is None.
             children (Optional[list]): The list of child entities. Default is an empty list.
-            tokens_df (Optional[pd.DataFrame]): The token dataframe. Default is None.
+            tokens_df (Optional[pd.DataFrame]): The token dataframe, if the text
+                is already tokenized. Default is None.
+            prefetch (bool): Whether to look up the pronunciations of all the
+                text's words at once before building them (see
+                LanguageModel.prefetch). Default is False.
             use_cache (bool): Whether to use cache. Default is USE_CACHE.
             force (bool): Force parsing regardless of current state. Default is False.
             **kwargs: Additional keyword arguments.
@@ -65,17 +70,23 @@ class TextModel(Entity):
         self._parse_results = {}
 
         if not self.children:
+            # token dicts straight from the tokenizer, without a DataFrame
             if tokens_df is None:
-                tokens_df = tokenize_sentwords_df(txt)
-
-            for _, row in progress_bar(
-                list(tokens_df.iterrows()),
-                progress=len(tokens_df) >= 1000,
+                tokens = list(tokenize_sentwords_iter(txt))
+            else:
+                tokens = tokens_df.to_dict("records")
+            if prefetch:
+                from ..langs import Language
+                Language(self.lang).prefetch(token["txt"] for token in tokens)
+
+            for token in progress_bar(
+                tokens,
+                progress=len(tokens) >= 1000,
                 desc="Building long text",
             ):
-                self.children.append(WordToken(lang=self.lang, **row.to_dict()))
+                self.children.append(WordToken(lang=self.lang, **token))
         
-        # assign objects to global OBJECTS dict
+        # assign objects to the entity registry
         self.register_objects()
         
 
@@ -147,12 +158,14 @@ class TextModel(Entity):
         lim=None,
         force=False,
         meter=None,
+        pool=None,
         **meter_kwargs,
     ):
         """
         Parse the text.
 
         Args:
+            pool (ParserPool, optional): Pool of worker processes to parse with.
             **kwargs: Keyword arguments for parsing configuration.
 
         Returns:
@@ -168,6 +181,7 @@ class TextModel(Entity):
             force=force,
             meter=meter,
             lim=lim,
+            pool=pool,
             **meter_kwargs,
         )):
             if combine_by == self.prefix:
@@ -185,6 +199,7 @@ class TextModel(Entity):
         lim=None,
         force=False,
         meter=None,
+        pool=None,
         **meter_kwargs,
     ):
         from ..parsing.parselists import ParseList
@@ -194,14 +209,29 @@ class TextModel(Entity):
             combine_by = None
 
         parse_key = (meter.key, combine_by)
+        if parse_key not in self._parse_results:
+            # parses found with a meter differing only in its constraints
+            # are rescored for this one rather than parsed again; those of
+            # the other meter are kept too
+            for old_key, parse_lists in list(self._parse_results.items()):
+                if old_key[1] != combine_by:
+                    continue
+                old_meter = next((p.meter_obj for pl in parse_lists for p in pl), None)
+                if old_meter is not None and meter.can_rescore(old_meter):
+                    self._parse_results[parse_key] = [
+                        meter.rescore(parse_list) for parse_list in parse_lists
+                    ]
+                    break
         if parse_key in self._parse_results:
-            yield from self._parse_results[parse_key]
+            for parse_list in self._parse_results[parse_key]:
+                parse_list.parent._parses = parse_list
+                yield parse_list
         else:
             self._parse_results[parse_key] = []
             last_unit = None
             units = []
             for parse_list in meter.parse_text_iter(
-                self, num_proc=num_proc, force=force, lim=lim
+                self, num_proc=num_proc, force=force, lim=lim, pool=pool
             ):
                 # log.info(f'parse_list: {parse_list}')
                 # log.info(f'parsed_ent v1: {parse_list.parent}')
@@ -1,4 +1,8 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from collections.abc import MutableMapping
+import sqlite3
+from multiprocessing.util import Finalize
+from hashstash.engines.base import BaseHashStash
 from .imports import *
 
 class SimpleCache:
@@ -105,6 +109,234 @@ class SimpleCache:
         except KeyError:
             return default
 
+
+class SqliteStore(MutableMapping):
+    """A dictionary-like store of bytes or strings in one SQLite file.
+
+    Unlike SimpleCache, which writes a file per key, entries live in one
+    indexed table, so millions of them do not cost millions of inodes. The
+    database is opened in WAL mode and memory-mapped for reads. Writes are
+    held in memory and committed together, every `batch_size` writes and on
+    flush or close, so that concurrent writers (e.g. parsing workers) only
+    take the write lock briefly.
+
+    Attributes:
+        path (str): Path of the database file.
+        batch_size (int): Number of writes held before they are committed.
+    """
+
+    def __init__(self, path: str, batch_size: int = CACHE_DB_BATCH_SIZE) -> None:
+        """Initialize the SqliteStore.
+
+        Args:
+            path: Path of the database file.
+            batch_size: Number of writes held before they are committed.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._db = None
+        self._pending = {}
+        # pool workers exit without running atexit hooks, but do run these
+        Finalize(self, self.close, exitpriority=10)
+
+    def __repr__(self) -> str:
+        return f"SqliteStore({self.path!r})"
+
+    def __enter__(self):
+        """Enter the runtime context for the store."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context for the store, committing pending writes."""
+        self.flush()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            ensure_dir(self.path)
+            self._db = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(f"PRAGMA mmap_size={int(CACHE_DB_MMAP_SIZE)}")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key PRIMARY KEY, value) WITHOUT ROWID"
+            )
+            self._db.commit()
+        return self._db
+
+    def __setitem__(self, key: Union[str, bytes], value: Union[str, bytes]) -> None:
+        """Set an item in the store.
+
+        Args:
+            key: The key.
+            value: The value.
+        """
+        self._pending[key] = value
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def __getitem__(self, key: Union[str, bytes]) -> Union[str, bytes]:
+        """Get an item from the store.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The stored value.
+
+        Raises:
+            KeyError: If the key is not in the store.
+        """
+        if key in self._pending:
+            return self._pending[key]
+        row = self.db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if a key is in the store.
+
+        Args:
+            key: The key.
+
+        Returns:
+            True if the key is in the store, False otherwise.
+        """
+        if key in self._pending:
+            return True
+        row = self.db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __delitem__(self, key: Union[str, bytes]) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._pending.pop(key, None)
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.db.commit()
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        self.flush()
+        for (key,) in self.db.execute("SELECT key FROM entries").fetchall():
+            yield key
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def flush(self) -> None:
+        """Commit pending writes."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?)", pending.items()
+            )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._pending = {}
+        with self.db:
+            self.db.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+
+SQLITE_STORES = {}
+
+
+class SqliteHashStash(BaseHashStash):
+    """A HashStash engine keeping its entries in a SqliteStore.
+
+    Selected for the module-level `stash` by setting CACHE_ENGINE (or the
+    PROSODIC_CACHE_ENGINE environment variable) to "sqlitestore". Unlike
+    hashstash's own "sqlite" engine, it needs no packages beyond the standard
+    library, and batches its writes.
+    """
+
+    engine = "sqlitestore"
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "SqliteHashStash":
+        # HashStash's own from_dict would rebuild hashstash's sqlite engine
+        return SqliteHashStash(**{k: tuple(v) if isinstance(v, list) else v for k, v in d.items()})
+
+    def get_db(self) -> SqliteStore:
+        # one store per file, reopened after hashstash closes it: each store
+        # is kept until exit, to be closed then (see SqliteStore)
+        store = SQLITE_STORES.get(self.path)
+        if store is None:
+            ensure_dir(self.path)
+            store = SQLITE_STORES[self.path] = SqliteStore(self.path)
+        return store
+
+
+def get_stash(engine: str = CACHE_ENGINE, root_dir: str = PATH_HOME_DATA_CACHE) -> BaseHashStash:
+    """Get a stash for cached results, stored by an engine.
+
+    Args:
+        engine: "sqlitestore" for a single-file SqliteHashStash, or the name
+            of any HashStash engine ("pairtree", "lmdb", ...).
+        root_dir: Directory of the stash.
+
+    Returns:
+        The stash.
+    """
+    kwargs = dict(serializer="hashstash", compress=False, b64=True)
+    if engine == SqliteHashStash.engine:
+        return SqliteHashStash(root_dir, **kwargs)
+    return HashStash(root_dir, engine=engine, **kwargs)
+
+
+def migrate_stash(
+    dest_engine: str = "sqlitestore",
+    src_engine: str = "pairtree",
+    root_dir: str = PATH_HOME_DATA_CACHE,
+) -> Dict[str, int]:
+    """Copy every entry of a stash into a stash with another engine.
+
+    The stashes of cached function results within it (e.g. of
+    Meter.parse_wordspan) are copied too. Existing pairtree caches can so be
+    moved into a single-file cache, which is then used by setting
+    CACHE_ENGINE to the new engine.
+
+    Args:
+        dest_engine: Engine to copy the entries into.
+        src_engine: Engine of the stash to copy.
+        root_dir: Directory of both stashes.
+
+    Returns:
+        The number of stashes copied, of entries in them, and of entries
+        copied and failed.
+    """
+    src_folder = os.path.basename(get_stash(src_engine, root_dir).path_dirname)
+    dest_folder = os.path.basename(get_stash(dest_engine, root_dir).path_dirname)
+    counts = Counter()
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        if os.path.basename(dirpath) != src_folder:
+            continue
+        src = get_stash(src_engine, os.path.dirname(dirpath))
+        # don't walk the entries themselves, only the stashes nested beside them
+        dirnames[:] = [d for d in dirnames if d != src.filename]
+        rel_dir = os.path.relpath(os.path.dirname(dirpath), root_dir)
+        rel_dir = os.path.join(
+            *[dest_folder if part == src_folder else part for part in rel_dir.split(os.sep)]
+        )
+        dest = get_stash(dest_engine, os.path.normpath(os.path.join(root_dir, rel_dir)))
+        report = src.migrate(dest)
+        dest.close()
+        counts["stashes"] += 1
+        for key in ("total", "migrated", "failed"):
+            counts[key] += report[key]
+    return {key: counts[key] for key in ("stashes", "total", "migrated", "failed")}
+
+
 def retry_on_io_error(max_attempts: int = 3, delay: float = 0.1) -> Callable:
     """Decorator to retry a function on IOError.
 
@@ -13,6 +13,8 @@ app.config['SECRET_KEY'] = '0f m@ns dis0b3d13nc3'
 socketio = SocketIO(app, ping_timeout=60 * 5, ping_interval=5)
 
 linelim = 1000
+# pool of warm parsing workers, if main() is given num_proc
+parser_pool = None
 
 
 @cache(maxsize=10)
@@ -48,7 +50,7 @@ def parse(data):
     remainings = []
     rates = []
     numrows = 0
-    for i, line_parses in enumerate(t.parse_iter()):
+    for i, line_parses in enumerate(t.parse_iter(pool=parser_pool)):
         parsed_line = line_parses.line
         data_out_l = []
         for pi, parse in enumerate(parsed_line.parses.unbounded):
@@ -135,9 +137,13 @@ def index():
     )
 
 
-def main(port=None, host=None, debug=True, **kwargs):
+def main(port=None, host=None, debug=True, num_proc=None, **kwargs):
+    global parser_pool
     if port is None: port = 5111
     if debug: logmap.enable()
+    if num_proc:
+        # start the workers now, not in the event loop on the first parse
+        parser_pool = get_parser_pool(num_proc).start()
     # app.run(port=port, debug=debug, host=host, **kwargs)
     socketio.run(app, port=port, debug=debug, host=host, **kwargs)
 
@@ -1,3 +1,4 @@
+import pickle
 from ..imports import *
 
 RHYME_FEATS = {
@@ -36,7 +37,7 @@ class Phoneme(Entity):
             **kwargs: Arbitrary keyword arguments.
         """
         super().__init__(*args, **kwargs)
-        self._feats = get_phoneme_feats(self.txt)
+        self._feats = get_phoneme_table().get_feats(self.txt)
 
     @property
     def feats(self):
@@ -50,14 +51,7 @@ class Phoneme(Entity):
         Returns:
             Optional[bool]: True if vowel, False if consonant, None if undetermined.
         """
-        cons = self.feats.get('cons')
-        if cons is None:
-            return None
-        if cons > 0:
-            return False
-        if cons < 1:
-            return True
-        return None
+        return feats_is_vowel(self.feats)
     
     @property
     def is_cons(self):
@@ -155,6 +149,26 @@ def get_phoneme_feats(phon: str) -> Dict[str, Any]:
     return phond
 
 
+def feats_is_vowel(feats: Dict[str, Any]) -> Optional[bool]:
+    """
+    Determine from its features if a phoneme is a vowel.
+
+    Args:
+        feats (Dict[str, Any]): The features of the phoneme.
+
+    Returns:
+        Optional[bool]: True if vowel, False if consonant, None if undetermined.
+    """
+    cons = feats.get('cons')
+    if cons is None:
+        return None
+    if cons > 0:
+        return False
+    if cons < 1:
+        return True
+    return None
+
+
 FEATS_PANPHON: List[str] = [
     "num",
     "txt",
@@ -197,6 +211,163 @@ def get_ipa_info() -> Dict[str, Any]:
         return json.load(f)
 
 
+class PhonemeTable:
+    """
+    A precomputed segmentation of syllables into phonemes, with the features
+    of each phoneme.
+
+    Every syllable in a language's pronunciation dictionary is split into
+    phonemes once (by gruut), and the features of those phonemes and of the
+    phonemes in phonemes.json are looked up once (by panphon). The table is
+    stored in a compressed file under the data folder, and rebuilt when its
+    sources change, so that building a Syllable or Phoneme is a lookup.
+    Syllables and phonemes not in the table are segmented or looked up as
+    before, and kept in the table for the rest of the session.
+
+    Args:
+        lang (str): The language whose dictionary the table is built from.
+        path (str, optional): Path of the table's file.
+    """
+
+    def __init__(self, lang: str = DEFAULT_LANG, path: Optional[str] = None) -> None:
+        self.lang = lang
+        self.path = path if path else os.path.join(PATH_PHONEME_TABLES, f"{lang}.pkl.zlib")
+        self.segments = {}
+        self.feats = {}
+
+    def __repr__(self) -> str:
+        return f"PhonemeTable({self.lang!r}, segments={len(self.segments)}, phonemes={len(self.feats)})"
+
+    @cached_property
+    def source_paths(self) -> List[str]:
+        from ..langs import Language
+
+        return [
+            path
+            for path in [Language(self.lang).path_token2ipa, PATH_PHONS]
+            if path and os.path.exists(path)
+        ]
+
+    @property
+    def source_stamp(self) -> tuple:
+        """The version of the table and the size and time of its sources."""
+        return (PHONEME_TABLE_VERSION,) + tuple(
+            (os.path.basename(path), os.path.getsize(path), int(os.path.getmtime(path)))
+            for path in self.source_paths
+        )
+
+    def build(self) -> "PhonemeTable":
+        """
+        Segment every syllable in the language's dictionary and look up the
+        features of every phoneme.
+
+        Returns:
+            PhonemeTable: The table itself.
+        """
+        from ..langs import Language
+
+        for sylls_ipa_l in Language(self.lang).token2ipa.values():
+            for sylls_ipa in sylls_ipa_l:
+                for ipa in sylls_ipa:
+                    self.segment(ipa)
+        for phon in list(get_ipa_info()) + [
+            phon for phons in list(self.segments.values()) for phon in phons
+        ]:
+            self.get_feats(phon)
+        return self
+
+    def load(self) -> bool:
+        """
+        Load the table from its file, unless the file is missing or stale.
+
+        Returns:
+            bool: Whether the table was loaded.
+        """
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.loads(zlib.decompress(f.read()))
+        except Exception as e:
+            log.warning(f"Could not load phoneme table {self.path}: {e}")
+            return False
+        if data.get("source_stamp") != self.source_stamp:
+            return False
+        self.segments.update(data["segments"])
+        self.feats.update(data["feats"])
+        return True
+
+    def save(self) -> None:
+        """Save the table to its file."""
+        data = {
+            "source_stamp": self.source_stamp,
+            "segments": self.segments,
+            "feats": self.feats,
+        }
+        value = zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        try:
+            ensure_dir(self.path)
+            # write a temporary file first, so other processes never read half of it
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning(f"Could not save phoneme table {self.path}: {e}")
+
+    def segment(self, ipa: str) -> tuple:
+        """
+        Split a syllable's IPA into phonemes.
+
+        Args:
+            ipa (str): The syllable's IPA; stress marks and other symbols
+                which are not letters are ignored.
+
+        Returns:
+            tuple: The phonemes, as strings.
+        """
+        sipa = "".join(x for x in ipa if x.isalpha())
+        phons = self.segments.get(sipa)
+        if phons is None:
+            from gruut_ipa import Pronunciation
+
+            pron = Pronunciation.from_string(sipa)
+            phons = self.segments[sipa] = tuple(p.text for p in pron if p.text)
+        return phons
+
+    def get_feats(self, phon: str) -> Dict[str, Any]:
+        """
+        Get the features of a phoneme.
+
+        Args:
+            phon (str): The phoneme.
+
+        Returns:
+            Dict[str, Any]: The features of the phoneme (see get_phoneme_feats).
+        """
+        feats = self.feats.get(phon)
+        if feats is None:
+            feats = self.feats[phon] = get_phoneme_feats(phon)
+        return feats
+
+
+@cache
+def get_phoneme_table(lang: str = DEFAULT_LANG) -> PhonemeTable:
+    """
+    Get the phoneme table of a language, building and saving it if needed.
+
+    Args:
+        lang (str): The language.
+
+    Returns:
+        PhonemeTable: The table.
+    """
+    table = PhonemeTable(lang)
+    if not table.load():
+        table.build().save()
+    return table
+
+
 class PhonemeList(EntityList):
     """
     A list of phonemes with additional functionality.
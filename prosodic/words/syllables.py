@@ -5,6 +5,12 @@ class Syllable(Entity):
     """
     Represents a syllable in a word.
 
+    A syllable built from its IPA makes its Phoneme children only when they
+    are first needed (e.g. by `phonemes`, `onset`, `rime` or
+    `feature_profile`). Until then it keeps the phonemes as strings, from the
+    phoneme table, and its stress and weight, which the parser needs, are
+    worked out from those.
+
     Attributes:
         prefix (str): Prefix for the syllable.
         child_type (str): Type of child entities (Phoneme).
@@ -34,7 +40,9 @@ class Syllable(Entity):
             **kwargs: Additional keyword arguments.
         """
         assert ipa or children
-        
+
+        self._phons = None
+        self._is_heavy = None
         super().__init__(
             txt=txt,
             children=children,
@@ -44,19 +52,74 @@ class Syllable(Entity):
             ipa=ipa,
             **kwargs,
         )
-        
-        if self.ipa and not self.children:
-            from gruut_ipa import Pronunciation
+        if self.ipa and not self._children:
+            self._phons = get_phoneme_table().segment(self.ipa)
+            self._children = None
+        self._stress = get_syll_ipa_stress(self.ipa)
 
-            sipa = "".join(x for x in ipa if x.isalpha())
-            pron = Pronunciation.from_string(sipa)
-            phones = [p.text for p in pron if p.text]
-            for phon in phones:
-                self.children.append(Phoneme(txt=phon))
-        
+    @property
+    def children(self) -> PhonemeList:
+        """
+        Get the phonemes of the syllable, making them if not yet made.
 
-    def to_dict(self, incl_txt=True, incl_attrs=True, **kwargs) -> dict:
-        return super().to_dict(incl_txt=incl_txt, incl_attrs=incl_attrs, **kwargs)
+        Returns:
+            A PhonemeList of the syllable's phonemes.
+        """
+        if self._children is None:
+            self.materialize()
+        return self._children
+
+    @children.setter
+    def children(self, children: PhonemeList) -> None:
+        self._children = children
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the phonemes of this syllable have been made."""
+        return self.__dict__.get("_children") is not None
+
+    def materialize(self) -> None:
+        """Make the Phoneme children of a syllable built from its IPA."""
+        self._children = self.children_type(parent=self)
+        for phon in self._phons:
+            self._children.append(Phoneme(txt=phon))
+
+    def _iter_all(self, prune=None):
+        # don't make the phonemes of a syllable just to register them
+        if self.is_materialized:
+            yield from super()._iter_all(prune)
+        elif prune is None or not prune(self):
+            yield self
+
+    def copy(self) -> "Syllable":
+        if self.is_materialized:
+            return super().copy()
+        # no phonemes to copy yet: the copy makes its own when needed
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self._get_copy_state())
+        return new
+
+    @property
+    def phons_is_vowel(self) -> List[Optional[bool]]:
+        """
+        Check which of the syllable's phonemes are vowels.
+
+        Returns:
+            For each phoneme, True if vowel, False if consonant, None if undetermined.
+        """
+        if not self.is_materialized:
+            table = get_phoneme_table()
+            return [feats_is_vowel(table.get_feats(phon)) for phon in self._phons]
+        return [phon.is_vowel for phon in self._children]
+
+    def to_dict(self, incl_txt=True, incl_attrs=True, incl_children=True, **kwargs) -> dict:
+        # phonemes not yet made are left out: they are made again from the ipa
+        return super().to_dict(
+            incl_txt=incl_txt,
+            incl_attrs=incl_attrs,
+            incl_children=incl_children and self.is_materialized,
+            **kwargs,
+        )
 
     @property
     def stress(self) -> str:
@@ -66,7 +129,7 @@ class Syllable(Entity):
         Returns:
             The stress level as a string.
         """
-        return get_syll_ipa_stress(self.ipa)
+        return self._stress
 
     @property
     def weight(self):
@@ -107,7 +170,7 @@ class Syllable(Entity):
         Returns:
             True if the syllable ends with a consonant, False otherwise.
         """
-        return self.children[-1].is_cons
+        return not self.phons_is_vowel[-1]
 
     @property
     def num_vowels(self) -> int:
@@ -117,7 +180,7 @@ class Syllable(Entity):
         Returns:
             The number of vowels.
         """
-        return sum(1 for phon in self.children if phon.is_vowel)
+        return sum(1 for is_vowel in self.phons_is_vowel if is_vowel)
 
     @property
     def has_dipthong(self) -> bool:
@@ -147,7 +210,9 @@ class Syllable(Entity):
         Returns:
             True if the syllable is heavy, False otherwise.
         """
-        return bool(self.has_consonant_ending or self.has_dipthong)
+        if self._is_heavy is None:
+            self._is_heavy = bool(self.has_consonant_ending or self.has_dipthong)
+        return self._is_heavy
 
     @property
     def is_strong(self) -> Optional[bool]:
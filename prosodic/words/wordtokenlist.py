@@ -82,22 +82,26 @@ class WordTokenList(EntityList):
         return len([tok for tok in self if tok.has_wordform])
 
     def iter_wordtoken_matrix(self):
-        tokens_with_wf = [tok for tok in self if tok.has_wordform]
-        tokens_with_wfl = [tok.wordforms for tok in tokens_with_wf]
+        tokens_with_wfl = [tok.wordforms for tok in self if tok.has_wordform]
         # for every combination of wordforms...
-        for _i,wfl in enumerate(itertools.product(*tokens_with_wfl)):
-            # copy the wordtokenlist
-            wtl = self.copy()
-            # for each wordform in the combination, assign it to the corresponding wordtoken
-            for i, wf in enumerate(wfl):
-                # get the wordtoken that corresponds to the wordform
-                wtok = tokens_with_wf[i]
-                # get the wordtoken in the copy of the wordtokenlist that corresponds to the wordform
-                wtok_match = next(w for w in wtl if w.num == wtok.num)
-                # assign the wordform to the wordtoken
-                wtype = wtok_match.wordtype
-                wtype.children = WordFormList([wf], parent=wtype)
-            yield wtl
+        for wordform_idx in itertools.product(*[range(len(wfl)) for wfl in tokens_with_wfl]):
+            yield self.get_wordtoken_variant(wordform_idx)
+
+    def get_wordtoken_variant(self, wordform_idx):
+        """
+        Get one row of the wordtoken matrix.
+
+        Args:
+            wordform_idx (tuple): Index of the wordform to use for each
+                wordtoken with wordforms.
+
+        Returns:
+            WordTokenVariant: A view of this list with one wordform per wordtoken.
+        """
+        return WordTokenVariant(self, wordform_idx)
+
+    def materialize(self):
+        return self
 
     @cached_property
     def wordtoken_matrix(self):
@@ -284,3 +288,130 @@ class WordTokenList(EntityList):
         """
         return len(self.get_rhyming_lines(max_dist=RHYME_MAX_DIST))
 
+
+class WordTokenVariant:
+    """
+    One row of the wordtoken matrix, as a view of a wordtoken list.
+
+    Holds the wordtoken list and the index of the wordform chosen for each
+    of its wordtokens with wordforms, and resolves the chosen wordforms,
+    their syllables and the list's key from these without copying any
+    entities. Anything else, such as iterating over the wordtokens, goes
+    through a copy of the list in which each wordtoken has only its chosen
+    wordform, built the first time it is needed.
+
+    Args:
+        wordtokens (WordTokenList): The wordtoken list.
+        wordform_idx (tuple): Index of the wordform chosen for each wordtoken
+            with wordforms.
+    """
+
+    def __init__(self, wordtokens: WordTokenList, wordform_idx: Tuple[int, ...]):
+        self.wordtokens = wordtokens
+        self.wordform_idx = tuple(wordform_idx)
+        self._materialized = None
+        self._wordforms = None
+        self._sylls = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.wordtokens!r}, {self.wordform_idx})"
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.materialize(), attr)
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.wordtokens)
+
+    def __getitem__(self, i):
+        return self.materialize()[i]
+
+    @property
+    def key(self):
+        return self.wordtokens.key
+
+    @property
+    def path(self):
+        return self.wordtokens.path
+
+    @property
+    def prefix(self):
+        return self.wordtokens.prefix
+
+    @property
+    def parent(self):
+        return self.wordtokens.parent
+
+    @property
+    def txt(self):
+        return self.wordtokens.txt
+
+    @property
+    def token_wordforms(self) -> List[Optional["WordForm"]]:
+        """
+        The wordform chosen for each wordtoken, or None for those without any.
+        """
+        idx = iter(self.wordform_idx)
+        return [
+            tok.wordforms[next(idx)] if tok.has_wordform else None
+            for tok in self.wordtokens
+        ]
+
+    @property
+    def wordforms(self) -> "WordFormList":
+        if self._wordforms is None:
+            self._wordforms = WordFormList(
+                [wf for wf in self.token_wordforms if wf is not None]
+            )
+        return self._wordforms
+
+    @property
+    def sylls(self) -> "SyllableList":
+        if self._sylls is None:
+            self._sylls = SyllableList([syll for wf in self.wordforms for syll in wf])
+        return self._sylls
+
+    syllables = sylls
+
+    @property
+    def num_wordforms(self) -> int:
+        return len(self.wordform_idx)
+
+    @property
+    def num_with_forms(self) -> int:
+        return self.wordtokens.num_with_forms
+
+    @property
+    def num_sylls(self) -> int:
+        return len(self.sylls)
+
+    num_syllables = num_sylls
+
+    def materialize(self) -> WordTokenList:
+        """
+        Get a copy of the wordtoken list with only the chosen wordforms.
+
+        Returns:
+            WordTokenList: The copy, built on first call.
+        """
+        if self._materialized is None:
+            wtl = self.wordtokens.copy()
+            # drop lists and counts cached on the original, which span every wordform
+            for ent in [wtl, *wtl]:
+                for attr in ("wordtype", "wordforms", "sylls", "syllables", "phonemes"):
+                    ent.__dict__.pop(attr, None)
+                    ent.__dict__.pop(f"num_{attr}", None)
+            # the copy keeps the wordtokens in order: assign each its chosen wordform
+            for wtok, wf in zip(wtl, self.token_wordforms):
+                if wf is not None:
+                    wtype = wtok.wordtype
+                    wtype.children = WordFormList([wf], parent=wtype)
+            self._materialized = wtl
+        return self._materialized
+
+    def to_dict(self, *args, **kwargs) -> Dict[str, Any]:
+        return self.materialize().to_dict(*args, **kwargs)
@@ -45,26 +45,15 @@ class WordType(Entity):
         )
 
         if not self.children and not token_is_punc(tokenx):
-            from ..langs import get_word
-            sylls_ll, meta = get_word(
+            # copies of forms built once per word, see get_wordforms
+            for wordform in get_wordforms(
                 tokenx,
                 lang=lang,
                 force_unstress=force_unstress,
                 force_ambig_stress=force_ambig_stress,
-            )
-            # print([tokenx, sylls_ll, meta])
-            for wordform_sylls in sylls_ll:
-                wordform_sylls_ipa, wordform_sylls_text = zip(*wordform_sylls)
-                wordform = WordForm(
-                    txt=tokenx,
-                    sylls_ipa=tuple(wordform_sylls_ipa),
-                    sylls_text=tuple(wordform_sylls_text),
-                    **meta,
-                )
-                self.children.append(wordform)
-
+            ):
+                self.children.append(wordform.copy())
 
-        
 
     def to_dict(self, incl_attrs=True, incl_txt=True, **kwargs) -> dict:
         """
@@ -146,6 +135,53 @@ class WordTypeList(EntityList):
 
 
 
+@cache(maxsize=WORDFORMS_CACHE_SIZE)
+def get_wordforms(
+    tokenx: str,
+    lang: str = DEFAULT_LANG,
+    force_unstress: bool = None,
+    force_ambig_stress: bool = None,
+) -> Tuple["WordForm", ...]:
+    """
+    Get the forms of a word, with their syllables and phonemes.
+
+    Forms are built once per word, with its pronunciations from get_word,
+    and kept as templates: every WordType of the word takes copies of them
+    (see Entity.copy), rather than looking up its pronunciations and
+    syllabifying its IPA again. The templates themselves are never placed
+    in a text, and must not be changed.
+
+    Args:
+        tokenx (str): The word, as from get_wordform_token.
+        lang (str): The language of the word.
+        force_unstress (bool, optional): As in get_word.
+        force_ambig_stress (bool, optional): As in get_word.
+
+    Returns:
+        tuple: The forms of the word.
+    """
+    from ..langs import get_word
+
+    sylls_ll, meta = get_word(
+        tokenx,
+        lang=lang,
+        force_unstress=force_unstress,
+        force_ambig_stress=force_ambig_stress,
+    )
+    wordforms = []
+    for wordform_sylls in sylls_ll:
+        wordform_sylls_ipa, wordform_sylls_text = zip(*wordform_sylls)
+        wordforms.append(
+            WordForm(
+                txt=tokenx,
+                sylls_ipa=tuple(wordform_sylls_ipa),
+                sylls_text=tuple(wordform_sylls_text),
+                **meta,
+            )
+        )
+    return tuple(wordforms)
+
+
 def get_wordform_token(token):
     tokenx = token.strip()
     if any(x.isspace() for x in tokenx):
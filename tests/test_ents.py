@@ -238,4 +238,106 @@ def test_serialize():
             attrd2 = {k:v for k,v in obj2.attrs.items() if k not in {'num', 'txt'}}
             assert attrd1 == attrd2
 
-    do(t)
\ No newline at end of file
+    do(t)
+
+def test_registry():
+    import gc
+    from prosodic.ents import ObjectRegistry, get_registry, registry
+
+    t = TextModel('hello world')
+    assert get_registry()[t.key] is t
+    wt = t.wordtokens[0]
+    assert t.find(wt) is wt
+    assert Entity.from_dict(wt.to_dict(), use_registry=True) is wt
+
+    with registry(maxsize=5) as reg:
+        assert get_registry() is reg
+        t2 = TextModel('the quick brown fox jumps')
+        assert len(reg) == 5
+        assert reg.stats()['evictions'] > 0
+        assert t2.key not in reg
+
+        # evicted entities are still found, and registered again
+        wt2 = t2.wordtokens[0]
+        assert t2.find(wt2) is wt2
+        assert wt2.key in reg
+        stats = reg.stats()
+        assert stats['misses'] == 1 and stats['size'] == 5
+        assert t2.find(wt2) is wt2
+        assert reg.stats()['hits'] == 1
+    assert get_registry() is not reg
+
+    reg = ObjectRegistry(weak=True)
+    with registry(obj_registry=reg):
+        TextModel('hello there')
+    gc.collect()
+    assert len(reg) == 0
+
+    reg = ObjectRegistry(weak=False)
+    with registry(obj_registry=reg):
+        TextModel('hello there')
+    gc.collect()
+    assert len(reg) > 0
+
+
+def test_register_objects():
+    from prosodic.ents import ObjectRegistry, registry
+
+    reg = ObjectRegistry(weak=False)
+    with registry(obj_registry=reg):
+        t = TextModel('hello world')
+        size = len(reg)
+        assert all(reg.is_registered(obj) for obj in t.iter_all())
+        assert not list(t.iter_all(prune=reg.is_registered))
+
+        # registering again only visits new entities
+        parses = t.parse()
+        assert len(reg) > size
+        assert reg[parses.key] is parses
+        assert reg[parses[0].key] is parses[0]
+        size = len(reg)
+        t.register_objects()
+        parses.register_objects()
+        assert len(reg) == size
+
+        reg.clear()
+        t.register_objects()
+        assert reg[t.wordtokens[0].key] is t.wordtokens[0]
+
+
+def test_register_copy():
+    from prosodic.ents import ObjectRegistry, registry
+
+    reg = ObjectRegistry(weak=False)
+    with registry(obj_registry=reg):
+        t = TextModel('hello world')
+        new = t.children[0].copy()
+        copies = list(new.iter_all())
+        assert len(copies) > 1
+        # copies are not marked as registered, so registering them visits them all
+        assert not any(reg.is_registered(obj) for obj in copies)
+        reg.register(new)
+        for obj in copies:
+            assert reg.is_registered(obj)
+            assert reg[obj.path] is obj
+            assert t.find(obj) is obj
+
+
+def test_paths():
+    from prosodic.ents import get_registry
+
+    t = TextModel('hello world\n\ngoodbye moon')
+    for obj in t.iter_all():
+        assert obj.path == tuple(obj.key.split('.'))
+        assert '.'.join(obj.path) == obj.key
+    syll = t.syllables[0]
+    assert syll.path[: len(t.path)] == t.path
+    assert t.contains(syll)
+    assert t.lines[0].contains(syll)
+    assert not t.lines[1].contains(syll)
+    assert get_registry()[syll.path] is syll
+
+    # entities rebuilt from their keys have the same paths
+    wt = t.wordtokens[0]
+    wt2 = Entity.from_dict(wt.to_dict(), use_registry=False)
+    assert wt2 is not wt and wt2.path == wt.path
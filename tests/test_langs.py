@@ -87,6 +87,29 @@ def test_english():
         assert wtype.syllables
         assert wtype.phonemes
 
+def test_prefetch(monkeypatch):
+    lang = Language('en')
+    lang.tts_ipa_cache.clear()
+    tokens = ['Frumious', 'bandersnatch', 'frumious', 'the', ',', 'vorpal']
+    calls = []
+    phonemize = lang.phonemize
+    monkeypatch.setattr(lang, 'phonemize', lambda toks: calls.append(list(toks)) or phonemize(toks))
+
+    words = lang.prefetch(tokens)
+    assert list(words) == ['Frumious', 'bandersnatch', 'frumious', 'the', 'vorpal']
+    assert words['vorpal'] == get_word('vorpal')
+    # one call to espeak, for the distinct words not in the dictionary
+    assert calls == [['frumious', 'bandersnatch', 'vorpal']]
+    assert get_word.cache_info().maxsize == WORDS_CACHE_SIZE
+
+    # espeak's output is kept, so later calls don't send the words again
+    t = TextModel('The frumious Bandersnatch, the vorpal blade, the jabberwock', prefetch=True)
+    assert calls == [['frumious', 'bandersnatch', 'vorpal'], ['jabberwock']]
+    assert len(lang.tts_ipa_cache) <= WORDS_CACHE_SIZE
+    assert all(wtype.wordforms for wtype in t.wordtypes if not wtype.is_punc)
+    assert get_word('vorpal') == get_word('vorpal', lang='en')
+
+
 def test_stresses():
     # Test sylls_ipa_l_has_stress
     assert sylls_ipa_l_has_stress(["'maɪ"])
@@ -1,5 +1,6 @@
 import os
 import sys
+import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from prosodic.imports import *
@@ -7,6 +8,22 @@ from pandas.testing import assert_frame_equal
 
 disable_caching()
 
+HORSE = "A horse, a horse, my kingdom for a horse!"
+HORSE_AND_CURFEW = HORSE + "\nThe curfew tolls the knell of parting day"
+
+
+def parse_sig(parse_lists, bounded_by=False):
+    """What parses of each parse list are found, and how they score and rank."""
+    return [
+        [
+            (p.meter_str, p.stress_str, bool(p.is_bounded), round(p.score, 9), p.parse_rank)
+            + ((tuple(p.bounded_by),) if bounded_by else ())
+            for p in pl
+        ]
+        for pl in parse_lists
+    ]
+
+
 def test_feet():
     # iambic test
     tstr = "embrace " * 5
@@ -87,12 +104,74 @@ def test_exhaustive():
     # assert len(parses1.unbounded) < len(parses2.unbounded)
 
 
+def test_scansion_templates():
+    templates = get_scansion_templates(8, 2, 2)
+    scansions = get_possible_scansions(8, max_s=2, max_w=2)
+    assert len(templates) == len(scansions)
+    assert [
+        [templates.pos_types[ti] for ti in path] for path in templates.iter_paths()
+    ] == scansions
+    fn = os.path.join(PATH_HOME_DATA_SCANSIONS, "8_2_2.npz")
+    assert os.path.exists(fn)
+    assert (ScansionTemplates.load(fn).starts == templates.starts).all()
+
+    # every parse is built for the right number of syllables in each variant
+    wordtokens = TextModel(sonnet).line1.wordtokens
+    meter = Meter(exhaustive=True, parse_unit="line")
+    parses = meter.parse_wordspan(wordtokens)
+    assert len(parses) == sum(
+        len(meter.get_possible_scansions(len(wtl.sylls)))
+        for wtl in wordtokens.iter_wordtoken_matrix()
+    )
+    assert all(p.is_complete for p in parses)
+    assert parses.best_parse.meter_str == Meter(parse_unit="line").parse_wordspan(
+        wordtokens
+    ).best_parse.meter_str
+
+
 def test_bounding():
     s = "A horse a horse my kingdom for a horse"
     p1 = Parse(s, "ws" * 5)
     p2 = Parse(s, "sw" * 5)
     assert p1.bounds(p2)
 
+    # sort-and-sweep bounding agrees with comparing every pair
+    rng = np.random.default_rng(0)
+    viols = rng.integers(0, 3, size=(200, 4))
+    groups = rng.integers(0, 2, size=200)
+    nslots = rng.integers(2, 6, size=200)
+    is_complete = rng.random(200) < 0.5
+    is_bounded, bounded_by = bound_violsets(viols, groups, nslots, is_complete)
+    for i in range(len(viols)):
+        bounders = [
+            j
+            for j in range(len(viols))
+            if groups[j] == groups[i]
+            and nslots[j] >= 4
+            and (
+                (is_complete[i] and is_complete[j]) or nslots[i] == nslots[j]
+            )
+            and (viols[j] <= viols[i]).all()
+            and (viols[j] < viols[i]).any()
+        ]
+        assert is_bounded[i] == bool(bounders)
+        assert set(bounded_by[i]) <= set(bounders)
+
+    # bounding chunks separately and merging their skylines gives the same
+    can_bound = nslots >= 4
+    candidates = defaultdict(list)
+    for start in range(0, 200, 64):
+        stop = min(start + 64, 200)
+        chunk_sets = get_comparison_sets(
+            groups[start:stop], nslots[start:stop], is_complete[start:stop]
+        )
+        for key, members in chunk_sets.items():
+            skyline = get_skyline([start + i for i in members], viols, can_bound)
+            candidates[key].extend(skyline.tolist())
+    assert bound_by_skylines(viols, groups, nslots, is_complete, candidates)[1] == (
+        bounded_by
+    )
+
 
 def test_html():
     html = TextModel("disaster disaster disaster").line1.best_parse.to_html(
@@ -153,6 +232,62 @@ def test_constraints():
     assert len(l.parses.unbounded)
 
 
+def test_constraint_kernels():
+    @constraint(desc="No stressed final syllable on weak position", scope="position")
+    def w_stress_final(mpos):
+        if mpos.is_prom:
+            return [None] * len(mpos.slots)
+        return [None] * (len(mpos.slots) - 1) + [mpos.slots[-1].is_stressed]
+
+    assert "w_stress_final" in get_all_constraints()
+    assert w_stress_final.kernel is None
+    assert w_stress.kernel is not None
+
+    constraints = ["w_stress_final", "s_unstress", "unres_within"]
+    wordtokens_l = Meter().get_parse_units(TextModel(sonnet))[:4]
+
+    def get_parses(**kwargs):
+        meter = Meter(constraints=constraints, **kwargs)
+        return [
+            [(p.meter_str, p.is_bounded, p.score) for p in meter.parse_wordspan(wt)]
+            for wt in wordtokens_l
+        ]
+
+    parses = get_parses()
+    assert get_parses(algorithm="array") == parses
+
+    @w_stress_final.register_kernel
+    def w_stress_final_kernel(sylls, idx, is_prom):
+        out = np.zeros(idx.shape, dtype=bool)
+        if not is_prom:
+            out[:, -1] = sylls.is_stressed[idx[:, -1]]
+        return out
+
+    assert w_stress_final.kernel is w_stress_final_kernel
+    assert get_parses(algorithm="array") == parses
+
+
+def test_constraint_registry():
+    builtin = get_constraint("w_stress")
+    want = parse_sig(TextModel(HORSE).parse(num_proc=0))
+
+    @constraint(desc="Stressed syllables anywhere", scope="position")
+    def w_stress(mpos):
+        return [slot.is_stressed for slot in mpos.slots]
+
+    # a constraint defined elsewhere doesn't replace prosodic's own
+    assert w_stress.path.endswith("test_constraint_registry.<locals>.w_stress")
+    assert get_constraint("w_stress") is builtin
+    assert get_constraint(w_stress.path) is w_stress
+    assert get_all_constraints()["w_stress"] is builtin
+    assert get_all_constraints()[w_stress.path] is w_stress
+    assert parse_sig(TextModel(HORSE).parse(num_proc=0)) == want
+    assert Meter(constraints=[w_stress.path]).constraint_funcs == {w_stress.path: w_stress}
+
+    with pytest.raises(ValueError):
+        constraint(desc="", scope="position")(builtin.__wrapped__)
+
+
 def test_parse_iter():
     text = TextModel(sonnet)
     for parse_list in text.parse_iter():
@@ -167,3 +302,333 @@ def test_scansion():
     t = TextModel("into " * 2).line1
     t.parse(exhaustive=True, force=True)
     assert len(t.parses.data) > len(t.parses.scansions.data)
+
+
+def test_array_engine():
+    t = TextModel(sonnet)
+    m_fast = Meter()
+    m_array = Meter(algorithm="array")
+    # the search algorithm is not part of the key, unless it finds other parses
+    assert m_fast.key == m_array.key == Meter(algorithm="lattice").key
+    assert m_fast.key != Meter(algorithm="dp").key
+    assert m_fast.key != Meter(k=2).key
+    for wordtokens in m_fast.get_parse_units(t)[:6]:
+        parses1 = m_fast.parse_wordspan(wordtokens)
+        parses2 = m_array.parse_wordspan(wordtokens)
+        assert [
+            (p.meter_str, p.stress_str, p.is_bounded, p.score, p.parse_rank)
+            for p in parses1
+        ] == [
+            (p.meter_str, p.stress_str, p.is_bounded, p.score, p.parse_rank)
+            for p in parses2
+        ]
+
+
+def test_parse_records():
+    wordtokens = TextModel(sonnet).line1.wordtokens
+    parses = Meter(algorithm="array").parse_wordspan(wordtokens)
+    parse = parses.best_parse
+    assert isinstance(parse._record, ParseRecord)
+    assert not any(p.is_materialized for p in parses)
+
+    lazy = (parse.meter_str, parse.stress_str, parse.score, parse.violset)
+    assert parse._record.rank == parse.parse_rank == 1
+    assert len(parse.slots) == parse.num_slots_positioned
+    assert parse.is_materialized
+    for cname in ["violset", "score", "scores", "viold", "positions_viold"]:
+        parse.__dict__.pop(cname, None)
+    assert (parse.meter_str, parse.stress_str, parse.score, parse.violset) == lazy
+
+
+def test_dp_parsing():
+    line = TextModel(HORSE).line1
+    meter = Meter(parse_unit="line")
+    parses = []
+    for wtl in line.iter_wordtoken_matrix():
+        for scansion in meter.get_possible_scansions(len(wtl.sylls)):
+            parses.append(Parse(wtl, scansion, meter=meter))
+    parses = ParseList(parses, parent=line)
+    parses.bound()
+    parses.rank()
+
+    dp_parses = Meter(parse_unit="line", algorithm="dp").parse_wordspan(line)
+    assert sorted(p.meter_str for p in dp_parses.unbounded) == sorted(
+        p.meter_str for p in parses.unbounded
+    )
+    # bounded parses are kept and marked, as with the other algorithms
+    fast_parses = Meter(parse_unit="line").parse_wordspan(line)
+    assert 0 < dp_parses.num_bounded <= fast_parses.num_bounded
+    assert all(p.bounded_by for p in dp_parses if p.is_bounded)
+    assert dp_parses.best_parse.meter_str == parses.best_parse.meter_str
+
+    dp_parses = Meter(parse_unit="line", algorithm="dp", k=3).parse_wordspan(line)
+    assert len(dp_parses) == 3
+    assert dp_parses.best_parse.meter_str == parses.best_parse.meter_str
+
+
+def test_lattice_parsing():
+    t = TextModel(sonnet)
+    m_fast = Meter()
+    m_lattice = Meter(algorithm="lattice")
+    for wordtokens in m_fast.get_parse_units(t)[:6]:
+        parses1 = m_fast.parse_wordspan(wordtokens)
+        parses2 = m_lattice.parse_wordspan(wordtokens)
+        assert [
+            (p.meter_str, p.stress_str, p.is_bounded, p.score, p.parse_rank)
+            for p in parses1
+        ] == [
+            (p.meter_str, p.stress_str, p.is_bounded, p.score, p.parse_rank)
+            for p in parses2
+        ]
+
+    # every row of the wordtoken matrix is reachable through the lattice
+    wordtokens = TextModel(HORSE).line1.wordtokens
+    lattice = WordformLattice(wordtokens, Meter().get_pos_types(), {})
+    matrix = list(wordtokens.iter_wordtoken_matrix())
+    assert len(matrix) == np.prod([len(alts) for alts in lattice.alternatives])
+    wf_idx = tuple(len(alts) - 1 for alts in lattice.alternatives)
+    assert lattice.variant_index(wf_idx) == len(matrix) - 1
+    assert [wf.txt for wf in wordtokens.get_wordtoken_variant(wf_idx).wordforms] == [
+        wf.txt for wf in matrix[-1].wordforms
+    ]
+
+
+def test_top_k():
+    line = TextModel(HORSE).line1
+    for kwargs in [dict(), dict(algorithm="array"), dict(exhaustive=True)]:
+        parses = Meter(parse_unit="line", **kwargs).parse_wordspan(line)
+        best = Meter(parse_unit="line", k=3, **kwargs).parse_wordspan(line)
+        assert len(best) == 3
+        assert [(p.meter_str, p.score, p.parse_rank) for p in best] == [
+            (p.meter_str, p.score, p.parse_rank) for p in parses
+        ][:3]
+        assert best.num_pruned == len(parses) - 3
+        assert best.num_pruned_unbounded == parses.num_unbounded - best.num_unbounded
+
+    assert Meter(best_only=True).key == Meter(k=1).key
+    parses = TextModel(HORSE).parse(
+        best_only=True, num_proc=1
+    )
+    assert [len(pl) for pl in parses] == [1]
+
+
+def test_rescore():
+    from prosodic.ents import get_registry
+
+    txt = HORSE_AND_CURFEW
+    weights1 = {"w_peak": 1.0, "w_stress": 1.0, "s_unstress": 1.0, "unres_across": 1.0}
+    weights2 = {"w_peak": 3.0, "w_stress": 0.5, "s_unstress": 2.0, "unres_across": 1.0}
+    weights3 = {"w_peak": 1.0, "w_stress": 2.0, "foot_size": 1.0}
+
+    for kwargs, chain in [
+        (dict(), [weights1, weights2]),
+        (dict(algorithm="array"), [weights1, weights2]),
+        (dict(exhaustive=True), [weights1, weights3]),
+    ]:
+        t = TextModel(txt)
+        t.set_meter(constraints=chain[0], **kwargs)
+        parsed = list(t.parse_iter(combine_by="line", num_proc=1))
+        want = parse_sig(parsed)
+        t.set_meter(constraints=chain[1], **kwargs)
+        rescored = list(t.parse_iter(combine_by="line", num_proc=1))
+        assert len(t._parse_results) == 2
+        # rescored parses are registered under the new meter's keys
+        for parse_list in rescored:
+            assert get_registry()[parse_list.key] is parse_list
+            for parse in parse_list:
+                assert get_registry()[parse.key] is parse
+
+        # and the first meter's parses are kept as they were
+        t.set_meter(constraints=chain[0], **kwargs)
+        parsed_again = list(t.parse_iter(combine_by="line", num_proc=1))
+        assert all(pl1 is pl2 for pl1, pl2 in zip(parsed, parsed_again))
+        assert parse_sig(parsed_again) == want
+        assert t.line1._parses is parsed[0]
+
+        t2 = TextModel(txt)
+        t2.set_meter(constraints=chain[1], **kwargs)
+        assert parse_sig(rescored) == parse_sig(t2.parse_iter(combine_by="line", num_proc=1))
+
+    # different constraints change what a bounded search finds, so these re-parse
+    assert not Meter(constraints=weights1).can_rescore(Meter(constraints=weights3))
+    assert not Meter(constraints=weights1, k=3).can_rescore(Meter(constraints=weights2))
+
+
+def test_parse_tasks():
+    import pickle
+
+    txt = HORSE_AND_CURFEW
+    for kwargs in [dict(), dict(algorithm="dp"), dict(k=2)]:
+        meter = Meter(**kwargs)
+        parses1 = list(meter.parse_text_iter(TextModel(txt), num_proc=1))
+        parses2 = list(meter.parse_text_iter(TextModel(txt), num_proc=2, force=True))
+        assert parse_sig(parses1) == parse_sig(parses2)
+
+    # a task holds arrays only, and its records match a local search
+    meter = Meter()
+    wordtokens = TextModel(txt).line1.wordtokens
+    task = pickle.loads(pickle.dumps(meter.get_parse_task(wordtokens)))
+    assert all(sylls.units is None for sylls in task.sylls)
+    records, select, completed = parse_task(task)
+    assert completed and select is None
+    parses = meter.parses_from_records(
+        wordtokens, list(wordtokens.iter_wordtoken_matrix()), records
+    )
+    assert [p.meter_str for p in parses] == [
+        p.meter_str for p in meter.parse_wordspan(wordtokens)
+    ]
+    assert Meter(exhaustive=True).can_parse_tasks
+
+
+def test_parallel_exhaustive():
+    import prosodic.parsing.meter as meter_module
+
+    txt = HORSE_AND_CURFEW
+    meter = Meter(exhaustive=True)
+    wordtokens = TextModel(txt).line1.wordtokens
+    task = meter.get_parse_task(wordtokens)
+    records = parse_task(task)[0]
+
+    # a long line's templates are split into chunks, merged with the same bounding
+    chunk_size = meter_module.METER_TEMPLATE_CHUNK_SIZE
+    meter_module.METER_TEMPLATE_CHUNK_SIZE = 50
+    try:
+        chunks = meter.get_task_chunks(task)
+        assert len(chunks) > 1
+        merged = merge_template_chunks(
+            [parse_task(chunk) for chunk in chunks],
+            [sylls.num_sylls for sylls in task.sylls],
+            task.group_ids,
+        )
+        assert [
+            (rec.variant, rec.path, rec.is_bounded, rec.bounded_by, rec.score)
+            for rec in merged
+        ] == [
+            (rec.variant, rec.path, rec.is_bounded, rec.bounded_by, rec.score)
+            for rec in records
+        ]
+
+        parses1 = list(meter.parse_text_iter(TextModel(txt), num_proc=1))
+        parses2 = list(meter.parse_text_iter(TextModel(txt), num_proc=2, force=True))
+    finally:
+        meter_module.METER_TEMPLATE_CHUNK_SIZE = chunk_size
+    assert parse_sig(parses1, bounded_by=True) == parse_sig(parses2, bounded_by=True)
+
+
+def test_parser_pool():
+    import prosodic
+
+    txt = HORSE_AND_CURFEW
+    parses1 = TextModel(txt).parse(num_proc=1)
+    with prosodic.pool(2) as parser_pool:
+        assert parser_pool.is_running and get_active_pool() is parser_pool
+        assert list(parser_pool.map(abs, range(-40, 0))) == list(range(40, 0, -1))
+        # parses in the block go to the pool's warm workers
+        for _ in range(2):
+            parses2 = TextModel(txt).parse()
+            assert parse_sig(parses2) == parse_sig(parses1)
+    assert not parser_pool.is_running and get_active_pool() is None
+
+
+@constraint(desc="No stressed light syllable on weak position", scope="position")
+def w_stress_light(mpos):
+    if mpos.is_prom:
+        return [None] * len(mpos.slots)
+    return [slot.is_stressed and not slot.unit.is_heavy for slot in mpos.slots]
+
+
+@w_stress_light.register_kernel
+def _w_stress_light_kernel(sylls, idx, is_prom):
+    if is_prom:
+        return np.zeros(idx.shape, dtype=bool)
+    return sylls.is_stressed[idx] & ~sylls.is_heavy[idx]
+
+
+def test_parser_pool_constraints():
+    meter = Meter(constraints=["w_stress_light", "s_unstress", "unres_within"])
+    # workers rebuild the meter from its constraints' full names
+    assert meter.can_parse_tasks
+    assert list(meter.task_attrs["constraints"])[0] == w_stress_light.path
+    want = parse_sig(meter.parse_text(TextModel(HORSE_AND_CURFEW), num_proc=0))
+
+    @constraint(desc="No stressed syllable on weak position", scope="position")
+    def w_stress_here(mpos):
+        return w_stress(mpos)
+
+    w_stress_here.register_kernel(w_stress.kernel)
+    # workers can't import a constraint defined here, so it's parsed here
+    local_meter = Meter(constraints=[w_stress_here.path, "s_unstress"])
+    assert not local_meter.can_parse_tasks
+    local_want = parse_sig(local_meter.parse_text(TextModel(HORSE_AND_CURFEW), num_proc=0))
+
+    with ParserPool(2) as parser_pool:
+        parses = meter.parse_text(TextModel(HORSE_AND_CURFEW), pool=parser_pool)
+        assert parse_sig(parses) == want
+        parses = local_meter.parse_text(TextModel(HORSE_AND_CURFEW), pool=parser_pool)
+        assert parse_sig(parses) == local_want
+
+    with pytest.raises(ValueError):
+        Meter(constraints=["w_stress", "no_such_constraint"]).constraint_funcs
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    from prosodic.parsing.cache import PARSE_CACHES
+
+    parse_cache = ParseCache(str(tmp_path / "parses.sqlite"), max_bytes=None)
+    monkeypatch.setitem(PARSE_CACHES, PATH_PARSE_CACHE, parse_cache)
+    txt = "\n".join([HORSE] * 3)
+
+    want = parse_sig(TextModel(txt).parse())
+    assert not len(parse_cache)
+    with caching_enabled():
+        # repeated lineparts are searched once
+        assert parse_sig(TextModel(txt).parse()) == want
+        num = len(parse_cache)
+        assert num == 2 and parse_cache.misses == 2
+        # and every line is read back on the next run
+        assert parse_sig(TextModel(txt).parse()) == want
+        assert parse_cache.misses == num and len(parse_cache) == num
+
+    size = parse_cache.info()["num_bytes"]
+    assert size > 0
+    assert parse_cache.prune(size // 2) > 0
+    assert parse_cache.num_bytes <= size // 2 and len(parse_cache) < 2
+    parse_cache.clear()
+    assert not len(parse_cache)
+    parse_cache.close()
+
+
+def test_memo(monkeypatch):
+    import prosodic.parsing.meter as meter_module
+
+    txt = "\n".join([HORSE] * 3)
+
+    monkeypatch.setattr(meter_module, "METER_MEMOIZE", False)
+    t = TextModel(txt)
+    want = parse_sig(t.parse(num_proc=0), bounded_by=True)
+    assert t.get_meter().num_memoized == 0
+
+    monkeypatch.setattr(meter_module, "METER_MEMOIZE", True)
+    for algorithm in ["fast", "array"]:
+        t = TextModel(txt)
+        t.set_meter(algorithm=algorithm)
+        parses = t.parse(num_proc=0)
+        assert parse_sig(parses, bounded_by=True) == want
+        # 9 lineparts, of which 2 differ
+        assert t.get_meter().num_memoized == 7
+        # memoized parses are of their own wordtokens
+        for line, pl in zip(t.lines, parses):
+            for parse in pl:
+                assert all(line.contains(wt) for wt in parse.wordtokens)
+
+    # units which are not repeated are parsed without building their tasks
+    get_parse_task = Meter.get_parse_task
+    tasks = []
+    monkeypatch.setattr(
+        Meter,
+        "get_parse_task",
+        lambda self, wordtokens: tasks.append(wordtokens) or get_parse_task(self, wordtokens),
+    )
+    t = TextModel("The curfew tolls the knell of parting day\nThe lowing herd wind slowly o'er the lea")
+    t.parse(num_proc=0)
+    assert not tasks and t.get_meter().num_memoized == 0
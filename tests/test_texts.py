@@ -36,3 +36,36 @@ def test_Text():
     assert t.txt == "ererer e   e"
     assert len(t.wordtokens) == 3
     assert t.attrs
+
+
+def test_text_stream(tmp_path):
+    lines = [line.strip() for line in sonnet.strip().split("\n")]
+    txt = "\n".join(lines[:4]) + "\n\n" + "\n".join(lines[4:8]) + "\n\n\n" + "\n".join(lines[8:])
+    fn = tmp_path / "sonnet.txt"
+    fn.write_text(txt + "\n", encoding="utf-8")
+
+    stream = TextStream(str(fn), chunk_lines=6)
+    chunks = list(stream.iter_chunks())
+    # chunks end at stanza breaks where they can
+    assert chunks == ["\n".join(lines[:4]), "\n".join(lines[4:8]), "\n".join(lines[8:])]
+    assert stream.num_lines == 14 and stream.num_chunks == 3
+
+    # or else at the chunk size
+    with open(fn, encoding="utf-8") as f:
+        chunks = list(TextStream(f, chunk_lines=3).iter_chunks())
+    assert [chunk.count("\n") + 1 for chunk in chunks] == [3, 1, 3, 1, 3, 3]
+
+    got = [pl.best_parse.meter_str for pl in TextStream(str(fn), chunk_lines=6).parse_iter(num_proc=0)]
+    want = [pl.best_parse.meter_str for pl in TextModel(txt).parse_iter(num_proc=0)]
+    assert got == want
+
+
+def test_text_tokens_df():
+    txt = "From fairest creatures we desire increase,\nThat thereby beauty's rose might never die,"
+    t1 = TextModel(txt)
+    t2 = TextModel(txt, tokens_df=tokenize_sentwords_df(txt))
+    attrs = ["txt", "num", "para_num", "line_num", "sent_num", "sentpart_num", "linepart_num", "is_punc"]
+    assert [[getattr(w, a) for a in attrs] for w in t1.wordtokens] == [
+        [getattr(w, a) for a in attrs] for w in t2.wordtokens
+    ]
+    assert len(t1.lines) == len(t2.lines) == 2
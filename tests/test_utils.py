@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from prosodic.imports import *
+
+disable_caching()
+
+
+def test_sqlite_stash(tmp_path):
+    root_dir = str(tmp_path)
+
+    def double(x):
+        return x * 2
+
+    src = get_stash("pairtree", root_dir)
+    src["key"] = {"a": 1}
+    for x in range(5):
+        src.run(double, x)
+
+    report = migrate_stash("sqlitestore", "pairtree", root_dir)
+    assert report == {"stashes": 2, "total": 6, "migrated": 6, "failed": 0}
+
+    dest = get_stash("sqlitestore", root_dir)
+    assert isinstance(dest, SqliteHashStash)
+    # kept apart from hashstash's own "sqlite" engine
+    assert os.path.basename(dest.path_dirname).startswith("sqlitestore.")
+    assert os.path.isfile(dest.path)
+    assert dest["key"] == {"a": 1}
+    assert len(dest.sub_function_results(double)) == 5
+    assert dest.run(double, 3) == 6
+
+    # hashstash closes and reopens its connection, but the store is reused
+    store = dest.get_db()
+    dest.close()
+    assert store._db is None
+    assert dest["key"] == {"a": 1}
+    assert dest.get_db() is store and store._db is not None
+
+    # writes are batched, but visible at once and committed on flush
+    store = SqliteStore(str(tmp_path / "store.db"), batch_size=10)
+    for x in range(15):
+        store[f"k{x}"] = str(x)
+    assert len(store._pending) == 5
+    assert store["k14"] == "14" and "k3" in store
+    store.close()
+    assert len(SqliteStore(store.path)) == 15
@@ -17,6 +17,23 @@ def test_WordFormList():
     assert len(l.wordtoken_matrix)==2
     assert l.wordtoken_matrix[0].sylls[0].is_stressed is False
 
+def test_wordtoken_variant():
+    l = TextModel('in door').line1
+    wtl = l.wordtoken_matrix[1]
+    assert isinstance(wtl, WordTokenVariant)
+    assert wtl.wordtokens is l and wtl.key == l.key
+    assert wtl._materialized is None
+    assert wtl.num_wordforms == wtl.num_with_forms == 2
+    assert [wf.txt for wf in wtl.wordforms] == [wf.txt for wf in wtl.token_wordforms]
+    assert wtl._materialized is None
+
+    # the materialized copy has only the chosen wordforms
+    wtl_copy = wtl.materialize()
+    assert wtl_copy is not l and wtl.materialize() is wtl_copy
+    assert [wf.txt for wf in wtl_copy.wordforms] == [wf.txt for wf in wtl.wordforms]
+    assert [s.txt for s in wtl_copy.sylls] == [s.txt for s in wtl.sylls]
+    assert wtl[0].num_wordforms == 1
+
 def test_word():
     try:
         TextModel('szia',lang='hu').wordtype1
@@ -27,4 +44,77 @@ def test_word():
     word = TextModel('hello').wordtype1
     assert word.num_sylls == 2
     assert word.num_stressed_sylls == 1
-    
\ No newline at end of file
+    
+
+def test_wordforms_shared():
+    t = TextModel('the rose, the rose')
+    wtype1, wtype2 = t.wordtokens[1].wordtype, t.wordtokens[4].wordtype
+    templates = get_wordforms('rose')
+    # each word gets its own copies of the word's forms
+    assert len(wtype1.children) == len(wtype2.children) == len(templates)
+    for wf1, wf2, template in zip(wtype1.children, wtype2.children, templates):
+        assert wf1 is not wf2 and wf1 is not template
+        assert wf1.ipa == wf2.ipa == template.ipa
+        assert wf1.children[0] is not wf2.children[0]
+        assert wf1.children[0].wordtoken is t.wordtokens[1]
+        assert wf2.children[0].children[0].wordtoken is t.wordtokens[4]
+        assert template.parent is None
+    assert wtype1.children[0].key != wtype2.children[0].key
+
+
+def test_phoneme_table(tmp_path):
+    from gruut_ipa import Pronunciation
+
+    path = str(tmp_path / 'en.pkl.zlib')
+    table = PhonemeTable(path=path).build()
+    sipa = "'roʊz"
+    assert sipa.strip("'") in table.segments
+    phons = tuple(p.text for p in Pronunciation.from_string('roʊz') if p.text)
+    assert table.segment(sipa) == phons
+    assert table.get_feats(phons[0]) == get_phoneme_feats(phons[0])
+    table.save()
+
+    table2 = PhonemeTable(path=path)
+    assert table2.load()
+    assert table2.segments == table.segments
+    assert table2.feats == table.feats
+
+    # a stale table is not loaded
+    table2.segments.clear()
+    data = pickle.loads(zlib.decompress(open(path, 'rb').read()))
+    data['source_stamp'] = (-1,)
+    with open(path, 'wb') as f:
+        f.write(zlib.compress(pickle.dumps(data)))
+    assert not table2.load()
+    assert not table2.segments
+
+    syll = Syllable(ipa="'roʊz")
+    assert tuple(phon.txt for phon in syll.children) == phons
+
+
+def test_syllable_lazy_phonemes():
+    t = TextModel('the rose is red')
+    t.parse(num_proc=0)
+    sylls = [syll for wt in t.wordtokens for wf in wt.wordtype.children for syll in wf.children]
+    assert sylls
+    # building and parsing the text doesn't make any phonemes
+    assert not any(syll.is_materialized for syll in sylls)
+
+    syll = t.wordtokens[1].wordtype.children[0].children[0]
+    assert syll.is_heavy and syll.is_stressed
+    assert not syll.is_materialized
+    d = syll.to_dict()
+    assert 'children' not in d['Syllable']
+    syll2 = syll.copy()
+
+    phons = syll.phonemes
+    assert syll.is_materialized
+    assert tuple(phon.txt for phon in phons) == get_phoneme_table().segment(syll.ipa)
+    assert all(phon.syllable is syll for phon in phons)
+    assert syll.is_heavy == Syllable(children=phons.copy(), ipa=syll.ipa).is_heavy
+    assert [phon.txt for phon in syll.rime] == [phon.txt for phon in phons[1:]]
+
+    # copies made before the phonemes make their own
+    assert not syll2.is_materialized
+    assert syll2.children is not syll.children
+    assert [phon.txt for phon in syll2.children] == [phon.txt for phon in phons]